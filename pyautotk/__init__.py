@@ -1,5 +1,23 @@
-from pyautotk.core.config_loader import config  # noqa F401
-from pyautotk.core.browser_controller import BrowserController  # noqa F401
-from pyautotk.elements.widget import Widget  # noqa F401
-from pyautotk.elements.helpers.session_helpers import browser_session  # noqa F401
-from pyautotk.core.exceptions import ElementNotVisibleException  # noqa F401
+from typing import TYPE_CHECKING
+
+from pyautotk.core.lazy_imports import lazy_attributes
+
+# Public names are imported on first access, so `import pyautotk` does not load Selenium until a
+# BrowserController is actually needed.
+_LAZY_ATTRIBUTES = {
+    "config": "pyautotk.core.config_loader",
+    "BrowserController": "pyautotk.core.browser_controller",
+    "Widget": "pyautotk.elements.widget",
+    "browser_session": "pyautotk.elements.helpers.session_helpers",
+    "ElementNotVisibleException": "pyautotk.core.exceptions",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from pyautotk.core.config_loader import config  # noqa F401
+    from pyautotk.core.browser_controller import BrowserController  # noqa F401
+    from pyautotk.elements.widget import Widget  # noqa F401
+    from pyautotk.elements.helpers.session_helpers import browser_session  # noqa F401
+    from pyautotk.core.exceptions import ElementNotVisibleException  # noqa F401
@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Entry points whose import cost is tracked; only the last one is expected to load Selenium.
+IMPORT_TARGETS = (
+    "pyautotk",
+    "pyautotk.core.config_loader",
+    "pyautotk.elements.widget",
+    "pyautotk.elements.helpers.session_helpers",
+    "pyautotk.core.browser_controller",
+)
+
+_MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "selenium": "selenium" in sys.modules}}))
+"""
+
+
+@dataclass
+class ImportTimeResult:
+    """
+    Cold import cost of one module, measured in fresh interpreters.
+    """
+
+    module: str
+    best_time: float
+    loads_selenium: bool
+
+
+def measure_import_time(module: str, runs: int = 5) -> ImportTimeResult:
+    """
+    Imports the module in `runs` fresh interpreters and keeps the fastest run.
+
+    Args:
+        module (str): The dotted module name.
+        runs (int): Number of interpreters to start. Default is 5.
+
+    Returns:
+        ImportTimeResult: The best import time and whether Selenium was loaded.
+    """
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _MEASURE_SCRIPT.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return ImportTimeResult(
+        module=module,
+        best_time=min(sample["seconds"] for sample in samples),
+        loads_selenium=samples[-1]["selenium"],
+    )
+
+
+def run_import_benchmarks(
+    modules: Optional[List[str]] = None, runs: int = 5
+) -> List[ImportTimeResult]:
+    """
+    Measures the import time of every module in `IMPORT_TARGETS` (or `modules`).
+
+    Returns:
+        List[ImportTimeResult]: One result per module.
+    """
+    return [measure_import_time(module, runs) for module in modules or IMPORT_TARGETS]
+
+
+def format_import_results(results: List[ImportTimeResult]) -> str:
+    """Formats the results as a text table."""
+    lines = [f"{'module':<45} {'import ms':>10} {'selenium':>9}"]
+    for result in results:
+        lines.append(
+            f"{result.module:<45} {result.best_time * 1000:>10.1f} {str(result.loads_selenium):>9}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,274 @@
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyautotk.core.action_batch import BATCH_SCRIPT
+from pyautotk.core.browser_controller import (
+    EXTRACT_TABLE_SCRIPT,
+    MUTATION_WAIT_SCRIPT,
+    PAGE_SETTLE_SCRIPT,
+    PROPERTIES_SNAPSHOT_SCRIPT,
+    BrowserController,
+)
+
+# W3C key identifying an element reference in WebDriver payloads.
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Number of rows reported for every locator by the extraction scripts.
+DEFAULT_TABLE_ROWS = 50
+
+
+class _MockPage:
+    """
+    Minimal stand-in for a page: every locator matches exactly one element, whose tag name is guessed from the
+    locator text (so `Select` accepts dropdowns), and element state is kept only for values written through it.
+    """
+
+    def __init__(self, table_rows: int) -> None:
+        self.table_rows = table_rows
+        self.url = "about:blank"
+        self.handles = ["main"]
+        self._ids: Dict[Tuple[Optional[str], str], str] = {}
+        self._elements: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def element(self, locator: str, parent: Optional[str] = None) -> Dict[str, str]:
+        with self._lock:
+            key = (parent, locator)
+            element_id = self._ids.get(key)
+            if element_id is None:
+                element_id = self._ids[key] = uuid.uuid4().hex
+                lowered = locator.lower()
+                tag = (
+                    "select" if "select" in lowered else "option" if "option" in lowered else "div"
+                )
+                self._elements[element_id] = {"tag": tag, "locator": locator, "attributes": {}}
+        return {ELEMENT_KEY: element_id}
+
+    def state(self, element_id: str) -> Dict[str, Any]:
+        return self._elements.setdefault(
+            element_id, {"tag": "div", "locator": "", "attributes": {}}
+        )
+
+    def properties(self, reference: Dict[str, str], attribute_names: List[str]) -> Dict[str, Any]:
+        attributes = self.state(reference[ELEMENT_KEY])["attributes"]
+        return {
+            "text": "Mock text",
+            "tag_name": self.state(reference[ELEMENT_KEY])["tag"],
+            "attributes": {
+                name: attributes[name] for name in attribute_names if name in attributes
+            },
+            "location": {"x": 0, "y": 0},
+            "size": {"height": 20, "width": 100},
+            "displayed": True,
+            "enabled": True,
+        }
+
+    def run_script(self, script: str, args: List[Any]) -> Any:
+        """Answers the framework scripts with well-formed results; any other script returns None."""
+        if script == MUTATION_WAIT_SCRIPT:
+            element = self.element(args[0])
+            return [element] if args[1] == "all" else element
+        if script == PROPERTIES_SNAPSHOT_SCRIPT:
+            return [self.properties(reference, args[1]) for reference in args[0]]
+        if script == EXTRACT_TABLE_SCRIPT:
+            names = (["text"] if args[2].get("text") else []) + list(args[1])
+            if args[2].get("rect"):
+                names += ["x", "y", "width", "height"]
+            if args[2].get("displayed"):
+                names.append("displayed")
+            return {name: [f"{name}-{row}" for row in range(self.table_rows)] for name in names}
+        if script == PAGE_SETTLE_SCRIPT:
+            return True
+        if script == BATCH_SCRIPT:
+            return [{"status": "ok", "error": None} for _ in args[0]]
+        if "/* isDisplayed */" in script:
+            return True
+        if "/* getAttribute */" in script:
+            return self.state(args[0][ELEMENT_KEY])["attributes"].get(args[1])
+        if "arguments[0].value = arguments[1]" in script and len(args) > 1:
+            self.state(args[0][ELEMENT_KEY])["attributes"]["value"] = args[1]
+        return None
+
+
+class MockWebDriverServer:
+    """
+    In-process HTTP server speaking enough of the W3C WebDriver protocol to drive a BrowserController without a
+    browser. Each command can be delayed by an artificial `latency` to emulate a real driver round trip, and
+    every command is counted so the framework overhead of a flow can be measured.
+    """
+
+    def __init__(self, latency: float = 0.0, table_rows: int = DEFAULT_TABLE_ROWS) -> None:
+        """
+        Initializes the server; call `start` (or use it as a context manager) to begin serving.
+
+        Args:
+            latency (float): Seconds added to every command. Default is 0.
+            table_rows (int): Number of rows returned for every bulk extraction. Default is 50.
+        """
+        self.latency = latency
+        self.page = _MockPage(table_rows)
+        self.commands: Dict[str, int] = {}
+        self._counter_lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def round_trips(self) -> int:
+        with self._counter_lock:
+            return sum(self.commands.values())
+
+    def reset_counters(self) -> None:
+        with self._counter_lock:
+            self.commands.clear()
+
+    def start(self) -> "MockWebDriverServer":
+        server = self
+
+        class Handler(_WebDriverHandler):
+            mock = server
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="MockWebDriverServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockWebDriverServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.stop()
+
+    def count(self, command: str) -> None:
+        with self._counter_lock:
+            self.commands[command] = self.commands.get(command, 0) + 1
+
+    def dispatch(self, method: str, path: str, body: Dict[str, Any]) -> Any:
+        """Returns the `value` of the response to a WebDriver command."""
+        if method == "POST" and path == "/session":
+            return {
+                "sessionId": uuid.uuid4().hex,
+                "capabilities": {"browserName": "chrome", "browserVersion": "mock"},
+            }
+
+        match = re.match(r"^/session/[^/]+(?P<command>/.*)?$", path)
+        command = (match and match.group("command")) or ""
+        page = self.page
+
+        if command in ("/element", "/elements") or re.match(r"^/element/[^/]+/elements?$", command):
+            parent = command.split("/")[2] if command.count("/") > 1 else None
+            element = page.element(body.get("value", ""), parent)
+            return [element] if command.endswith("elements") else element
+        if command in ("/execute/sync", "/execute/async"):
+            return page.run_script(body.get("script", ""), body.get("args", []))
+        if command == "/url":
+            if method == "POST":
+                page.url = body.get("url", page.url)
+            return page.url
+        if command == "/window":
+            return page.handles[0] if method == "GET" else page.handles
+        if command == "/window/handles":
+            return page.handles
+        if command == "/alert/text":
+            return "Mock alert"
+        if command == "/se/file":
+            return "/tmp/mock-upload"
+
+        element_command = re.match(
+            r"^/element/(?P<id>[^/]+)/(?P<name>[a-z]+)(?:/(?P<arg>.+))?$", command
+        )
+        if element_command:
+            state = page.state(element_command.group("id"))
+            name = element_command.group("name")
+            if name == "name":
+                return state["tag"]
+            if name == "text":
+                return "Mock text"
+            if name in ("enabled", "displayed"):
+                return True
+            if name == "selected":
+                return False
+            if name in ("attribute", "property"):
+                return state["attributes"].get(element_command.group("arg"))
+            if name == "rect":
+                return {"x": 0, "y": 0, "width": 100, "height": 20}
+            if name == "value":
+                state["attributes"]["value"] = body.get("text", "")
+        return None
+
+
+class _WebDriverHandler(BaseHTTPRequestHandler):
+    """Serves WebDriver commands with keep-alive connections, like a real driver process."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    mock: MockWebDriverServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = json.loads(raw) if raw else {}
+        path = self.path.split("?", 1)[0]
+        self.mock.count(f"{method} {re.sub(r'/[0-9a-f]{32}', '/<id>', path)}")
+        if self.mock.latency:
+            time.sleep(self.mock.latency)
+
+        payload = json.dumps({"value": self.mock.dispatch(method, path, body)}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+
+class MockBrowserController(BrowserController):
+    """
+    BrowserController connected to a MockWebDriverServer instead of a local browser.
+    """
+
+    def __init__(self, server: MockWebDriverServer, cache_elements: bool = False) -> None:
+        """
+        Initializes the controller against a running mock server.
+
+        Args:
+            server (MockWebDriverServer): The server to connect to.
+            cache_elements (bool): Whether to enable the element cache. Default is False.
+        """
+        self.server = server
+        super().__init__("chrome", maximize=False, headless=True, cache_elements=cache_elements)
+
+    def _initialize_driver(self) -> WebDriver:
+        return webdriver.Remote(command_executor=self.server.url, options=webdriver.ChromeOptions())
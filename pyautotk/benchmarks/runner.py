@@ -0,0 +1,155 @@
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, List, Optional
+
+from pyautotk.benchmarks.import_time import format_import_results, run_import_benchmarks
+from pyautotk.benchmarks.mock_webdriver import MockBrowserController, MockWebDriverServer
+from pyautotk.benchmarks.scenarios import SCENARIOS
+from pyautotk.core.config_loader import config
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Per-iteration measurements of one scenario run against the mock WebDriver server.
+    """
+
+    scenario: str
+    iterations: int
+    latency: float
+    round_trips: float
+    wall_time: float
+    allocated_kib: float
+    allocated_blocks: int
+    peak_kib: float
+
+
+def run_scenario(
+    name: str, scenario: Callable[[Any], None], controller: MockBrowserController, iterations: int
+) -> BenchmarkResult:
+    """
+    Runs a scenario once to warm up, `iterations` times for timing and round trips, and once more under
+    tracemalloc for allocations (kept separate so tracing does not inflate the timings).
+    """
+    server = controller.server
+    scenario(controller)
+
+    server.reset_counters()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        scenario(controller)
+    wall_time = (time.perf_counter() - start) / iterations
+    round_trips = server.round_trips / iterations
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        scenario(controller)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocations = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+
+    return BenchmarkResult(
+        scenario=name,
+        iterations=iterations,
+        latency=server.latency,
+        round_trips=round_trips,
+        wall_time=wall_time,
+        allocated_kib=sum(stat.size_diff for stat in allocations) / 1024,
+        allocated_blocks=sum(stat.count_diff for stat in allocations),
+        peak_kib=peak / 1024,
+    )
+
+
+def run_benchmarks(
+    scenarios: Optional[List[str]] = None, iterations: int = 20, latency: float = 0.0
+) -> List[BenchmarkResult]:
+    """
+    Runs the selected scenarios against a fresh mock WebDriver server.
+
+    Args:
+        scenarios (Optional[List[str]]): Names from `SCENARIOS` to run. Default is all of them.
+        iterations (int): Timed iterations per scenario. Default is 20.
+        latency (float): Artificial latency in seconds added to every WebDriver command. Default is 0.
+
+    Returns:
+        List[BenchmarkResult]: One result per scenario.
+    """
+    names = scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmark scenarios: {unknown}. Available: {', '.join(SCENARIOS)}"
+        )
+
+    results = []
+    with MockWebDriverServer(latency=latency) as server:
+        controller = MockBrowserController(server)
+        try:
+            controller.open_url("http://localhost:8080/")
+            for name in names:
+                results.append(run_scenario(name, SCENARIOS[name], controller, iterations))
+        finally:
+            controller.close_browser()
+    return results
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Formats the results as a text table."""
+    lines = [
+        f"{'scenario':<30} {'trips':>7} {'wall ms':>9} {'alloc KiB':>10} {'blocks':>8} {'peak KiB':>9}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.scenario:<30} {result.round_trips:>7.1f} {result.wall_time * 1000:>9.2f} "
+            f"{result.allocated_kib:>10.1f} {result.allocated_blocks:>8} {result.peak_kib:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyautotk.benchmarks",
+        description="Runs PyAutoTk flows against an in-process mock WebDriver server.",
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help=f"Scenarios to run (default: all). Available: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per scenario.")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Artificial latency per WebDriver command, in seconds.",
+    )
+    parser.add_argument(
+        "--json", dest="json_path", help="Also write the results to this JSON file."
+    )
+    parser.add_argument(
+        "--log-level", default="WARNING", help="Log level of the framework while benchmarking."
+    )
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="Measure the import time of the package entry points instead.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        print(format_import_results(run_import_benchmarks()))
+        return
+
+    config.log_level = args.log_level
+    results = run_benchmarks(args.scenarios, args.iterations, args.latency)
+    print(format_results(results))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as output:
+            json.dump([asdict(result) for result in results], output, indent=2)
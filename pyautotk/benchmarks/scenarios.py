@@ -0,0 +1,89 @@
+from typing import Any, Callable, Dict
+
+from pyautotk.elements.widget import Widget
+
+# Flows modelled on code-examples/playground.py. Each scenario receives a connected controller.
+
+
+def buttons(session: Any) -> None:
+    for button_id in ("primary-btn", "secondary-btn", "danger-btn"):
+        Widget(session, id=button_id).click()
+        Widget(session, id="button-click-message").properties().get("text")
+    Widget(session, id="disabled-btn").properties().get("enabled")
+
+
+def forms(session: Any) -> None:
+    Widget(session, id="text-input").enter_text("Texto de teste")
+    Widget(session, id="email-input").enter_text("teste@exemplo.com")
+    Widget(session, id="password-input").enter_text("senha123")
+    color_input = Widget(session, id="color-input")
+    color_input.set_value("#EEFF00")
+    color_input.get_attribute("value")
+    Widget(session, id="country-select").select_by_text("Brasil")
+
+
+def forms_batched(session: Any) -> None:
+    with session.batch():
+        Widget(session, id="text-input").enter_text("Texto de teste")
+        Widget(session, id="email-input").enter_text("teste@exemplo.com")
+        Widget(session, id="password-input").enter_text("senha123")
+        Widget(session, id="color-input").set_value("#EEFF00")
+        Widget(session, id="country-select").select_by_text("Brasil")
+    Widget(session, id="color-input").get_attribute("value")
+
+
+def properties(session: Any) -> None:
+    for index in range(5):
+        Widget(session, id=f"item-{index}").properties()
+
+
+def properties_snapshot(session: Any) -> None:
+    for index in range(5):
+        Widget(session, id=f"item-{index}").properties(snapshot=True)
+
+
+def repeated_interactions(session: Any) -> None:
+    widget = Widget(session, id="text-input")
+    for _ in range(5):
+        widget.click()
+        widget.get_attribute("value")
+
+
+def repeated_interactions_cached(session: Any) -> None:
+    session.cache_elements = True
+    try:
+        repeated_interactions(session)
+    finally:
+        session.cache_elements = False
+        session.invalidate_element_cache()
+
+
+def observer_waits(session: Any) -> None:
+    for index in range(5):
+        session.wait_for_element(f"//*[@id='toast-{index}']", strategy="observer")
+
+
+def pointer_gestures(session: Any) -> None:
+    for row_id in ("row-1", "row-2", "row-3"):
+        Widget(session, id=row_id).double_click()
+    Widget(session, id="context-target").right_click()
+
+
+def extract_table(session: Any) -> None:
+    Widget(session, class_name="result-row").extract_table(
+        attributes=["data-id", "href"], rect=True
+    )
+
+
+SCENARIOS: Dict[str, Callable[[Any], None]] = {
+    "buttons": buttons,
+    "forms": forms,
+    "forms_batched": forms_batched,
+    "properties": properties,
+    "properties_snapshot": properties_snapshot,
+    "repeated_interactions": repeated_interactions,
+    "repeated_interactions_cached": repeated_interactions_cached,
+    "observer_waits": observer_waits,
+    "pointer_gestures": pointer_gestures,
+    "extract_table": extract_table,
+}
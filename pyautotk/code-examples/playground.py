@@ -1,4 +1,3 @@
-import time
 from pyautotk.elements.widget import Widget
 from pyautotk.elements.helpers.session_helpers import browser_session
 import os
@@ -45,7 +44,7 @@ def test_links(session):
     session.close_current_tab()
 
     Widget(session, id="download-link", text="Link de Download").click()
-    time.sleep(0.5)
+    session.wait_for_network_idle()
     Widget(session, text="Próximo").click()
 
 
@@ -113,7 +112,6 @@ def test_hover(session):
     for _ in range(3):
         hover_div.hover()
         assert "está sobre" in hover_status.properties().get("text")
-        time.sleep(0.5)
         hover_div.unhover()
         assert "não está" in hover_status.properties().get("text")
     
@@ -179,7 +177,7 @@ def test_drag_and_drop(session):
 
     assert "Nenhuma" in status.properties().get("text")
     source_drag.drag_to(target_drop)
-    time.sleep(5)
+    session.wait_for_dom_stable()
     assert "solto" in status.properties().get("text")
 
 @browser_session(MOCKUP_TEST_URL_FILE)
@@ -197,4 +195,4 @@ def full_execution(session):
 
 if __name__ == "__main__":
     full_execution()
-    print("Todos os testes do PyAutoTk foram executados com sucesso!")
\ No newline at end of file
+    print("Todos os testes do PyAutoTk foram executados com sucesso!")
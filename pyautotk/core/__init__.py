@@ -1,4 +1,21 @@
-from .config_loader import config  # noqa
-from .browser_controller import BrowserController  # noqa
-from .logger_utils import initialize_logger  # noqa
-from .exceptions import ElementNotVisibleException  # noqa
+from typing import TYPE_CHECKING
+
+from .lazy_imports import lazy_attributes
+from .session_pool import session_pool  # noqa
+
+# `session_pool` stays eager: the name is also a submodule, which would shadow a lazy attribute once imported.
+_LAZY_ATTRIBUTES = {
+    "config": "pyautotk.core.config_loader",
+    "BrowserController": "pyautotk.core.browser_controller",
+    "initialize_logger": "pyautotk.core.logger_utils",
+    "ElementNotVisibleException": "pyautotk.core.exceptions",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES) + ["session_pool"]
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .config_loader import config  # noqa
+    from .browser_controller import BrowserController  # noqa
+    from .logger_utils import initialize_logger  # noqa
+    from .exceptions import ElementNotVisibleException  # noqa
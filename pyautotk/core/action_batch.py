@@ -0,0 +1,206 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from pyautotk.core.exceptions import BatchActionException
+from pyautotk.core.logger_utils import initialize_logger
+
+# Runs every queued DOM-level operation in order inside the page and reports a status per operation.
+# Elements are resolved at flush time (XPath, or CSS for `css=` locators), so batched operations do not wait for them.
+BATCH_SCRIPT = """
+    const operations = arguments[0];
+    const stopOnError = arguments[1];
+    const results = [];
+    let stopped = false;
+
+    function find(xpath) {
+        if (xpath.indexOf('css=') === 0) {
+            return document.querySelector(xpath.slice(4));
+        }
+        return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+
+    function fire(el, type) {
+        el.dispatchEvent(new Event(type, {bubbles: true}));
+    }
+
+    function selectOption(el, by, value) {
+        const options = Array.from(el.options || []);
+        let option;
+        if (by === 'text') {
+            option = options.find(function (o) { return o.text.trim() === String(value).trim(); });
+        } else if (by === 'value') {
+            option = options.find(function (o) { return o.value === String(value); });
+        } else {
+            option = options[value];
+        }
+        if (!option) {
+            throw new Error('Could not locate option by ' + by + ': ' + value);
+        }
+        option.selected = true;
+        fire(el, 'input');
+        fire(el, 'change');
+    }
+
+    for (const op of operations) {
+        if (stopped) {
+            results.push({status: 'skipped', error: null});
+            continue;
+        }
+        try {
+            const el = find(op.xpath);
+            if (!el) {
+                throw new Error('No element matches XPath ' + op.xpath);
+            }
+            if (op.action === 'click') {
+                el.click();
+            } else if (op.action === 'set_value') {
+                el.value = op.value;
+                fire(el, 'input');
+                fire(el, 'change');
+            } else if (op.action === 'enter_text') {
+                el.focus();
+                el.value = op.value;
+                fire(el, 'input');
+                fire(el, 'change');
+            } else if (op.action === 'select') {
+                selectOption(el, op.by, op.value);
+            } else {
+                throw new Error('Unsupported batch action ' + op.action);
+            }
+            results.push({status: 'ok', error: null});
+        } catch (e) {
+            results.push({status: 'error', error: String((e && e.message) || e)});
+            stopped = stopOnError;
+        }
+    }
+    return results;
+"""
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a single operation executed by an ActionBatch.
+    """
+
+    action: str
+    xpath: str
+    value: Any = None
+    by: Optional[str] = None
+    status: str = "pending"
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+class ActionBatch:
+    """
+    Records DOM-level Widget operations (JS click, set value, text entry through value + input/change events,
+    option selection) and runs them in a single `execute_script` call.
+
+    Used as a context manager through `BrowserController.batch()`. While a batch is active, any other controller
+    operation (waits, reads, hovers, uploads...) first flushes the queued operations and then runs normally,
+    so the order of the recorded flow is preserved.
+    """
+
+    def __init__(
+        self,
+        controller: Any,
+        stop_on_error: bool = True,
+        raise_on_error: bool = True,
+        native_text: bool = False,
+    ) -> None:
+        """
+        Initializes an empty batch.
+
+        Args:
+            controller (Any): The BrowserController that executes the batch.
+            stop_on_error (bool): Whether to skip the remaining operations after the first failure. Default is True.
+            raise_on_error (bool): Whether to raise BatchActionException on exit if an operation failed. Default is True.
+            native_text (bool): Whether text entry should keep using real key events (normal path) instead of
+                being batched as a value assignment. Default is False.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.controller = controller
+        self.stop_on_error = stop_on_error
+        self.raise_on_error = raise_on_error
+        self.native_text = native_text
+        self.results: List[BatchResult] = []
+        self._pending: List[BatchResult] = []
+
+    def __enter__(self) -> "ActionBatch":
+        if self.controller._active_batch is not None:
+            raise RuntimeError("An action batch is already active on this controller.")
+        self.controller._active_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                self.logger.warning(
+                    "Discarding %s queued operation(s) after an error in the batch block.",
+                    len(self._pending),
+                )
+                self._pending.clear()
+        finally:
+            self.controller._active_batch = None
+
+        failures = [result for result in self.results if result.status == "error"]
+        if exc_type is None and failures and self.raise_on_error:
+            raise BatchActionException(failures)
+
+    def record(self, action: str, xpath: str, value: Any = None, by: str = None) -> None:
+        """
+        Queues an operation to be executed on the next flush.
+
+        Args:
+            action (str): One of 'click', 'set_value', 'enter_text' or 'select'.
+            xpath (str): The XPath locator of the target element.
+            value (Any): The value, text or option used by the operation.
+            by (str): For 'select', how the option is matched: 'text', 'value' or 'index'.
+        """
+        self.logger.debug("Queueing batch operation '%s' for XPath: %s", action, xpath)
+        self._pending.append(BatchResult(action=action, xpath=xpath, value=value, by=by))
+
+    def flush(self) -> List[BatchResult]:
+        """
+        Executes the queued operations in a single script call.
+
+        Returns:
+            List[BatchResult]: The results of the operations executed by this flush.
+        """
+        if not self._pending:
+            return []
+
+        pending, self._pending = self._pending, []
+        if self.stop_on_error and any(result.status == "error" for result in self.results):
+            for result in pending:
+                result.status = "skipped"
+            self.results.extend(pending)
+            return pending
+
+        operations: List[Dict[str, Any]] = [
+            {"action": result.action, "xpath": result.xpath, "value": result.value, "by": result.by}
+            for result in pending
+        ]
+        self.logger.debug(
+            "Flushing %s batched operation(s) in a single script call.", len(operations)
+        )
+        statuses = self.controller.execute_script(BATCH_SCRIPT, operations, self.stop_on_error)
+
+        for result, status in zip(pending, statuses):
+            result.status = status["status"]
+            result.error = status["error"]
+            if result.status == "error":
+                self.logger.error(
+                    "Batched '%s' failed for XPath: %s. Error: %s",
+                    result.action,
+                    result.xpath,
+                    result.error,
+                )
+        self.results.extend(pending)
+        return pending
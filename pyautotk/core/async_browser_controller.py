@@ -0,0 +1,647 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from pyautotk.core.browser_controller import BrowserController, locator_to_by
+from pyautotk.core.config_loader import config
+from pyautotk.core.logger_utils import initialize_logger
+from pyautotk.core.session_state import SessionState
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool shared by every AsyncBrowserController of the process.
+
+    Selenium's WebDriver client is blocking, so each WebDriver command is dispatched to this pool. Sessions
+    share the pool instead of owning a thread, and waits sleep on the event loop without holding a thread.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=config.async_workers, thread_name_prefix="pyautotk-async"
+                )
+    return _executor
+
+
+class AsyncBrowserController:
+    """
+    asyncio front end for BrowserController. Exposes the same operations as coroutines so many sessions
+    (or tabs) can be driven concurrently from a single event loop.
+
+    Commands of one session are serialized, since a WebDriver session processes one command at a time.
+    Waits poll the browser from the event loop, releasing the worker thread between attempts.
+    """
+
+    # The automation engine of the wrapped controller; only Selenium sessions can be driven asynchronously.
+    engine = "selenium"
+
+    def __init__(self, controller: BrowserController, poll_frequency: float = 0.1) -> None:
+        """
+        Wraps an existing BrowserController.
+
+        Args:
+            controller (BrowserController): The synchronous controller that owns the WebDriver session.
+            poll_frequency (float): Interval (in seconds) between checks while waiting for an element. Default is 0.1.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.controller = controller
+        self.poll_frequency = poll_frequency
+        # Created by the first `run`, inside the event loop that drives the session.
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    async def create(
+        cls,
+        browser_type: str = "",
+        maximize: bool = False,
+        headless: bool = False,
+        kill_browser: bool = True,
+        block_resources: List[str] = None,
+        block_urls: List[str] = None,
+    ) -> "AsyncBrowserController":
+        """
+        Launches a browser without blocking the event loop and returns its async controller.
+
+        Args:
+            browser_type (str): The type of browser to use. Supported values: 'firefox' and 'chrome'.
+            maximize (bool): Whether to maximize the browser window on startup. Default is False.
+            headless (bool): Whether to run the browser in headless mode. Default is False.
+            kill_browser (bool): Whether the browser is closed when the session ends. Default is True.
+            block_resources (List[str]): Resource types the browser never downloads. Defaults to `config.block_resources`.
+            block_urls (List[str]): URL patterns the browser never downloads. Defaults to `config.block_urls`.
+
+        Returns:
+            AsyncBrowserController: The controller for the new browser.
+        """
+        loop = asyncio.get_running_loop()
+        controller = await loop.run_in_executor(
+            _get_executor(),
+            partial(
+                BrowserController,
+                browser_type=browser_type,
+                maximize=maximize,
+                headless=headless,
+                kill_browser=kill_browser,
+                block_resources=block_resources,
+                block_urls=block_urls,
+            ),
+        )
+        return cls(controller)
+
+    @property
+    def driver(self) -> Any:
+        """The WebDriver instance of the wrapped controller."""
+        return self.controller.driver
+
+    async def open_url(self, url: str) -> None:
+        """
+        Opens the specified URL in the browser.
+
+        Args:
+            url (str): The URL to open in the browser.
+        """
+        await self.run(self.controller.open_url, url)
+
+    async def close_browser(self) -> None:
+        """
+        Closes the browser and ends the WebDriver session.
+        """
+        await self.run(self.controller.close_browser)
+
+    async def save_session_state(self, path: str = "") -> SessionState:
+        """
+        Captures the cookies, storage and URL of the current page. See `BrowserController.save_session_state`.
+
+        Args:
+            path (str): JSON file the state is written to. Default is not to write it.
+        """
+        return await self.run(self.controller.save_session_state, path)
+
+    async def restore_session_state(
+        self, state: Union[SessionState, str], navigate: bool = False
+    ) -> None:
+        """
+        Restores a captured state before the first `open_url`. See `BrowserController.restore_session_state`.
+
+        Args:
+            state (Union[SessionState, str]): The state, or the JSON file it was saved to.
+            navigate (bool): Whether to open the captured URL afterwards. Default is False.
+        """
+        await self.run(self.controller.restore_session_state, state, navigate)
+
+    async def accept_alert(self, timeout: int = 5) -> None:
+        """
+        Waits for and accepts a JavaScript alert.
+
+        Args:
+            timeout (int): The maximum time in seconds to wait for the alert.
+        """
+        await self.run(self.controller.accept_alert, timeout)
+
+    async def switch_to_new_tab(self) -> None:
+        """Switches the focus to the most recently opened tab."""
+        await self.run(self.controller.switch_to_new_tab)
+
+    async def switch_to_original_tab(self) -> None:
+        """Switches the focus back to the original tab."""
+        await self.run(self.controller.switch_to_original_tab)
+
+    async def close_current_tab(self) -> None:
+        """Closes the focused tab and switches back to the original one."""
+        await self.run(self.controller.close_current_tab)
+
+    async def wait_for_element(self, xpath: str, timeout: int = 10) -> Any:
+        """
+        Waits until the element identified by the given XPath is visible.
+
+        Args:
+            xpath (str): The XPath locator string for the element to wait for.
+            timeout (int): The maximum time (in seconds) to wait. Default is 10 seconds.
+
+        Returns:
+            Any: The visible WebElement.
+
+        Raises:
+            TimeoutException: If the element is not visible within the given time.
+        """
+        return await self._wait(xpath, "visible", timeout)
+
+    async def wait_for_all_elements(self, xpath: str, timeout: int = 10) -> list:
+        """
+        Waits until at least one element identified by the given XPath is present and returns all matches.
+
+        Args:
+            xpath (str): The XPath locator string for the elements to wait for.
+            timeout (int): The maximum time (in seconds) to wait. Default is 10 seconds.
+
+        Returns:
+            list: The matching WebElements.
+
+        Raises:
+            TimeoutException: If no element is found within the given time.
+        """
+        return await self._wait(xpath, "all", timeout)
+
+    async def wait_for_page_load(self, timeout: int = 30) -> None:
+        """
+        Waits until `document.readyState` is 'complete'.
+
+        Args:
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the document is not ready within the given time.
+        """
+        await self.run(self.controller.wait_for_page_load, timeout)
+
+    async def wait_for_network_idle(self, idle_time: float = 0.5, timeout: int = 30) -> None:
+        """
+        Waits until the document is ready and no fetch/XHR request has been in flight for `idle_time` seconds.
+
+        Args:
+            idle_time (float): How long (in seconds) the network must stay idle. Default is 0.5 seconds.
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the network does not become idle within the given time.
+        """
+        await self.run(self.controller.wait_for_network_idle, idle_time, timeout)
+
+    async def wait_for_dom_stable(self, stable_time: float = 0.5, timeout: int = 30) -> None:
+        """
+        Waits until the document is ready and has not changed for `stable_time` seconds.
+
+        Args:
+            stable_time (float): How long (in seconds) the DOM must stay unchanged. Default is 0.5 seconds.
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the DOM does not settle within the given time.
+        """
+        await self.run(self.controller.wait_for_dom_stable, stable_time, timeout)
+
+    async def find_element(self, xpath: str, timeout: int = 10) -> Any:
+        """
+        Waits until the element identified by the given XPath is clickable and returns it.
+
+        Args:
+            xpath (str): The XPath locator string for the desired element.
+            timeout (int): The maximum time (in seconds) to wait. Default is 10 seconds.
+
+        Returns:
+            Any: The located WebElement.
+
+        Raises:
+            TimeoutException: If the element is not clickable within the given time.
+        """
+        return await self._wait(xpath, "clickable", timeout)
+
+    async def click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Clicks on the element specified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.click_element, xpath, timeout
+        )
+
+    async def double_click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Double-clicks the element with native pointer events.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be double-clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.double_click_element, xpath, timeout
+        )
+
+    async def right_click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Right-clicks the element with native pointer events, opening its context menu.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be right-clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.right_click_element, xpath, timeout
+        )
+
+    async def hover_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Moves the mouse over the element specified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element to hover.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.hover_element, xpath, timeout
+        )
+
+    async def unhover_element(self, timeout: int = 10) -> None:
+        """
+        Moves the mouse to the <body> element to un-hover any active element.
+
+        Args:
+            timeout (int): Maximum time to wait for the body element to be present.
+        """
+        await self._wait_then_run(
+            "//body", "present", timeout, self.controller.unhover_element, timeout
+        )
+
+    async def drag_and_drop(self, source_xpath: str, target_xpath: str, timeout: int = 10) -> None:
+        """
+        Performs a drag-and-drop action from a source element to a target element.
+
+        Args:
+            source_xpath (str): The XPath locator for the element to drag.
+            target_xpath (str): The XPath locator for the element to drop onto.
+            timeout (int): Maximum time to wait for the elements.
+        """
+        target = await self._wait(target_xpath, "clickable", timeout)
+        source = await self._wait(source_xpath, "clickable", timeout)
+        await self.run(
+            self._run_with_elements,
+            {(source_xpath, "clickable"): source, (target_xpath, "clickable"): target},
+            self.controller.drag_and_drop,
+            source_xpath,
+            target_xpath,
+            timeout,
+        )
+
+    async def enter_text_safely(self, xpath: str, text: str, timeout: int = 10) -> None:
+        """
+        Enters the specified text into a text input field, focusing it first.
+
+        Args:
+            xpath (str): The XPath locator string for the input field.
+            text (str): The text to be entered into the field.
+            timeout (int): Maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.enter_text_safely, xpath, text, timeout
+        )
+
+    async def set_element_value(self, xpath: str, value: str, timeout: int = 10) -> None:
+        """
+        Sets the value of an element directly using JavaScript.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            value (str): The value to set for the element.
+            timeout (int): Maximum time (in seconds) to wait for the element.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.set_element_value, xpath, value, timeout
+        )
+
+    async def scroll_to_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Scrolls the page until the element identified by the given XPath is in view.
+
+        Args:
+            xpath (str): The XPath locator string for the element to scroll to.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.scroll_to_element, xpath, timeout
+        )
+
+    async def upload_file(self, xpath: str, file_path: str, timeout: int = 10) -> None:
+        """
+        Uploads a file by sending the file path to a file input element.
+
+        Args:
+            xpath (str): The XPath locator string for the file input element.
+            file_path (str): The absolute path to the file to be uploaded.
+            timeout (int): Maximum time (in seconds) to wait for the element to be present. Default is 10 seconds.
+        """
+        await self._wait_then_run(
+            xpath, "present", timeout, self.controller.upload_file, xpath, file_path, timeout
+        )
+
+    async def get_element_attribute(
+        self, xpath: str, attribute_name: str, timeout: int = 10
+    ) -> Any:
+        """
+        Retrieves the value of an attribute from the element identified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            attribute_name (str): The name of the attribute to retrieve.
+            timeout (int): Maximum time (in seconds) to wait for the element to be visible. Default is 10 seconds.
+
+        Returns:
+            Any: The attribute value, or None if the element does not have it.
+        """
+        return await self._wait_then_run(
+            xpath,
+            "visible",
+            timeout,
+            self.controller.get_element_attribute,
+            xpath,
+            attribute_name,
+            timeout,
+        )
+
+    async def get_element_properties(
+        self, xpath: str, attributes: List[str], timeout: int = 10, all_matches: bool = False
+    ) -> Any:
+        """
+        Retrieves a snapshot of the element properties using a single injected script call.
+
+        Args:
+            xpath (str): The XPath locator string for the element(s).
+            attributes (List[str]): The attribute names to include in the `attributes` entry of each snapshot.
+            timeout (int): Maximum time (in seconds) to wait for the element(s). Default is 10 seconds.
+            all_matches (bool): Whether to return the properties of every matching element.
+
+        Returns:
+            Any: A properties dictionary, or a list of dictionaries when `all_matches` is True.
+        """
+        return await self._wait_then_run(
+            xpath,
+            "all" if all_matches else "visible",
+            timeout,
+            self.controller.get_element_properties,
+            xpath,
+            attributes,
+            timeout,
+            all_matches,
+        )
+
+    async def extract_table(
+        self,
+        xpath: str,
+        attributes: List[str] = None,
+        text: bool = True,
+        rect: bool = False,
+        displayed: bool = False,
+        timeout: int = 10,
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts the chosen fields of every element matching the XPath with a single injected script call.
+        See `BrowserController.extract_table`.
+
+        Returns:
+            Dict[str, List[Any]]: The extracted columns.
+        """
+        if timeout:
+            await self._wait(xpath, "present", timeout)
+        return await self.run(
+            self.controller.extract_table, xpath, attributes, text, rect, displayed, 0
+        )
+
+    async def run_on_element(
+        self,
+        xpath: str,
+        action: Callable[[Any], Any],
+        timeout: int = 10,
+        condition: str = "clickable",
+    ) -> Any:
+        """
+        Locates the element and calls the blocking `action` with it in a worker thread.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            action (Callable[[Any], Any]): The callable that receives the WebElement.
+            timeout (int): Maximum time (in seconds) to wait for the element. Default is 10 seconds.
+            condition (str): The wait condition ('present', 'visible' or 'clickable').
+
+        Returns:
+            Any: The value returned by `action`.
+        """
+        return await self._wait_then_run(
+            xpath,
+            condition,
+            timeout,
+            self.controller.run_on_element,
+            xpath,
+            action,
+            timeout,
+            condition,
+        )
+
+    async def select_option_by_text(self, xpath: str, text: str, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown by its visible text.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            text (str): The visible text of the option to select.
+            timeout (int): Maximum time to wait for the element.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.select_option_by_text, xpath, text, timeout
+        )
+
+    async def select_option_by_value(self, xpath: str, value: str, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown by its 'value' attribute.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            value (str): The value attribute of the option to select.
+            timeout (int): Maximum time to wait for the element.
+        """
+        await self._wait_then_run(
+            xpath,
+            "clickable",
+            timeout,
+            self.controller.select_option_by_value,
+            xpath,
+            value,
+            timeout,
+        )
+
+    async def select_option_by_index(self, xpath: str, index: int, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown by its index.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            index (int): The index of the option to select (0-based).
+            timeout (int): Maximum time to wait for the element.
+        """
+        await self._wait_then_run(
+            xpath,
+            "clickable",
+            timeout,
+            self.controller.select_option_by_index,
+            xpath,
+            index,
+            timeout,
+        )
+
+    async def deselect_all_options(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Deselects all options in a multi-select dropdown.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            timeout (int): Maximum time to wait for the element.
+        """
+        await self._wait_then_run(
+            xpath, "clickable", timeout, self.controller.deselect_all_options, xpath, timeout
+        )
+
+    async def deselect_option_by_text(self, xpath: str, text: str, timeout: int = 10) -> None:
+        """
+        Deselects an option from a multi-select dropdown by its visible text.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            text (str): The visible text of the option to deselect.
+            timeout (int): Maximum time to wait for the element.
+        """
+        await self._wait_then_run(
+            xpath,
+            "clickable",
+            timeout,
+            self.controller.deselect_option_by_text,
+            xpath,
+            text,
+            timeout,
+        )
+
+    async def get_all_selected_options_text(self, xpath: str, timeout: int = 10) -> List[str]:
+        """
+        Gets the text of all selected options from a dropdown.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            timeout (int): Maximum time to wait for the element.
+        """
+        return await self._wait_then_run(
+            xpath,
+            "clickable",
+            timeout,
+            self.controller.get_all_selected_options_text,
+            xpath,
+            timeout,
+        )
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a blocking call (e.g. a WebDriver or BrowserController method) in the shared thread pool,
+        one call at a time per session.
+
+        Args:
+            func (Callable[..., Any]): The blocking callable.
+            *args (Any): Positional arguments for `func`.
+
+        Returns:
+            Any: The value returned by `func`.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await loop.run_in_executor(_get_executor(), partial(func, *args))
+
+    async def _wait_then_run(
+        self, xpath: str, condition: str, timeout: int, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """
+        Waits for the element without holding a thread, then runs the blocking controller call with the element
+        found by the wait, so the call does not locate it again.
+        """
+        element = await self._wait(xpath, condition, timeout)
+        return await self.run(self._run_with_elements, {(xpath, condition): element}, func, *args)
+
+    def _run_with_elements(
+        self, elements: Dict[Tuple[str, str], Any], func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Runs the controller call with elements already located by `_wait`, keyed by (XPath, condition)."""
+        with self.controller.prelocated_elements(elements):
+            return func(*args)
+
+    async def _wait(self, xpath: str, condition: str, timeout: float) -> Any:
+        """
+        Polls the condition from the event loop, sleeping between attempts instead of blocking a thread.
+
+        Raises:
+            TimeoutException: If the condition is not met within the given time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            result = await self.run(self._check_condition, xpath, condition)
+            if result is not None:
+                return result
+            if time.monotonic() >= deadline:
+                raise TimeoutException(
+                    f"Element with XPath '{xpath}' did not become {condition} within {timeout} seconds."
+                )
+            await asyncio.sleep(self.poll_frequency)
+
+    def _check_condition(self, xpath: str, condition: str) -> Any:
+        """Performs a single non-waiting check of the condition; returns None when it is not met yet."""
+        try:
+            elements = self.driver.find_elements(*locator_to_by(xpath))
+            if condition == "all":
+                return elements or None
+            if not elements:
+                return None
+            element = elements[0]
+            if condition in ("visible", "clickable") and not element.is_displayed():
+                return None
+            if condition == "clickable" and not element.is_enabled():
+                return None
+            return element
+        except StaleElementReferenceException:
+            return None
@@ -0,0 +1,346 @@
+import atexit
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from pyautotk.core.browser_controller import BrowserController
+from pyautotk.core.config_loader import config
+from pyautotk.core.logger_utils import initialize_logger
+from pyautotk.core.window_routing import WindowFocus, WindowRouter, routed_copy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+HostKey = Tuple[str, bool, bool]
+
+_lock = threading.Lock()
+_hosts: Dict[HostKey, List["BrowserHost"]] = {}
+_launches: Dict[HostKey, List["_HostLaunch"]] = {}
+
+
+class _HostController(BrowserController):
+    """BrowserController launched with WebDriver BiDi enabled, which provides the user context commands."""
+
+    enable_bidi = True
+
+
+class _ContextRouter(WindowRouter):
+    """
+    Routes the commands of one context driver through the shared WebDriver session. Window handles are limited to
+    the context and `quit` only removes the context.
+    """
+
+    def __init__(
+        self, host: "BrowserHost", execute: Callable[..., Any], user_context: str, window: str
+    ) -> None:
+        super().__init__(host.focus, execute, window)
+        self.host = host
+        self.user_context = user_context
+
+    def execute(self, driver_command: str, params: dict = None) -> Any:
+        response = super().execute(driver_command, params)
+        if driver_command == Command.W3C_GET_WINDOW_HANDLES:
+            windows = self.host.context_windows(self.user_context)
+            response["value"] = [handle for handle in response["value"] if handle in windows]
+        return response
+
+    def quit(self) -> None:
+        self.host.remove_context(self.user_context)
+
+
+class BrowserContextController(BrowserController):
+    """
+    BrowserController for an isolated browser context hosted by a shared browser (see `BrowserHost`). It has its own
+    cookies, storage and tabs, and exposes the same API, so Widget works unchanged. `close_browser` only closes the
+    context.
+
+    The contexts of a browser share one WebDriver session, which runs one command at a time, so in-page waits are
+    split into `SHARED_SESSION_WAIT_SLICE` commands (see `BrowserController._script_wait_slice`).
+    """
+
+    def __init__(
+        self,
+        host: "BrowserHost",
+        cache_elements: bool = False,
+        block_resources: List[str] = None,
+        block_urls: List[str] = None,
+    ) -> None:
+        """
+        Initializes the controller with a new user context and tab in the host browser.
+
+        Args:
+            host (BrowserHost): The browser hosting the context.
+            cache_elements (bool): Whether to cache located elements by XPath and wait condition. Default is False.
+            block_resources (List[str]): Resource types never downloaded by the context. Defaults to
+                `config.block_resources`. Only applied on Chrome; Firefox contexts use the blocklist of the host.
+            block_urls (List[str]): URL patterns never downloaded by the context. Defaults to `config.block_urls`.
+        """
+        self.host = host
+        self.user_context = None
+        try:
+            super().__init__(
+                host.browser_type,
+                host.maximize,
+                host.headless,
+                kill_browser=True,
+                cache_elements=cache_elements,
+                block_resources=block_resources,
+                block_urls=block_urls,
+            )
+        except Exception:
+            if self.user_context is not None:
+                host.remove_context(self.user_context)
+            raise
+
+    def reset_session(self) -> None:
+        """Replaces the user context with a new one, which starts without cookies, storage or extra tabs."""
+        self.logger.debug("Replacing the browser context to reset the session.")
+        self.invalidate_element_cache()
+        self._relaunch()
+
+    def _initialize_driver(self) -> "WebDriver":
+        """Opens the user context of this controller in the host browser and returns its context driver."""
+        self.user_context, driver = self.host.open_context()
+        self._window_focus = self.host.focus
+        if self.maximize:
+            driver.maximize_window()
+        return driver
+
+
+class BrowserHost:
+    """
+    One launched browser whose WebDriver session hosts several isolated browser contexts (WebDriver BiDi user
+    contexts, the isolation of incognito windows and Firefox containers). Each context costs a tab instead of a
+    browser process.
+    """
+
+    def __init__(
+        self, browser_type: str = "", maximize: bool = False, headless: bool = False
+    ) -> None:
+        """
+        Launches the host browser with WebDriver BiDi enabled.
+
+        Args:
+            browser_type (str): The type of browser ('firefox' or 'chrome'). Defaults to `config.browser_type`.
+            maximize (bool): Whether context windows are maximized. Default is False.
+            headless (bool): Whether to run the browser in headless mode. Default is False.
+
+        Raises:
+            WebDriverException: If the installed Selenium or browser does not support WebDriver BiDi user contexts.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.controller = _HostController(browser_type, maximize, headless)
+        self.driver = self.controller.driver
+        self.browser_type = self.controller.browser_type
+        self.maximize = self.controller.maximize
+        self.headless = self.controller.headless
+        self.focus = WindowFocus(self.controller.original_window)
+        self.contexts: List[str] = []
+        # Contexts being created by `acquire_context`, counted against the capacity of the host.
+        self.pending = 0
+        if not hasattr(type(self.driver), "browsing_context"):
+            self.controller.close_browser()
+            raise WebDriverException(
+                "Browser contexts require a Selenium release with the WebDriver BiDi browser module."
+            )
+
+    def new_context(
+        self,
+        cache_elements: bool = False,
+        block_resources: List[str] = None,
+        block_urls: List[str] = None,
+    ) -> BrowserContextController:
+        """
+        Creates an isolated browser context with its own controller.
+
+        Args:
+            cache_elements (bool): Whether to cache located elements by XPath and wait condition. Default is False.
+            block_resources (List[str]): Resource types never downloaded by the context. Defaults to `config.block_resources`.
+            block_urls (List[str]): URL patterns never downloaded by the context. Defaults to `config.block_urls`.
+
+        Returns:
+            BrowserContextController: The controller of the new context.
+        """
+        return BrowserContextController(self, cache_elements, block_resources, block_urls)
+
+    def open_context(self) -> Tuple[str, "WebDriver"]:
+        """
+        Creates a user context with one tab and a driver bound to it.
+
+        Returns:
+            Tuple[str, WebDriver]: The user context id and its context driver.
+        """
+        with self.focus.lock:
+            user_context = self.driver.browser.create_user_context()
+            window = self.driver.browsing_context.create(type="tab", user_context=user_context)
+            self.contexts.append(user_context)
+        self.logger.debug("Opened browser context %s (%s open).", user_context, len(self.contexts))
+        driver = routed_copy(
+            self.driver, lambda execute: _ContextRouter(self, execute, user_context, window)
+        )
+        return user_context, driver
+
+    def context_windows(self, user_context: str) -> List[str]:
+        """Returns the handles of the top-level windows that belong to a user context."""
+        with self.focus.lock:
+            tree = self.driver.browsing_context.get_tree(max_depth=0)
+        return [info.context for info in tree if info.user_context == user_context]
+
+    def remove_context(self, user_context: str) -> None:
+        """Closes a user context together with its tabs, cookies and storage."""
+        with self.focus.lock:
+            if user_context not in self.contexts:
+                return
+            self.contexts.remove(user_context)
+            self.driver.browser.remove_user_context(user_context)
+            self.focus.window = None
+        self.logger.debug("Closed browser context %s (%s open).", user_context, len(self.contexts))
+
+    def is_alive(self) -> bool:
+        """
+        Checks whether the host browser is still responsive.
+
+        Returns:
+            bool: True if the session answered a trivial script call, False otherwise.
+        """
+        with self.focus.lock:
+            self.focus.window = None
+            return self.controller.is_alive()
+
+    def close(self) -> None:
+        """Closes every context and the host browser."""
+        with self.focus.lock:
+            self.contexts.clear()
+            self.controller.close_browser()
+
+
+def acquire_context(
+    browser_type: str = "",
+    headless: bool = False,
+    maximize: bool = False,
+    block_resources: List[str] = None,
+    block_urls: List[str] = None,
+) -> BrowserContextController:
+    """
+    Creates an isolated browser context in a shared browser with the given configuration. A new browser is launched
+    when every running one already hosts `config.contexts_per_browser` contexts. Browsers are launched and contexts are
+    created outside the registry lock: while a browser starts, other callers reserve their contexts in it and wait for
+    it instead of blocking the registry. A browser is only checked for liveness when creating a context in it fails.
+
+    Args:
+        browser_type (str): The type of browser ('firefox' or 'chrome'). Defaults to `config.browser_type`.
+        headless (bool): Whether the browser runs in headless mode. Default is False.
+        maximize (bool): Whether the context windows are maximized. Default is False.
+        block_resources (List[str]): Resource types never downloaded by the context. Defaults to `config.block_resources`.
+        block_urls (List[str]): URL patterns never downloaded by the context. Defaults to `config.block_urls`.
+
+    Returns:
+        BrowserContextController: The controller of the new context. `close_browser` closes the context only.
+    """
+    key = (
+        browser_type.lower() or config.browser_type,
+        headless or config.headless_mode,
+        maximize or config.maximize_browser,
+    )
+    while True:
+        launching = False
+        with _lock:
+            hosts = _hosts.setdefault(key, [])
+            host = next(
+                (
+                    host
+                    for host in hosts
+                    if len(host.contexts) + host.pending < config.contexts_per_browser
+                ),
+                None,
+            )
+            launch = None
+            if host is None:
+                launches = _launches.setdefault(key, [])
+                launch = next(
+                    (
+                        candidate
+                        for candidate in launches
+                        if candidate.pending < config.contexts_per_browser
+                    ),
+                    None,
+                )
+                if launch is None:
+                    launch = _HostLaunch()
+                    launches.append(launch)
+                    launching = True
+            # Reserved while the lock is held, so concurrent callers see the host (or the launch) filling up.
+            (host or launch).pending += 1
+        if host is None:
+            host = _launch_host(key, launch) if launching else launch.wait()
+            if host is None:
+                continue
+        try:
+            return host.new_context(block_resources=block_resources, block_urls=block_urls)
+        except WebDriverException:
+            if host.is_alive():
+                raise
+            host.logger.warning(
+                "Shared browser stopped responding, launching another one for new contexts."
+            )
+            with _lock:
+                hosts = _hosts.get(key, [])
+                if host in hosts:
+                    hosts.remove(host)
+        finally:
+            with _lock:
+                host.pending -= 1
+
+
+class _HostLaunch:
+    """A shared browser being launched by `acquire_context`, holding the contexts reserved in it until it is up."""
+
+    def __init__(self) -> None:
+        self.pending = 0
+        self.host: Optional[BrowserHost] = None
+        self.done = threading.Event()
+
+    def wait(self) -> Optional[BrowserHost]:
+        """Waits for the launch and returns the browser, or None if the launch failed."""
+        self.done.wait()
+        return self.host
+
+
+def _launch_host(key: HostKey, launch: _HostLaunch) -> BrowserHost:
+    """
+    Launches the browser of a `_HostLaunch` outside the registry lock, then registers it with the contexts reserved
+    while it was starting. If the launch fails, the placeholder is removed and the callers waiting on it try again.
+    """
+    try:
+        host = BrowserHost(key[0], maximize=key[2], headless=key[1])
+    except BaseException:
+        with _lock:
+            _launches[key].remove(launch)
+        launch.done.set()
+        raise
+    with _lock:
+        _launches[key].remove(launch)
+        host.pending = launch.pending
+        _hosts.setdefault(key, []).append(host)
+    launch.host = host
+    launch.done.set()
+    return host
+
+
+def close_browser_hosts() -> None:
+    """Closes every shared browser launched by `acquire_context`. Registered to run at interpreter exit."""
+    with _lock:
+        hosts = [host for group in _hosts.values() for host in group]
+        _hosts.clear()
+    for host in hosts:
+        try:
+            host.close()
+        except Exception as e:
+            initialize_logger("BrowserHost").debug(
+                "Ignoring error while closing a shared browser: %s", e
+            )
+
+
+atexit.register(close_browser_hosts)
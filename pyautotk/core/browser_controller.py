@@ -1,35 +1,405 @@
 import os
-from typing import Any
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from platform import system
+from urllib.parse import urlsplit
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchWindowException
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.support.ui import Select
+from selenium.webdriver.remote.command import Command
 
+from pyautotk.core.action_batch import ActionBatch
 from pyautotk.core.logger_utils import initialize_logger
 from pyautotk.core.config_loader import config
+from pyautotk.core.driver_services import (  # noqa: F401 (install locations re-exported for compatibility)
+    CHROME_BIN_LINUX,
+    CHROME_BIN_WINDOWS,
+    FIREFOX_BIN_LINUX,
+    FIREFOX_BIN_WINDOWS,
+    FIREFOXDRIVE_BIN_LINUX,
+    DriverPaths,
+    resolve_driver_paths,
+    shared_driver_service,
+)
+from pyautotk.core.exceptions import BrowserWaitForPageLoadException
+from pyautotk.core.input import MouseController
+from pyautotk.core.launch_profiles import (
+    claim_cache_directory,
+    get_launch_profile,
+    release_cache_directory,
+)
+from pyautotk.core.locator_index import FINGERPRINT_SCRIPT, locator_index
+from pyautotk.core.locators import CSS_PREFIX
+from pyautotk.core.profiler import profiled_operations, profiler
+from pyautotk.core.resource_blocking import (
+    blocked_url_patterns,
+    chrome_preferences,
+    firefox_preferences,
+    resolve_blocking,
+)
+from pyautotk.core.session_state import (
+    APPLY_STORAGE_SCRIPT,
+    CAPTURE_STORAGE_SCRIPT,
+    RESTORE_LANDING_PATH,
+    SessionState,
+    to_protocol_cookie,
+)
+from pyautotk.core.wait_history import wait_history
+from pyautotk.core.window_routing import SHARED_SESSION_WAIT_SLICE, WindowFocus, route_driver
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from pyautotk.core.tabs import BrowserTab
+
+# Mirrors Widget._extract_element_properties for every element in arguments[0], so the whole
+# snapshot costs a single WebDriver round trip instead of one per attribute/property.
+PROPERTIES_SNAPSHOT_SCRIPT = """
+    const elements = arguments[0];
+    const attributeNames = arguments[1];
+
+    function readAttribute(el, name) {
+        if (!el.hasAttribute(name)) {
+            return (name === 'value' && typeof el.value === 'string') ? el.value : null;
+        }
+        const property = name === 'class' ? undefined : el[name];
+        return typeof property === 'string' ? property : el.getAttribute(name);
+    }
+
+    function isDisplayed(el) {
+        const style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+    }
+
+    return elements.map(function (el) {
+        const attributes = {};
+        attributeNames.forEach(function (name) {
+            const value = readAttribute(el, name);
+            if (value !== null) {
+                attributes[name] = value;
+            }
+        });
+        const rect = el.getBoundingClientRect();
+        const displayed = isDisplayed(el);
+        return {
+            text: displayed ? (el.innerText || '').trim() : '',
+            tag_name: el.tagName.toLowerCase(),
+            attributes: attributes,
+            location: {x: Math.round(rect.left + window.pageXOffset), y: Math.round(rect.top + window.pageYOffset)},
+            size: {height: Math.round(rect.height), width: Math.round(rect.width)},
+            displayed: displayed,
+            enabled: !el.disabled,
+        };
+    });
+"""
+
+# Collects the requested fields of every element matching arguments[0] (XPath or `css=` selector) into
+# one list per field, so a table of any size is extracted in a single WebDriver round trip.
+EXTRACT_TABLE_SCRIPT = """
+    const locator = arguments[0];
+    const attributeNames = arguments[1];
+    const fields = arguments[2];
+
+    function query() {
+        if (locator.indexOf('css=') === 0) {
+            return Array.from(document.querySelectorAll(locator.slice(4)));
+        }
+        const result = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+
+    function isDisplayed(el) {
+        const style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+    }
+
+    const names = [];
+    if (fields.text) { names.push('text'); }
+    attributeNames.forEach(function (name) { names.push(name); });
+    if (fields.rect) { names.push('x', 'y', 'width', 'height'); }
+    if (fields.displayed) { names.push('displayed'); }
+    const columns = {};
+    names.forEach(function (name) { columns[name] = []; });
+
+    query().forEach(function (el) {
+        if (fields.text) {
+            columns.text.push((el.innerText || el.textContent || '').trim());
+        }
+        attributeNames.forEach(function (name) {
+            columns[name].push(el.getAttribute(name));
+        });
+        if (fields.rect) {
+            const rect = el.getBoundingClientRect();
+            columns.x.push(Math.round(rect.left + window.pageXOffset));
+            columns.y.push(Math.round(rect.top + window.pageYOffset));
+            columns.width.push(Math.round(rect.width));
+            columns.height.push(Math.round(rect.height));
+        }
+        if (fields.displayed) {
+            columns.displayed.push(isDisplayed(el));
+        }
+    });
+    return columns;
+"""
+
+# Column names filled by EXTRACT_TABLE_SCRIPT itself, which requested attributes cannot reuse.
+TABLE_COLUMNS = ("text", "x", "y", "width", "height", "displayed")
+
+
+def table_script_arguments(
+    attributes: List[str], text: bool, rect: bool, displayed: bool
+) -> Tuple[List[str], Dict[str, bool]]:
+    """
+    Validates the requested columns and builds the arguments of EXTRACT_TABLE_SCRIPT.
 
-FIREFOX_BIN_LINUX = os.path.join("/snap", "firefox", "current", "usr", "lib", "firefox", "firefox")
-FIREFOXDRIVE_BIN_LINUX = os.path.join("/snap", "firefox", "current", "usr", "lib", "firefox", "geckodriver")
-CHROME_BIN_LINUX = os.path.join("/usr", "bin", "google-chrome")
-
-FIREFOX_BIN_WINDOWS = os.path.join("C:\\", "Program Files", "Mozilla Firefox", "firefox.exe")
-CHROME_BIN_WINDOWS = os.path.join("C:\\", "Program Files", "Google", "Chrome", "Application", "chrome.exe")
+    Raises:
+        ValueError: If a requested attribute collides with one of the `TABLE_COLUMNS`.
+    """
+    attributes = list(attributes or [])
+    reserved = [name for name in attributes if name in TABLE_COLUMNS]
+    if reserved:
+        raise ValueError(
+            f"Attribute names {reserved} collide with the built-in columns: {', '.join(TABLE_COLUMNS)}"
+        )
+    return attributes, {"text": text, "rect": rect, "displayed": displayed}
+
+
+WAIT_STRATEGIES = ("polling", "observer")
+
+# Resolves as soon as the XPath satisfies the condition, re-checking on every DOM mutation instead of
+# polling from the client. A short interval check covers changes that do not mutate the DOM (e.g. CSS animations).
+MUTATION_WAIT_SCRIPT = """
+    const xpath = arguments[0];
+    const condition = arguments[1];
+    const timeoutMs = arguments[2];
+    const done = arguments[arguments.length - 1];
+
+    function isVisible(el) {
+        const style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+    }
+
+    function query() {
+        if (xpath.indexOf('css=') === 0) {
+            return Array.from(document.querySelectorAll(xpath.slice(4)));
+        }
+        const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+
+    function check() {
+        const nodes = query();
+        if (nodes.length === 0) {
+            return null;
+        }
+        if (condition === 'all') {
+            return nodes;
+        }
+        const first = nodes[0];
+        if (condition === 'visible' && !isVisible(first)) {
+            return null;
+        }
+        if (condition === 'clickable' && !(isVisible(first) && !first.disabled)) {
+            return null;
+        }
+        return first;
+    }
+
+    let finished = false;
+    let observer = null;
+    let interval = null;
+    let timer = null;
+
+    function finish(value) {
+        if (finished) {
+            return;
+        }
+        finished = true;
+        if (observer) observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+        done(value);
+    }
+
+    function attempt() {
+        const value = check();
+        if (value !== null) {
+            finish(value);
+        }
+    }
+
+    attempt();
+    if (!finished) {
+        observer = new MutationObserver(attempt);
+        observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+        interval = setInterval(attempt, 100);
+        timer = setTimeout(function () { finish(null); }, timeoutMs);
+    }
+"""
+
+
+def url_origin(url: str) -> Optional[str]:
+    """Returns the origin (scheme, host and port) of an http(s) URL, or None for other URLs such as about:blank."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def locator_to_by(locator: str) -> Tuple[str, str]:
+    """
+    Maps a locator string to a Selenium (By, value) pair. Locators starting with `css=` are CSS selectors,
+    anything else is treated as XPath.
 
+    Args:
+        locator (str): The XPath or `css=` prefixed CSS selector.
 
+    Returns:
+        Tuple[str, str]: The Selenium locator strategy and value.
+    """
+    if locator.startswith(CSS_PREFIX):
+        return By.CSS_SELECTOR, locator[len(CSS_PREFIX) :]
+    return By.XPATH, locator
+
+
+POLLING_CONDITIONS = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+    "all": EC.presence_of_all_elements_located,
+}
+
+# Counts in-flight fetch/XHR requests in `window.__pyautotkNetwork`. Idempotent, so it can run both as a
+# new-document script (Chromium, installed on the first network-idle wait) and at the start of every wait.
+NETWORK_TRACKER_SCRIPT = """
+    (function () {
+        if (window.__pyautotkNetwork) {
+            return;
+        }
+        const tracker = window.__pyautotkNetwork = { inflight: 0, lastChange: Date.now() };
+
+        function started() {
+            tracker.inflight++;
+            tracker.lastChange = Date.now();
+        }
+
+        function finished() {
+            tracker.inflight = Math.max(0, tracker.inflight - 1);
+            tracker.lastChange = Date.now();
+        }
+
+        if (window.fetch) {
+            const originalFetch = window.fetch;
+            window.fetch = function () {
+                started();
+                return originalFetch.apply(this, arguments).finally(finished);
+            };
+        }
+        const originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            started();
+            this.addEventListener('loadend', finished, { once: true });
+            return originalSend.apply(this, arguments);
+        };
+    })();
+"""
+
+# Resolves with true as soon as the page condition holds, or false after arguments[2] ms. Every condition
+# first requires document.readyState to be 'complete'; the check runs inside the page every 25 ms.
+PAGE_SETTLE_SCRIPT = (
+    NETWORK_TRACKER_SCRIPT
+    + """
+    const condition = arguments[0];
+    const quietMs = arguments[1];
+    const deadline = Date.now() + arguments[2];
+    const done = arguments[arguments.length - 1];
+    const tracker = window.__pyautotkNetwork;
+    let lastMutation = Date.now();
+    let observer = null;
+    let interval = null;
+
+    function settled() {
+        if (document.readyState !== 'complete') {
+            return false;
+        }
+        if (condition === 'network_idle') {
+            return tracker.inflight === 0 && Date.now() - tracker.lastChange >= quietMs;
+        }
+        if (condition === 'dom_stable') {
+            return Date.now() - lastMutation >= quietMs;
+        }
+        return true;
+    }
+
+    function finish(value) {
+        if (observer) observer.disconnect();
+        clearInterval(interval);
+        done(value);
+    }
+
+    function check() {
+        if (settled()) {
+            finish(true);
+        } else if (Date.now() >= deadline) {
+            finish(false);
+        }
+    }
+
+    if (condition === 'dom_stable') {
+        observer = new MutationObserver(function () {
+            lastMutation = Date.now();
+        });
+        observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+    }
+    interval = setInterval(check, 25);
+    check();
+"""
+)
+
+PAGE_CONDITIONS = ("ready", "network_idle", "dom_stable")
+
+
+@profiled_operations
 class BrowserController:
     """
     Manages interactions with a web browser using Selenium, providing a high-level API for navigation, element handling,
     and browser control. Supports configurable options such as browser type, headless mode, and maximization.
     """
 
-    def __init__(self, browser_type: str, maximize: bool, headless: bool, kill_browser: bool = True) -> None:
+    # The automation engine of the controller, one of `controller_factory.BROWSER_ENGINES`.
+    engine = "selenium"
+
+    # Whether the session is started with a WebDriver BiDi connection (the `webSocketUrl` capability).
+    enable_bidi = False
+
+    def __init__(
+        self,
+        browser_type: str,
+        maximize: bool,
+        headless: bool,
+        kill_browser: bool = True,
+        cache_elements: bool = False,
+        block_resources: List[str] = None,
+        block_urls: List[str] = None,
+        driver: "WebDriver" = None,
+    ) -> None:
         """
         Initializes the BrowserController with the specified browser configuration.
 
@@ -37,6 +407,43 @@ class BrowserController:
             browser_type (str): The type of browser to use. Supported values: 'firefox' and 'chrome'. Default is 'firefox'.
             maximize (bool): Whether to maximize the browser window on startup. Default is False.
             headless (bool): Whether to run the browser in headless mode. Default is False.
+            cache_elements (bool): Whether to cache located elements by XPath and wait condition so repeated
+                interactions skip the lookup. Default is False, unless enabled through `config.element_cache`.
+            block_resources (List[str]): Resource types never downloaded by the browser, from
+                `resource_blocking.RESOURCE_TYPES` (e.g. ['image', 'font', 'analytics']). Defaults to `config.block_resources`.
+            block_urls (List[str]): URL patterns never downloaded by the browser, where `*` matches any sequence of
+                characters (e.g. ['*.mp4', '*ads.example.com*']). Defaults to `config.block_urls`.
+            driver (WebDriver): An existing driver to control instead of launching a browser, e.g. the routed driver
+                of a tab. Default is None.
+        """
+        self._configure(
+            browser_type,
+            maximize,
+            headless,
+            kill_browser,
+            cache_elements,
+            block_resources,
+            block_urls,
+        )
+        self.driver = self._initialize_driver() if driver is None else driver
+        profiler.attach(self.driver)
+        self._apply_resource_blocking()
+        self.original_window = self.driver.current_window_handle
+        self.logger.debug("Original window handle: %s", self.original_window)
+
+    def _configure(
+        self,
+        browser_type: str,
+        maximize: bool,
+        headless: bool,
+        kill_browser: bool = True,
+        cache_elements: bool = False,
+        block_resources: List[str] = None,
+        block_urls: List[str] = None,
+    ) -> None:
+        """
+        Sets the configuration and the per-session state of the controller, before a driver is attached.
+        Takes the configuration arguments of `__init__`.
         """
         self.logger = initialize_logger(self.__class__.__name__)
         self.os_type = system()
@@ -44,9 +451,18 @@ class BrowserController:
         self.maximize = maximize or config.maximize_browser
         self.headless = headless or config.headless_mode
         self.kill_browser = kill_browser
-        self.driver = self._initialize_driver()
-        self.original_window = self.driver.current_window_handle
-        print(self.original_window)
+        self.cache_elements = cache_elements or config.element_cache
+        self.block_resources, self.block_urls = resolve_blocking(block_resources, block_urls)
+        self.launch_profile = get_launch_profile()
+        self._element_cache: Dict[Tuple[str, str], Any] = {}
+        self._prelocated: Dict[Tuple[str, str], Any] = {}
+        self._script_timeout = None
+        self._network_tracker_installed = False
+        self._active_batch = None
+        self._window_focus = None
+        self._restore_script_id = None
+        self._visited_origins: Set[str] = set()
+        self._cache_directory = ""
 
     def open_url(self, url: str) -> None:
         """
@@ -55,8 +471,17 @@ class BrowserController:
         Args:
             url (str): The URL to open in the browser.
         """
-        self.logger.info(f"Open url: {url} ")
+        self.logger.info("Open url: %s ", url)
+        self._flush_pending_batch()
+        self.invalidate_element_cache()
         self.driver.get(url)
+        self._visit(url)
+        if self._restore_script_id is not None:
+            # Restored storage is seeded into the first page only; later loads keep what the page stored.
+            self.driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._restore_script_id}
+            )
+            self._restore_script_id = None
 
     def close_browser(self) -> None:
         """
@@ -64,6 +489,195 @@ class BrowserController:
         """
         self.logger.debug("Killing browser session")
         self.driver.quit()
+        release_cache_directory(self._cache_directory)
+
+    def batch(
+        self, stop_on_error: bool = True, raise_on_error: bool = True, native_text: bool = False
+    ) -> ActionBatch:
+        """
+        Creates an action batch that records DOM-level operations and runs them in a single script call.
+
+        While the batch is active, `click_element`, `set_element_value`, `enter_text_safely` and the
+        `select_option_by_*` methods are queued instead of executed; every other operation flushes the queue first.
+
+        Example:
+            with session.batch() as batch:
+                Widget(session, id="text-input").enter_text("Texto de teste")
+                Widget(session, id="dropdown").select_by_text("Opção 2")
+            print(batch.results)
+
+        Args:
+            stop_on_error (bool): Whether to skip the remaining operations after the first failure. Default is True.
+            raise_on_error (bool): Whether to raise BatchActionException if an operation failed. Default is True.
+            native_text (bool): Whether text entry keeps using real key events instead of being batched. Default is False.
+
+        Returns:
+            ActionBatch: The batch, to be used as a context manager.
+        """
+        return ActionBatch(
+            self,
+            stop_on_error=stop_on_error,
+            raise_on_error=raise_on_error,
+            native_text=native_text,
+        )
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        """
+        Executes JavaScript in the current page, with `args` available as `arguments[0..n]`.
+
+        Args:
+            script (str): The JavaScript function body to execute.
+            *args (Any): Arguments passed to the script.
+
+        Returns:
+            Any: The value returned by the script.
+        """
+        return self.driver.execute_script(script, *args)
+
+    def is_alive(self) -> bool:
+        """
+        Checks whether the browser and its WebDriver session are still responsive.
+
+        Returns:
+            bool: True if the session answered a trivial script call, False otherwise.
+        """
+        try:
+            return self.driver.execute_script("return true;") is True
+        except WebDriverException as e:
+            self.logger.warning("Browser session health check failed. Error: %s", e)
+            return False
+
+    def reset_session(self) -> None:
+        """
+        Restores the browser to a blank state so the session can be reused by another test.
+
+        On Chrome, the tabs are replaced by a new blank tab (dropping their sessionStorage), and the cookies and the
+        storage of every origin the session visited are cleared through CDP. Other browsers can only clear the origin
+        that is open, so they are relaunched instead.
+        """
+        self.logger.debug("Resetting browser session state.")
+        self.invalidate_element_cache()
+        if self.browser_type != "chrome":
+            self._relaunch()
+            return
+
+        old_windows = self.driver.window_handles
+        for handle in old_windows:
+            self.driver.switch_to.window(handle)
+            self._visit(self.driver.current_url)
+        self.driver.switch_to.new_window("tab")
+        new_window = self.driver.current_window_handle
+        for handle in old_windows:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(new_window)
+        self.original_window = new_window
+        self._network_tracker_installed = False
+        self._apply_resource_blocking()
+
+        for cookie in self.driver.execute_cdp_cmd("Storage.getCookies", {}).get("cookies", []):
+            domain = cookie["domain"].lstrip(".")
+            self._visited_origins.update((f"http://{domain}", f"https://{domain}"))
+        self.driver.execute_cdp_cmd("Storage.clearCookies", {})
+        for origin in sorted(self._visited_origins):
+            self.driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+            )
+        self._visited_origins.clear()
+
+    def _relaunch(self) -> None:
+        """Quits the browser and launches a new one with the same configuration, discarding every session state."""
+        self.logger.debug("Relaunching the browser to reset the session.")
+        self.driver.quit()
+        release_cache_directory(self._cache_directory)
+        self._configure(
+            self.browser_type,
+            self.maximize,
+            self.headless,
+            self.kill_browser,
+            self.cache_elements,
+            self.block_resources,
+            self.block_urls,
+        )
+        self.driver = self._initialize_driver()
+        profiler.attach(self.driver)
+        self._apply_resource_blocking()
+        self.original_window = self.driver.current_window_handle
+
+    def _visit(self, url: str) -> None:
+        """Remembers the origin of a page the session opened, so `reset_session` clears its storage."""
+        origin = url_origin(url)
+        if origin is not None:
+            self._visited_origins.add(origin)
+
+    def save_session_state(self, path: str = "") -> SessionState:
+        """
+        Captures the cookies, localStorage and sessionStorage of the current page and its URL, e.g. at the end of a
+        login or setup flow, so later sessions can restore them with `restore_session_state` instead of repeating it.
+
+        Args:
+            path (str): JSON file the state is written to. Default is not to write it.
+
+        Returns:
+            SessionState: The captured state.
+        """
+        self._flush_pending_batch()
+        storage = self.driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        state = SessionState(
+            self.driver.current_url,
+            storage["origin"],
+            self.driver.get_cookies(),
+            storage["local"],
+            storage["session"],
+        )
+        if path:
+            state.save(path)
+            self.logger.info("Session state of %s saved to %s", state.origin, path)
+        return state
+
+    def restore_session_state(
+        self, state: Union[SessionState, str], navigate: bool = False
+    ) -> None:
+        """
+        Restores a state captured by `save_session_state` into this session, before the first `open_url`.
+
+        On Chrome the cookies are set through CDP and the storage is seeded into the next page of the origin before its
+        scripts run, without any extra page load. Other browsers first open `RESTORE_LANDING_PATH` of the origin, since
+        cookies and storage can only be set on a document of the origin.
+
+        Args:
+            state (Union[SessionState, str]): The state, or the JSON file it was saved to.
+            navigate (bool): Whether to open the captured URL afterwards. Default is False.
+        """
+        if isinstance(state, str):
+            state = SessionState.load(state)
+        self.logger.info(
+            "Restoring session state of %s (%s cookies).", state.origin, len(state.cookies)
+        )
+        self._flush_pending_batch()
+        has_storage = state.origin not in ("", "null") and (
+            state.local_storage or state.session_storage
+        )
+
+        if self.browser_type == "chrome":
+            if state.cookies:
+                cookies = [to_protocol_cookie(cookie) for cookie in state.cookies]
+                self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            if has_storage:
+                self._restore_script_id = self.driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument", {"source": state.storage_seed_script()}
+                )["identifier"]
+        else:
+            self.driver.get(state.origin + RESTORE_LANDING_PATH)
+            for cookie in state.cookies:
+                self.driver.add_cookie(cookie)
+            if has_storage:
+                self.driver.execute_script(
+                    APPLY_STORAGE_SCRIPT, state.origin, state.local_storage, state.session_storage
+                )
+
+        if navigate:
+            self.open_url(state.url)
 
     def accept_alert(self, timeout: int = 5) -> None:
         """
@@ -76,18 +690,18 @@ class BrowserController:
             TimeoutException: If no alert is present within the timeout period.
         """
         try:
-            self.logger.debug(f"Waiting for alert for {timeout} seconds.")
+            self.logger.debug("Waiting for alert for %s seconds.", timeout)
             WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
             alert = self.driver.switch_to.alert
             alert_text = alert.text
-            self.logger.info(f"Accepting alert with text: '{alert_text}'")
+            self.logger.info("Accepting alert with text: '%s'", alert_text)
             alert.accept()
             self.driver.switch_to.default_content()
         except TimeoutException:
-            self.logger.error(f"No alert was present within {timeout} seconds.")
+            self.logger.error("No alert was present within %s seconds.", timeout)
             raise
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred while handling the alert: {e}")
+            self.logger.error("An unexpected error occurred while handling the alert: %s", e)
             raise
 
     def switch_to_new_tab(self) -> None:
@@ -99,8 +713,10 @@ class BrowserController:
         all_handles = self.driver.window_handles
         if len(all_handles) > 1:
             new_tab_handle = all_handles[-1]
+            self.invalidate_element_cache()
             self.driver.switch_to.window(new_tab_handle)
-            self.logger.info(f"Switched to new tab with handle: {new_tab_handle}")
+            self._apply_resource_blocking()
+            self.logger.info("Switched to new tab with handle: %s", new_tab_handle)
         else:
             self.logger.warning("No new tab to switch to. Only one tab is open.")
 
@@ -111,9 +727,10 @@ class BrowserController:
         it switches to the first available tab.
         """
         self.logger.debug("Switching back to the original tab.")
+        self.invalidate_element_cache()
         try:
             self.driver.switch_to.window(self.original_window)
-            self.logger.info(f"Switched back to original tab with handle: {self.original_window}")
+            self.logger.info("Switched back to original tab with handle: %s", self.original_window)
         except NoSuchWindowException:
             self.logger.warning("Original tab seems to be closed. Switching to the first available tab.")
             if self.driver.window_handles:
@@ -126,20 +743,68 @@ class BrowserController:
         Closes the currently focused tab and switches back to the original tab.
         If only one tab is open, it will not be closed.
         """
-        self.logger.debug(f"Attempting to close the current tab.")
+        self.logger.debug("Attempting to close the current tab.")
         if len(self.driver.window_handles) > 1:
+            self.invalidate_element_cache()
             self.driver.close()
             self.switch_to_original_tab()
         else:
             self.logger.warning("Cannot close the tab as it is the only one open. Use `close_browser()` to end the session.")
 
-    def find_element(self, xpath: str, timeout: int = 10) -> Any:
+    def open_tab(self, url: str = "") -> "BrowserTab":
+        """
+        Opens a new tab without moving the controller to it, and starts loading the URL without waiting for the page.
+
+        The returned tab exposes the controller API (Widget works with it) on its own window. Commands of the tab and
+        of the controller switch windows only when the other one has the focus, so pages keep loading in the other
+        tabs while one is used.
+
+        Args:
+            url (str): The URL to start loading in the tab. Default is an empty tab.
+
+        Returns:
+            BrowserTab: The new tab.
+        """
+        from pyautotk.core.tabs import BrowserTab
+
+        self._flush_pending_batch()
+        focus = self._route_windows()
+        window = self.driver.execute(Command.NEW_WINDOW, {"type": "tab"})["value"]["handle"]
+        self.logger.debug("Opened tab with handle: %s", window)
+        tab = BrowserTab(self, window, focus)
+        if url:
+            tab.start_loading(url)
+        return tab
+
+    def open_tabs(self, urls: List[str]) -> List["BrowserTab"]:
+        """
+        Opens one tab per URL (see `open_tab`) and starts loading every page without waiting, so the pages load in
+        parallel. The tabs are opened first, so each tab costs one window switch.
+
+        Example:
+            tabs = session.open_tabs(["http://localhost:8080/a", "http://localhost:8080/b"])
+            titles = [Widget(tab, tag="h1").text for tab in tabs]
+
+        Args:
+            urls (List[str]): The URLs to load.
+
+        Returns:
+            List[BrowserTab]: The tabs, in the order of `urls`.
+        """
+        tabs = [self.open_tab() for _ in urls]
+        for tab, url in zip(tabs, urls):
+            tab.start_loading(url)
+        return tabs
+
+    def find_element(self, xpath: str, timeout: int = 10, strategy: str = None) -> Any:
         """
         Locates and returns a web element based on the given XPath.
+        When element caching is enabled, a previously located element is returned without a new lookup.
 
         Args:
             xpath (str): The XPath locator string for the desired element.
             timeout (int): The maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+            strategy (str): The wait strategy, 'polling' or 'observer'. Defaults to `config.wait_strategy`.
 
         Returns:
             Any: The located WebElement.
@@ -147,11 +812,75 @@ class BrowserController:
         Raises:
             TimeoutException: If the element is not found within the given time.
         """
-        self.logger.debug(f"Searching for a element using the following xpath: {xpath}")
-        self.wait_for_element(xpath)
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable((By.XPATH, xpath))
+        self.logger.debug("Searching for a element using the following xpath: %s", xpath)
+        return self._locate(xpath, "clickable", timeout, strategy)
+
+    def run_on_element(
+        self,
+        xpath: str,
+        action: Callable[[Any], Any],
+        timeout: int = 10,
+        condition: str = "clickable",
+    ) -> Any:
+        """
+        Locates the element and calls `action` with it, returning its result.
+
+        If the element comes from the cache (or `prelocated_elements`) and its reference has gone stale, the entry
+        is dropped and the action is retried once with a freshly located element.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            action (Callable[[Any], Any]): The callable that receives the WebElement.
+            timeout (int): Maximum time (in seconds) to wait for the element. Default is 10 seconds.
+            condition (str): The wait condition used to locate the element ('present', 'visible' or 'clickable').
+
+        Returns:
+            Any: The value returned by `action`.
+        """
+        cached = (xpath, condition) in self._prelocated or (
+            self.cache_elements and (xpath, condition) in self._element_cache
         )
+        element = self._locate(xpath, condition, timeout)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            if not cached:
+                raise
+            self.logger.debug("Cached element for XPath '%s' is stale, locating it again.", xpath)
+            self.invalidate_element_cache(xpath)
+            return action(self._locate(xpath, condition, timeout))
+
+    def invalidate_element_cache(self, xpath: str = None) -> None:
+        """
+        Drops the cached elements of an XPath (for every wait condition), or the whole element cache when no XPath is
+        given.
+
+        Args:
+            xpath (str): The XPath whose cached elements should be discarded. Default is None (all entries).
+        """
+        if xpath is None:
+            self._element_cache.clear()
+            self._prelocated.clear()
+        else:
+            for cache in (self._element_cache, self._prelocated):
+                for key in [key for key in cache if key[0] == xpath]:
+                    del cache[key]
+
+    @contextmanager
+    def prelocated_elements(self, elements: Dict[Tuple[str, str], Any]) -> Iterator[None]:
+        """
+        Makes the operations run inside the block use elements the caller already waited for, e.g. from an event
+        loop, instead of locating them again.
+
+        Args:
+            elements (Dict[Tuple[str, str], Any]): The elements keyed by (XPath, wait condition).
+        """
+        self._prelocated.update(elements)
+        try:
+            yield
+        finally:
+            for key in elements:
+                self._prelocated.pop(key, None)
 
     def click_element(self, xpath: str, timeout: int = 10) -> None:
         """
@@ -164,14 +893,50 @@ class BrowserController:
         Raises:
             TimeoutException: If the element is not found within the given time.
         """
-        self.logger.debug(f"Click a element using the following xpath: {xpath}")
-        element = self.find_element(xpath, timeout)
-        self.driver.execute_script("arguments[0].click();", element)
+        self.logger.debug("Click a element using the following xpath: %s", xpath)
+        if self._active_batch is not None:
+            return self._active_batch.record("click", xpath)
+        self.run_on_element(
+            xpath,
+            lambda element: self.driver.execute_script("arguments[0].click();", element),
+            timeout,
+        )
+
+    def double_click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Double-clicks the element with native pointer events, sent as a single W3C Actions request so the page
+        receives `mousedown`/`mouseup`/`click` twice followed by `dblclick`.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be double-clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element to be clickable. Default is 10 seconds.
+        """
+        self.logger.debug("Double-click a element using the following xpath: %s", xpath)
+        self.run_on_element(
+            xpath,
+            lambda element: MouseController(self.driver).double_click(element).perform(),
+            timeout,
+        )
+
+    def right_click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Right-clicks the element with native pointer events, opening its context menu.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be right-clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element to be clickable. Default is 10 seconds.
+        """
+        self.logger.debug("Right-click a element using the following xpath: %s", xpath)
+        self.run_on_element(
+            xpath,
+            lambda element: MouseController(self.driver).right_click(element).perform(),
+            timeout,
+        )
 
     def hover_element(self, xpath: str, timeout: int = 10) -> None:
-        element = self.find_element(xpath, timeout)
-        hover = ActionChains(self.driver).move_to_element(element)
-        hover.perform()
+        self.run_on_element(
+            xpath, lambda element: MouseController(self.driver).move_to(element).perform(), timeout
+        )
 
     def unhover_element(self, timeout: int = 10) -> None:
         """
@@ -182,12 +947,10 @@ class BrowserController:
         """
         self.logger.debug("Unhovering by moving mouse to the body element.")
         try:
-            body_element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            ActionChains(self.driver).move_to_element(body_element).perform()
+            body_element = self._wait_for_condition("//body", "present", timeout)
+            MouseController(self.driver).move_to(body_element).perform()
         except Exception as e:
-            self.logger.error(f"Failed to move mouse to body element to unhover. Error: {e}")
+            self.logger.error("Failed to move mouse to body element to unhover. Error: %s", e)
             raise
 
     def drag_and_drop(self, source_xpath: str, target_xpath: str, timeout: int = 10) -> None:
@@ -197,7 +960,8 @@ class BrowserController:
         This method uses conditional logic based on the browser type:
         - For 'firefox', it uses a JavaScript executor to simulate the full HTML5 drag-and-drop event sequence,
           which is more reliable for geckodriver.
-        - For other browsers (like 'chrome'), it uses the standard Selenium ActionChains `drag_and_drop` method.
+        - For other browsers (like 'chrome'), it presses, moves and releases the pointer in a single W3C Actions
+          request through MouseController.
 
         Args:
             source_xpath (str): The XPath locator for the element to drag.
@@ -209,7 +973,11 @@ class BrowserController:
             target_element = self.find_element(target_xpath, timeout)
 
             if self.browser_type == "firefox":
-                self.logger.debug(f"Performing drag and drop for Firefox using JavaScript from '{source_xpath}' to '{target_xpath}'.")
+                self.logger.debug(
+                    "Performing drag and drop for Firefox using JavaScript from '%s' to '%s'.",
+                    source_xpath,
+                    target_xpath,
+                )
                 dnd_script = """
                     const source = arguments[0];
                     const target = arguments[1];
@@ -233,11 +1001,18 @@ class BrowserController:
                 self.driver.execute_script(dnd_script, source_element, target_element)
                 self.logger.info("Drag and drop action completed successfully via JavaScript.")
             else:
-                self.logger.debug(f"Performing drag and drop for '{self.browser_type}' using ActionChains from '{source_xpath}' to '{target_xpath}'.")
-                ActionChains(self.driver).drag_and_drop(source_element, target_element).perform()
-                self.logger.info("Drag and drop action completed successfully via ActionChains.")
+                self.logger.debug(
+                    "Performing drag and drop for '%s' using pointer actions from '%s' to '%s'.",
+                    self.browser_type,
+                    source_xpath,
+                    target_xpath,
+                )
+                MouseController(self.driver).press(source_element).move_to(
+                    target_element
+                ).release().perform()
+                self.logger.info("Drag and drop action completed successfully via pointer actions.")
         except Exception as e:
-            self.logger.error(f"Drag and drop action failed. Error: {e}")
+            self.logger.error("Drag and drop action failed. Error: %s", e)
             raise
 
     def enter_text_safely(self, xpath: str, text: str, timeout: int = 10) -> None:
@@ -252,13 +1027,16 @@ class BrowserController:
         Raises:
             TimeoutException: If the element is not found within the given time.
         """
-        self.logger.debug(f"Enter text safely: {text} into element with XPath: {xpath}")
-        element = self.find_element(xpath, timeout)
-        
-        self.driver.execute_script("arguments[0].focus();", element)
-        
-        element.clear()
-        element.send_keys(text)
+        self.logger.debug("Enter text safely: %s into element with XPath: %s", text, xpath)
+        if self._active_batch is not None and not self._active_batch.native_text:
+            return self._active_batch.record("enter_text", xpath, text)
+
+        def enter_text(element: Any) -> None:
+            self.driver.execute_script("arguments[0].focus();", element)
+            element.clear()
+            element.send_keys(text)
+
+        self.run_on_element(xpath, enter_text, timeout)
 
     def set_element_value(self, xpath: str, value: str, timeout: int = 10) -> None:
         """
@@ -270,13 +1048,20 @@ class BrowserController:
             value (str): The value to set for the element.
             timeout (int): Maximum time (in seconds) to wait for the element to be located.
         """
-        self.logger.debug(f"Setting value '{value}' for element with XPath: {xpath} using JavaScript.")
-        element = self.find_element(xpath, timeout)
+        self.logger.debug(
+            "Setting value '%s' for element with XPath: %s using JavaScript.", value, xpath
+        )
+        if self._active_batch is not None:
+            return self._active_batch.record("set_value", xpath, value)
         # Set the value and then dispatch a 'change' event to ensure any listeners are triggered.
-        self.driver.execute_script(
-            "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('change'));",
-            element,
-            value
+        self.run_on_element(
+            xpath,
+            lambda element: self.driver.execute_script(
+                "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('change'));",
+                element,
+                value,
+            ),
+            timeout,
         )
 
     def scroll_to_element(self, xpath: str, timeout: int = 10) -> None:
@@ -290,17 +1075,21 @@ class BrowserController:
         Raises:
             TimeoutException: If the element is not found within the given time.
         """
-        self.logger.debug(f"Scrolling to a element using the following xpath: {xpath}")
-        element = self.find_element(xpath, timeout)
-        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+        self.logger.debug("Scrolling to a element using the following xpath: %s", xpath)
+        self.run_on_element(
+            xpath,
+            lambda element: self.driver.execute_script("arguments[0].scrollIntoView();", element),
+            timeout,
+        )
 
-    def wait_for_element(self, xpath: str, timeout: int = 10) -> Any:
+    def wait_for_element(self, xpath: str, timeout: int = 10, strategy: str = None) -> Any:
         """
         Waits until the element identified by the given XPath is visible.
 
         Args:
             xpath (str): The XPath locator string for the element to wait for.
             timeout (int): The maximum time (in seconds) to wait for the element to become visible. Default is 10 seconds.
+            strategy (str): The wait strategy, 'polling' or 'observer'. Defaults to `config.wait_strategy`.
 
         Returns:
             Any: The WebElement if found and visible, or raises an exception if not found.
@@ -308,18 +1097,63 @@ class BrowserController:
         Raises:
             TimeoutException: If the element is not found within the given time.
         """
-        self.logger.debug(f"Wait for a element using the following xpath: {xpath}")
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located((By.XPATH, xpath))
-        )
+        self.logger.debug("Wait for a element using the following xpath: %s", xpath)
+        return self._locate(xpath, "visible", timeout, strategy)
 
-    def wait_for_all_elements(self, xpath: str, timeout: int = 10) -> list:
+    def wait_for_page_load(self, timeout: int = 30) -> None:
+        """
+        Waits until `document.readyState` is 'complete'.
+
+        Args:
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the document is not ready within the given time.
+        """
+        self.logger.debug("Wait for the document to be ready.")
+        self._wait_for_page("ready", 0, timeout)
+
+    def wait_for_network_idle(self, idle_time: float = 0.5, timeout: int = 30) -> None:
+        """
+        Waits until the document is ready and no fetch/XHR request has been in flight for `idle_time` seconds.
+
+        Requests are counted by instrumenting `fetch` and `XMLHttpRequest`. On Chromium the instrumentation is also
+        registered for every new document, so requests made while later pages load are counted from the start; on
+        other browsers requests started before the first wait on a page are not seen.
+
+        Args:
+            idle_time (float): How long (in seconds) the network must stay idle. Default is 0.5 seconds.
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the network does not become idle within the given time.
+        """
+        self.logger.debug("Wait for the network to be idle for %ss.", idle_time)
+        self._install_network_tracker()
+        self._wait_for_page("network_idle", idle_time, timeout)
+
+    def wait_for_dom_stable(self, stable_time: float = 0.5, timeout: int = 30) -> None:
+        """
+        Waits until the document is ready and has not changed (nodes, attributes or text) for `stable_time` seconds.
+
+        Args:
+            stable_time (float): How long (in seconds) the DOM must stay unchanged. Default is 0.5 seconds.
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the DOM does not settle within the given time.
+        """
+        self.logger.debug("Wait for the DOM to be stable for %ss.", stable_time)
+        self._wait_for_page("dom_stable", stable_time, timeout)
+
+    def wait_for_all_elements(self, xpath: str, timeout: int = 10, strategy: str = None) -> list:
         """
         Waits until all elements identified by the given XPath are visible.
 
         Args:
             xpath (str): The XPath locator string for the elements to wait for.
             timeout (int): The maximum time (in seconds) to wait for the elements to become visible. Default is 10 seconds.
+            strategy (str): The wait strategy, 'polling' or 'observer'. Defaults to `config.wait_strategy`.
 
         Returns:
             list: A list of WebElement objects if found and visible, or raises an exception if not found.
@@ -327,9 +1161,105 @@ class BrowserController:
         Raises:
             TimeoutException: If no elements are found or visible within the given time.
         """
-        self.logger.debug(f"Wait for all elements using the following xpath: {xpath}")
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located((By.XPATH, xpath))
+        self.logger.debug("Wait for all elements using the following xpath: %s", xpath)
+        return self._wait_for_condition(xpath, "all", timeout, strategy)
+
+    def get_element_properties(
+        self, xpath: str, attributes: list[str], timeout: int = 10, all_matches: bool = False
+    ) -> Any:
+        """
+        Retrieves a snapshot of the element properties using a single injected script call.
+
+        The returned dictionaries have the same shape as the ones built by `Widget._extract_element_properties`,
+        but all the fields are collected inside the browser instead of one WebDriver request per field.
+
+        Args:
+            xpath (str): The XPath locator string for the element(s).
+            attributes (list[str]): The attribute names to include in the `attributes` entry of each snapshot.
+            timeout (int): Maximum time (in seconds) to wait for the element(s). Default is 10 seconds.
+            all_matches (bool): Whether to return the properties of every matching element instead of the first one.
+
+        Returns:
+            Any: A properties dictionary, or a list of dictionaries when `all_matches` is True.
+
+        Raises:
+            TimeoutException: If the element is not found within the given time.
+        """
+        self.logger.debug("Taking a properties snapshot of the element(s) with XPath: %s", xpath)
+        if all_matches:
+            elements = self.wait_for_all_elements(xpath, timeout)
+            return self.driver.execute_script(PROPERTIES_SNAPSHOT_SCRIPT, elements, attributes)
+
+        return self.run_on_element(
+            xpath,
+            lambda element: self.driver.execute_script(
+                PROPERTIES_SNAPSHOT_SCRIPT, [element], attributes
+            )[0],
+            timeout,
+            condition="visible",
+        )
+
+    def extract_table(
+        self,
+        xpath: str,
+        attributes: List[str] = None,
+        text: bool = True,
+        rect: bool = False,
+        displayed: bool = False,
+        timeout: int = 10,
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts the chosen fields of every element matching the XPath with a single injected script call.
+
+        The result is columnar: one list per field, all of the same length and in document order, so it can be
+        handed to `pandas.DataFrame` or `numpy` as is. Missing attributes are None.
+
+        Args:
+            xpath (str): The XPath locator string (or `css=` selector) for the elements.
+            attributes (List[str]): The attribute names to extract, each becoming a column. Default is none.
+            text (bool): Whether to include the `text` column. Default is True.
+            rect (bool): Whether to include the `x`, `y`, `width` and `height` columns (page coordinates). Default is False.
+            displayed (bool): Whether to include the `displayed` column. Default is False.
+            timeout (int): Maximum time (in seconds) to wait for at least one element. With 0, the page is read
+                immediately and empty columns are returned if nothing matches. Default is 10 seconds.
+
+        Returns:
+            Dict[str, List[Any]]: The extracted columns.
+
+        Raises:
+            ValueError: If a requested attribute collides with one of the `TABLE_COLUMNS`.
+            TimeoutException: If no element is found within the given time.
+        """
+        attributes, fields = table_script_arguments(attributes, text, rect, displayed)
+        self.logger.debug(
+            "Extracting columns %s and attributes %s for XPath: %s", fields, attributes, xpath
+        )
+        if timeout:
+            self._wait_for_condition(xpath, "present", timeout)
+        else:
+            self._flush_pending_batch()
+        return self.driver.execute_script(EXTRACT_TABLE_SCRIPT, xpath, attributes, fields)
+
+    def get_element_attribute(self, xpath: str, attribute_name: str, timeout: int = 10) -> Any:
+        """
+        Retrieves the value of an attribute from the element identified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            attribute_name (str): The name of the attribute to retrieve.
+            timeout (int): Maximum time (in seconds) to wait for the element to be visible. Default is 10 seconds.
+
+        Returns:
+            Any: The attribute value, or None if the element does not have it.
+        """
+        self.logger.debug(
+            "Getting attribute '%s' from element with XPath: %s", attribute_name, xpath
+        )
+        return self.run_on_element(
+            xpath,
+            lambda element: element.get_attribute(attribute_name),
+            timeout,
+            condition="visible",
         )
 
     def upload_file(self, xpath: str, file_path: str, timeout: int = 10) -> None:
@@ -346,22 +1276,19 @@ class BrowserController:
             TimeoutException: If the element is not present within the given time.
             ValueError: If the provided file_path is not an absolute path.
         """
-        self.logger.debug(f"Uploading file '{file_path}' to element with XPath: {xpath}")
+        self.logger.debug("Uploading file '%s' to element with XPath: %s", file_path, xpath)
         if not os.path.isabs(file_path):
             raise ValueError("File path for upload must be an absolute path.")
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"The file to upload was not found at: {file_path}")
 
         # We wait for presence, not visibility, as file inputs can be hidden for styling.
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((By.XPATH, xpath))
-        )
+        element = self._wait_for_condition(xpath, "present", timeout)
         element.send_keys(file_path)
 
-    def _get_select_object(self, xpath: str, timeout: int = 10) -> Select:
-        """Finds a <select> element and returns a Select object."""
-        element = self.find_element(xpath, timeout)
-        return Select(element)
+    def _run_on_select(self, xpath: str, action: Callable[[Select], Any], timeout: int = 10) -> Any:
+        """Finds a <select> element and calls `action` with its Select object."""
+        return self.run_on_element(xpath, lambda element: action(Select(element)), timeout)
 
     def select_option_by_text(self, xpath: str, text: str, timeout: int = 10) -> None:
         """
@@ -372,9 +1299,10 @@ class BrowserController:
             text (str): The visible text of the option to select.
             timeout (int): Maximum time to wait for the element.
         """
-        self.logger.debug(f"Selecting option '{text}' by text from dropdown with XPath: {xpath}")
-        select = self._get_select_object(xpath, timeout)
-        select.select_by_visible_text(text)
+        self.logger.debug("Selecting option '%s' by text from dropdown with XPath: %s", text, xpath)
+        if self._active_batch is not None:
+            return self._active_batch.record("select", xpath, text, by="text")
+        self._run_on_select(xpath, lambda select: select.select_by_visible_text(text), timeout)
 
     def select_option_by_value(self, xpath: str, value: str, timeout: int = 10) -> None:
         """
@@ -385,9 +1313,12 @@ class BrowserController:
             value (str): The value attribute of the option to select.
             timeout (int): Maximum time to wait for the element.
         """
-        self.logger.debug(f"Selecting option with value '{value}' from dropdown with XPath: {xpath}")
-        select = self._get_select_object(xpath, timeout)
-        select.select_by_value(value)
+        self.logger.debug(
+            "Selecting option with value '%s' from dropdown with XPath: %s", value, xpath
+        )
+        if self._active_batch is not None:
+            return self._active_batch.record("select", xpath, value, by="value")
+        self._run_on_select(xpath, lambda select: select.select_by_value(value), timeout)
 
     def select_option_by_index(self, xpath: str, index: int, timeout: int = 10) -> None:
         """
@@ -398,9 +1329,10 @@ class BrowserController:
             index (int): The index of the option to select (0-based).
             timeout (int): Maximum time to wait for the element.
         """
-        self.logger.debug(f"Selecting option at index {index} from dropdown with XPath: {xpath}")
-        select = self._get_select_object(xpath, timeout)
-        select.select_by_index(index)
+        self.logger.debug("Selecting option at index %s from dropdown with XPath: %s", index, xpath)
+        if self._active_batch is not None:
+            return self._active_batch.record("select", xpath, index, by="index")
+        self._run_on_select(xpath, lambda select: select.select_by_index(index), timeout)
 
     def deselect_all_options(self, xpath: str, timeout: int = 10) -> None:
         """
@@ -410,12 +1342,15 @@ class BrowserController:
             xpath (str): The XPath locator for the <select> element.
             timeout (int): Maximum time to wait for the element.
         """
-        self.logger.debug(f"Deselecting all options from dropdown with XPath: {xpath}")
-        select = self._get_select_object(xpath, timeout)
-        if select.is_multiple:
-            select.deselect_all()
-        else:
-            self.logger.warning("Deselect_all is only applicable to multi-select dropdowns.")
+        self.logger.debug("Deselecting all options from dropdown with XPath: %s", xpath)
+
+        def deselect_all(select: Select) -> None:
+            if select.is_multiple:
+                select.deselect_all()
+            else:
+                self.logger.warning("Deselect_all is only applicable to multi-select dropdowns.")
+
+        self._run_on_select(xpath, deselect_all, timeout)
 
     def deselect_option_by_text(self, xpath: str, text: str, timeout: int = 10) -> None:
         """
@@ -426,12 +1361,17 @@ class BrowserController:
             text (str): The visible text of the option to deselect.
             timeout (int): Maximum time to wait for the element.
         """
-        self.logger.debug(f"Deselecting option '{text}' by text from dropdown with XPath: {xpath}")
-        select = self._get_select_object(xpath, timeout)
-        if select.is_multiple:
-            select.deselect_by_visible_text(text)
-        else:
-            self.logger.warning("Deselection is only applicable to multi-select dropdowns.")
+        self.logger.debug(
+            "Deselecting option '%s' by text from dropdown with XPath: %s", text, xpath
+        )
+
+        def deselect_by_text(select: Select) -> None:
+            if select.is_multiple:
+                select.deselect_by_visible_text(text)
+            else:
+                self.logger.warning("Deselection is only applicable to multi-select dropdowns.")
+
+        self._run_on_select(xpath, deselect_by_text, timeout)
 
     def get_all_selected_options_text(self, xpath: str, timeout: int = 10) -> list[str]:
         """
@@ -441,54 +1381,364 @@ class BrowserController:
             xpath (str): The XPath locator for the <select> element.
             timeout (int): Maximum time to wait for the element.
         """
-        select = self._get_select_object(xpath, timeout)
-        return [option.text for option in select.all_selected_options]
+        return self._run_on_select(
+            xpath, lambda select: [option.text for option in select.all_selected_options], timeout
+        )
 
-    def _initialize_driver(self) -> WebDriver:
+    def _flush_pending_batch(self) -> None:
+        """Runs the operations queued by an active batch before an operation that is not batched."""
+        if self._active_batch is not None:
+            self._active_batch.flush()
+
+    def _resolve_wait_strategy(self, strategy: str = None) -> str:
         """
-        Initializes and returns a Selenium WebDriver instance based on the specified browser configuration.
+        Returns the wait strategy to use, falling back to the global configuration.
 
-        Returns:
-            WebDriver: The configured Selenium WebDriver instance.
+        Raises:
+            ValueError: If the strategy is not one of `WAIT_STRATEGIES`.
+        """
+        strategy = (strategy or config.wait_strategy).lower()
+        if strategy not in WAIT_STRATEGIES:
+            raise ValueError(
+                f"Unsupported wait strategy: {strategy}. Supported values: {', '.join(WAIT_STRATEGIES)}"
+            )
+        return strategy
+
+    def _locate(self, xpath: str, condition: str, timeout: int, strategy: str = None) -> Any:
+        """
+        Waits for the element with `_wait_for_condition`, going through the element cache when it is enabled and
+        through the locator index when `config.locator_healing` is enabled (for single elements only). With
+        `config.adaptive_timeouts`, the timeout is learned from the wait history of the XPath on the current page (see
+        `WaitHistory.timeout_for`) and every wait, successful or timed out, is added to it.
+        """
+        self._flush_pending_batch()
+        element = self._prelocated.get((xpath, condition))
+        if element is not None:
+            return element
+        if self.cache_elements:
+            element = self._element_cache.get((xpath, condition))
+            if element is not None:
+                self.logger.debug("Using cached element for XPath: %s", xpath)
+                return element
+
+        page = self.driver.current_url if config.locator_healing or config.adaptive_timeouts else ""
+        if config.adaptive_timeouts:
+            adapted = wait_history.timeout_for(page, xpath, timeout)
+            if adapted != timeout:
+                self.logger.debug(
+                    "Adaptive timeout for XPath %s: %.2fs instead of %ss.", xpath, adapted, timeout
+                )
+            timeout = adapted
+
+        started = time.monotonic()
+        try:
+            if config.locator_healing and condition != "all":
+                element = self._locate_with_healing(xpath, condition, timeout, strategy, page)
+            else:
+                element = self._wait_for_condition(xpath, condition, timeout, strategy)
+        except TimeoutException:
+            if config.adaptive_timeouts:
+                wait_history.record_timeout(page, xpath, timeout)
+            raise
+        if config.adaptive_timeouts:
+            wait_history.record(page, xpath, time.monotonic() - started)
+        if self.cache_elements:
+            self._element_cache[(xpath, condition)] = element
+        return element
+
+    def _locate_with_healing(
+        self, xpath: str, condition: str, timeout: float, strategy: str = None, page: str = ""
+    ) -> Any:
+        """
+        Waits for the element like `_wait_for_condition`. When the locator index has alternatives for the XPath on
+        the current page, the XPath and then each alternative (best hit rate first) are tried for
+        `config.locator_probe_timeout` seconds before waiting on the XPath for the rest of the timeout. Elements
+        found by an XPath that is not indexed yet are fingerprinted and recorded.
 
         Raises:
-            ValueError: If the specified `browser_type` is not supported.
+            TimeoutException: If neither the XPath nor an alternative satisfies the condition within the timeout.
         """
-        self.logger.debug("Init driver")
+        page = page or self.driver.current_url
+        deadline = time.monotonic() + timeout
+        alternatives = locator_index.alternatives(page, xpath)
+        if alternatives:
+            probe = min(config.locator_probe_timeout, timeout)
+            try:
+                return self._wait_for_condition(xpath, condition, probe, strategy)
+            except TimeoutException:
+                self.logger.debug(
+                    "XPath %s missed, trying %s indexed alternatives.", xpath, len(alternatives)
+                )
+            for alternative in alternatives:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    element = self._wait_for_condition(
+                        alternative.locator, condition, min(probe, remaining), strategy
+                    )
+                except TimeoutException:
+                    locator_index.report(page, xpath, alternative, hit=False)
+                    continue
+                locator_index.report(page, xpath, alternative, hit=True)
+                self.logger.warning(
+                    "Healed XPath %s with its %s alternative: %s",
+                    xpath,
+                    alternative.kind,
+                    alternative.locator,
+                )
+                return element
+            timeout = max(deadline - time.monotonic(), 0)
+
+        element = self._wait_for_condition(xpath, condition, timeout, strategy)
+        if not locator_index.has(page, xpath):
+            try:
+                locator_index.record(
+                    page, xpath, self.driver.execute_script(FINGERPRINT_SCRIPT, element)
+                )
+            except WebDriverException as e:
+                self.logger.debug("Could not fingerprint the element of XPath %s: %s", xpath, e.msg)
+        return element
+
+    def _wait_for_condition(
+        self, xpath: str, condition: str, timeout: int, strategy: str = None
+    ) -> Any:
+        """
+        Waits for the XPath to satisfy one of the `POLLING_CONDITIONS` using the selected wait strategy.
+        """
+        self._flush_pending_batch()
+        element = self._prelocated.get((xpath, condition))
+        if element is not None:
+            return element
+        with profiler.waiting():
+            if self._resolve_wait_strategy(strategy) == "observer":
+                return self._wait_with_observer(xpath, condition, timeout)
+            return self._wait_with_polling(xpath, condition, timeout)
+
+    def _wait_for_page(self, condition: str, quiet_time: float, timeout: float) -> None:
+        """
+        Waits for one of the `PAGE_CONDITIONS` inside the page with a single async script call (one per
+        `_script_wait_slice` on shared sessions). If the page navigates while waiting, the condition is checked again
+        on the new document for the remaining time.
 
-        if self.os_type == "Windows":
-            firefox_bin = FIREFOX_BIN_WINDOWS
-            firefox_driver_bin = ""
-            chrome_bin = CHROME_BIN_WINDOWS
-        else:
-            firefox_bin = FIREFOX_BIN_LINUX
-            firefox_driver_bin = FIREFOXDRIVE_BIN_LINUX
-            chrome_bin = CHROME_BIN_LINUX
+        Raises:
+            BrowserWaitForPageLoadException: If the condition is not met within the given time.
+        """
+        self._flush_pending_batch()
+        deadline = time.monotonic() + timeout
+        with profiler.waiting():
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BrowserWaitForPageLoadException(timeout, condition)
+                wait = self._script_wait_slice(remaining, quiet_time)
+                self._ensure_script_timeout(wait + 5)
+                try:
+                    settled = self.driver.execute_async_script(
+                        PAGE_SETTLE_SCRIPT, condition, int(quiet_time * 1000), int(wait * 1000)
+                    )
+                except JavascriptException as e:
+                    self.logger.debug(
+                        "Page wait for '%s' interrupted (%s), checking the new document.",
+                        condition,
+                        e.msg,
+                    )
+                    continue
+                except TimeoutException as e:
+                    raise BrowserWaitForPageLoadException(timeout, condition) from e
+                if settled:
+                    return
+                if wait >= remaining:
+                    raise BrowserWaitForPageLoadException(timeout, condition)
+
+    def _install_network_tracker(self) -> None:
+        """Registers the fetch/XHR tracker for every new document on Chromium-based drivers, once per session."""
+        if self._network_tracker_installed or self.browser_type != "chrome":
+            return
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_SCRIPT}
+            )
+            self._network_tracker_installed = True
+        except WebDriverException as e:
+            self.logger.debug(
+                "Could not register the network tracker for new documents. Error: %s", e
+            )
+
+    def _apply_resource_blocking(self) -> None:
+        """
+        Blocks the configured resources in the focused tab through CDP `Network.setBlockedURLs` on Chromium-based
+        drivers. The blocklist is kept per tab, so it is applied again when switching to a new tab. Firefox blocks
+        them through the preferences set at launch instead.
+        """
+        patterns = blocked_url_patterns(self.block_resources, self.block_urls)
+        if not patterns or self.browser_type != "chrome":
+            return
+        self.logger.debug("Blocking %s URL patterns.", len(patterns))
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def _route_windows(self) -> WindowFocus:
+        """
+        Starts tracking the focused window of the session, routing the controller commands to the window it works on.
+        Done once, when the first tab is opened.
+        """
+        if self._window_focus is None:
+            self._window_focus = WindowFocus(self.driver.current_window_handle)
+            route_driver(self.driver, self._window_focus)
+        return self._window_focus
+
+    def _script_wait_slice(self, remaining: float, quiet_time: float = 0) -> float:
+        """
+        Returns how long one in-page wait script may run. Once the session is shared with tabs or browser contexts,
+        a script holds the session for every window until it returns, so waits are split into scripts of at most
+        `SHARED_SESSION_WAIT_SLICE` seconds (plus the quiet time the script needs).
+        """
+        if self._window_focus is None:
+            return remaining
+        return min(remaining, quiet_time + SHARED_SESSION_WAIT_SLICE)
+
+    def _ensure_script_timeout(self, seconds: float) -> None:
+        """Raises the driver script timeout to at least `seconds`, skipping the call when it is already high enough."""
+        if self._script_timeout is None or self._script_timeout < seconds:
+            self.driver.set_script_timeout(seconds)
+            self._script_timeout = seconds
+
+    def _wait_with_polling(self, xpath: str, condition: str, timeout: float) -> Any:
+        """
+        Waits for the condition with WebDriverWait, polling the browser every 500 ms.
+        """
+        return WebDriverWait(self.driver, timeout).until(
+            POLLING_CONDITIONS[condition](locator_to_by(xpath))
+        )
+
+    def _wait_with_observer(self, xpath: str, condition: str, timeout: float) -> Any:
+        """
+        Waits for the condition inside the page with a MutationObserver, using a single async script call (one per
+        `_script_wait_slice` on shared sessions).
 
+        Falls back to polling for the remaining time if the script cannot complete, e.g. when the page
+        navigates while the observer is installed.
+
+        Raises:
+            TimeoutException: If the condition is not met within the given time.
+        """
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while True:
+            wait = self._script_wait_slice(remaining)
+            self._ensure_script_timeout(wait + 5)
+            try:
+                result = self.driver.execute_async_script(
+                    MUTATION_WAIT_SCRIPT, xpath, condition, int(wait * 1000)
+                )
+            except TimeoutException:
+                raise
+            except WebDriverException as e:
+                remaining = max(deadline - time.monotonic(), 0)
+                self.logger.debug(
+                    "Observer wait for '%s' interrupted (%s), polling for the remaining %.2fs.",
+                    xpath,
+                    e.msg,
+                    remaining,
+                )
+                return self._wait_with_polling(xpath, condition, remaining)
+
+            if result is not None:
+                return result
+            if wait >= remaining:
+                raise TimeoutException(
+                    f"Element with XPath '{xpath}' did not become {condition} within {timeout} seconds."
+                )
+            remaining = max(deadline - time.monotonic(), 0)
+
+    def _launch_driver(self, paths: DriverPaths) -> "WebDriver":
+        """
+        Starts a browser session with the given browser and driver paths. Chrome sessions attach to the shared
+        chromedriver process when `config.shared_driver_service` is enabled instead of spawning their own.
+        """
+        self.logger.debug("Launch profile: %s", self.launch_profile.name)
         if self.browser_type == "firefox":
-            op = webdriver.FirefoxProfile()
-            op.set_preference("detach", not self.kill_browser)
-            options = webdriver.firefox.options.Options()
-            options.binary_location = firefox_bin
+            # Preferences are set on the options instead of a FirefoxProfile, which would be zipped and uploaded to
+            # geckodriver on every launch.
+            options = webdriver.FirefoxOptions()
+            if paths.browser_path:
+                options.binary_location = paths.browser_path
+            options.page_load_strategy = self.launch_profile.page_load_strategy
             if self.headless:
                 options.add_argument("--headless")
+            preferences = self.launch_profile.firefox_launch_preferences(self._cache_directory)
+            preferences.update(firefox_preferences(self.block_resources, self.block_urls))
+            for name, value in preferences.items():
+                options.set_preference(name, value)
+            if self.enable_bidi:
+                options.set_capability("webSocketUrl", True)
 
-            firefox_service = FirefoxService(executable_path=firefox_driver_bin)
-            driver = webdriver.Firefox(service=firefox_service, options=options)
+            firefox_service = webdriver.FirefoxService(executable_path=paths.driver_path)
+            return webdriver.Firefox(service=firefox_service, options=options)
 
-        elif self.browser_type == "chrome":
+        if self.browser_type == "chrome":
             chrome_options = webdriver.ChromeOptions()
-            chrome_options.binary_location = chrome_bin
+            if paths.browser_path:
+                chrome_options.binary_location = paths.browser_path
             chrome_options.add_experimental_option("detach", not self.kill_browser)
+            chrome_options.page_load_strategy = self.launch_profile.page_load_strategy
             if self.headless:
                 chrome_options.add_argument("--headless")
+            for argument in self.launch_profile.chrome_launch_arguments(self._cache_directory):
+                chrome_options.add_argument(argument)
+            preferences = chrome_preferences(self.block_resources)
+            if preferences:
+                chrome_options.add_experimental_option("prefs", preferences)
+            if self.enable_bidi:
+                chrome_options.set_capability("webSocketUrl", True)
+
+            chrome_service = None
+            if config.shared_driver_service:
+                chrome_service = shared_driver_service("chrome", paths.driver_path)
+            if chrome_service is None:
+                chrome_service = webdriver.ChromeService(executable_path=paths.driver_path)
+            return webdriver.Chrome(service=chrome_service, options=chrome_options)
+
+        raise ValueError(f"Unsupported browser type: {self.browser_type}")
+
+    def _launch_with_cached_paths(self) -> "WebDriver":
+        """Launches the browser with the resolved driver paths, resolving them again if cached ones fail."""
+        paths = resolve_driver_paths(self.browser_type)
+        try:
+            return self._launch_driver(paths)
+        except WebDriverException as e:
+            if not paths.cached:
+                raise
+            # The browser or driver was updated since the paths were cached; resolve them again once.
+            self.logger.warning(
+                "Launch with cached driver paths failed, resolving them again. Error: %s", e.msg
+            )
+            return self._launch_driver(resolve_driver_paths(self.browser_type, refresh=True))
+
+    def _initialize_driver(self) -> "WebDriver":
+        """
+        Initializes and returns a Selenium WebDriver instance based on the specified browser configuration and
+        the launch profile selected through `config.browser_profile`.
 
-            chrome_service = ChromeService()
-            driver = webdriver.Chrome(service=chrome_service, options=chrome_options)
+        Returns:
+            WebDriver: The configured Selenium WebDriver instance.
 
-        else:
+        Raises:
+            ValueError: If the specified `browser_type` is not supported.
+        """
+        self.logger.debug("Init driver")
+        if self.browser_type not in ("chrome", "firefox"):
             raise ValueError(f"Unsupported browser type: {self.browser_type}")
 
+        if self.launch_profile.reuse_disk_cache:
+            self._cache_directory = claim_cache_directory(self.browser_type)
+        try:
+            driver = self._launch_with_cached_paths()
+        except Exception:
+            release_cache_directory(self._cache_directory)
+            raise
+
         if self.maximize:
             driver.maximize_window()
 
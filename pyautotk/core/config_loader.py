@@ -1,4 +1,10 @@
 import os
+import tempfile
+
+
+def _split_list(value: str) -> list:
+    """Splits a comma-separated environment value into its non-empty, stripped items."""
+    return [item.strip() for item in value.split(",") if item.strip()]
 
 
 class _ConfigLoader:
@@ -16,6 +22,60 @@ class _ConfigLoader:
         self.maximize_browser = os.getenv("PYAUTOTK_MAXIMIZE_BROWSER", "False").lower() == "true"
         self.headless_mode = os.getenv("PYAUTOTK_HEADLESS_MODE", "False").lower() == "true"
         self.artifacts_path = os.getenv("PYAUTOTK_ARTIFACTS_PATH", "./logs")
+        self.snapshot_properties = (
+            os.getenv("PYAUTOTK_SNAPSHOT_PROPERTIES", "False").lower() == "true"
+        )
+        self.session_pool = os.getenv("PYAUTOTK_SESSION_POOL", "False").lower() == "true"
+        self.session_pool_max_uses = int(os.getenv("PYAUTOTK_SESSION_POOL_MAX_USES", "50"))
+        self.parallel_workers = int(
+            os.getenv("PYAUTOTK_PARALLEL_WORKERS", str(os.cpu_count() or 1))
+        )
+        self.wait_strategy = os.getenv("PYAUTOTK_WAIT_STRATEGY", "polling")
+        self.element_cache = os.getenv("PYAUTOTK_ELEMENT_CACHE", "False").lower() == "true"
+        self.async_workers = int(os.getenv("PYAUTOTK_ASYNC_WORKERS", "32"))
+        self.browser_engine = os.getenv("PYAUTOTK_BROWSER_ENGINE", "selenium")
+        self.locator_cache_size = int(os.getenv("PYAUTOTK_LOCATOR_CACHE_SIZE", "1024"))
+        self.prefer_css_selectors = (
+            os.getenv("PYAUTOTK_PREFER_CSS_SELECTORS", "False").lower() == "true"
+        )
+        self.profile = os.getenv("PYAUTOTK_PROFILE", "False").lower() == "true"
+        self.profile_output = os.getenv("PYAUTOTK_PROFILE_OUTPUT", "")
+        self.log_queue = os.getenv("PYAUTOTK_LOG_QUEUE", "False").lower() == "true"
+        self.log_json_path = os.getenv("PYAUTOTK_LOG_JSON_PATH", "")
+        self.log_json_batch_size = int(os.getenv("PYAUTOTK_LOG_JSON_BATCH_SIZE", "100"))
+        self.log_json_flush_interval = float(os.getenv("PYAUTOTK_LOG_JSON_FLUSH_INTERVAL", "1.0"))
+        self.block_resources = _split_list(os.getenv("PYAUTOTK_BLOCK_RESOURCES", ""))
+        self.block_urls = _split_list(os.getenv("PYAUTOTK_BLOCK_URLS", ""))
+        self.browser_profile = os.getenv("PYAUTOTK_BROWSER_PROFILE", "default")
+        self.page_load_strategy = os.getenv("PYAUTOTK_PAGE_LOAD_STRATEGY", "")
+        self.browser_cache_dir = os.getenv(
+            "PYAUTOTK_BROWSER_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "pyautotk-browser-cache"),
+        )
+        self.driver_cache_path = os.getenv(
+            "PYAUTOTK_DRIVER_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "pyautotk", "driver_paths.json"),
+        )
+        self.shared_driver_service = (
+            os.getenv("PYAUTOTK_SHARED_DRIVER_SERVICE", "False").lower() == "true"
+        )
+        self.browser_contexts = os.getenv("PYAUTOTK_BROWSER_CONTEXTS", "False").lower() == "true"
+        self.contexts_per_browser = int(os.getenv("PYAUTOTK_CONTEXTS_PER_BROWSER", "8"))
+        self.session_state_ttl = float(os.getenv("PYAUTOTK_SESSION_STATE_TTL", "3600"))
+        self.locator_healing = os.getenv("PYAUTOTK_LOCATOR_HEALING", "False").lower() == "true"
+        self.locator_index_path = os.getenv(
+            "PYAUTOTK_LOCATOR_INDEX_PATH", os.path.join(self.artifacts_path, "locator_index.json")
+        )
+        self.locator_probe_timeout = float(os.getenv("PYAUTOTK_LOCATOR_PROBE_TIMEOUT", "1.0"))
+        self.adaptive_timeouts = os.getenv("PYAUTOTK_ADAPTIVE_TIMEOUTS", "False").lower() == "true"
+        self.wait_history_path = os.getenv(
+            "PYAUTOTK_WAIT_HISTORY_PATH", os.path.join(self.artifacts_path, "wait_history.json")
+        )
+        self.adaptive_timeout_percentile = float(
+            os.getenv("PYAUTOTK_ADAPTIVE_TIMEOUT_PERCENTILE", "95")
+        )
+        self.adaptive_timeout_margin = float(os.getenv("PYAUTOTK_ADAPTIVE_TIMEOUT_MARGIN", "1.0"))
+        self.adaptive_timeout_max = float(os.getenv("PYAUTOTK_ADAPTIVE_TIMEOUT_MAX", "60"))
 
     def __repr__(self):
         """
@@ -24,7 +84,24 @@ class _ConfigLoader:
         return (
             f"ConfigLoader(log_level='{self.log_level}', browser_type='{self.browser_type}', "
             f"maximize_browser={self.maximize_browser}, headless_mode={self.headless_mode}, "
-            f"artifacts_path='{self.artifacts_path}')"
+            f"artifacts_path='{self.artifacts_path}', snapshot_properties={self.snapshot_properties}, "
+            f"session_pool={self.session_pool}, session_pool_max_uses={self.session_pool_max_uses}, "
+            f"parallel_workers={self.parallel_workers}, wait_strategy='{self.wait_strategy}', "
+            f"element_cache={self.element_cache}, async_workers={self.async_workers}, "
+            f"browser_engine='{self.browser_engine}', locator_cache_size={self.locator_cache_size}, "
+            f"prefer_css_selectors={self.prefer_css_selectors}, profile={self.profile}, "
+            f"profile_output='{self.profile_output}', log_queue={self.log_queue}, "
+            f"log_json_path='{self.log_json_path}', log_json_batch_size={self.log_json_batch_size}, "
+            f"log_json_flush_interval={self.log_json_flush_interval}, block_resources={self.block_resources}, "
+            f"block_urls={self.block_urls}, browser_profile='{self.browser_profile}', "
+            f"page_load_strategy='{self.page_load_strategy}', browser_cache_dir='{self.browser_cache_dir}', "
+            f"driver_cache_path='{self.driver_cache_path}', shared_driver_service={self.shared_driver_service}, "
+            f"browser_contexts={self.browser_contexts}, contexts_per_browser={self.contexts_per_browser}, "
+            f"session_state_ttl={self.session_state_ttl}, locator_healing={self.locator_healing}, "
+            f"locator_index_path='{self.locator_index_path}', locator_probe_timeout={self.locator_probe_timeout}, "
+            f"adaptive_timeouts={self.adaptive_timeouts}, wait_history_path='{self.wait_history_path}', "
+            f"adaptive_timeout_percentile={self.adaptive_timeout_percentile}, "
+            f"adaptive_timeout_margin={self.adaptive_timeout_margin}, adaptive_timeout_max={self.adaptive_timeout_max})"
         )
 
 
@@ -0,0 +1,61 @@
+from typing import Any, List
+
+from pyautotk.core.config_loader import config
+
+BROWSER_ENGINES = ("selenium", "playwright")
+
+
+def create_controller(
+    browser_type: str = "",
+    maximize: bool = False,
+    headless: bool = False,
+    kill_browser: bool = True,
+    engine: str = "",
+    block_resources: List[str] = None,
+    block_urls: List[str] = None,
+) -> Any:
+    """
+    Creates the browser controller for the selected automation engine.
+
+    Args:
+        browser_type (str): The type of browser to use. Supported values: 'firefox' and 'chrome'.
+        maximize (bool): Whether to maximize the browser window on startup. Default is False.
+        headless (bool): Whether to run the browser in headless mode. Default is False.
+        kill_browser (bool): Whether the browser is closed when the session ends. Default is True.
+        engine (str): 'selenium' or 'playwright'. Defaults to `config.browser_engine`.
+        block_resources (List[str]): Resource types the browser never downloads. Defaults to `config.block_resources`.
+        block_urls (List[str]): URL patterns the browser never downloads. Defaults to `config.block_urls`.
+
+    Returns:
+        Any: A BrowserController or PlaywrightBrowserController; both expose the same XPath-based API.
+
+    Raises:
+        ValueError: If the engine is not one of `BROWSER_ENGINES`.
+    """
+    engine = (engine or config.browser_engine).lower()
+    # Engines are imported here so only the selected one (Selenium or Playwright) is ever loaded.
+    if engine == "selenium":
+        from pyautotk.core.browser_controller import BrowserController
+
+        return BrowserController(
+            browser_type=browser_type,
+            maximize=maximize,
+            headless=headless,
+            kill_browser=kill_browser,
+            block_resources=block_resources,
+            block_urls=block_urls,
+        )
+    if engine == "playwright":
+        from pyautotk.core.playwright_controller import PlaywrightBrowserController
+
+        return PlaywrightBrowserController(
+            browser_type=browser_type,
+            maximize=maximize,
+            headless=headless,
+            kill_browser=kill_browser,
+            block_resources=block_resources,
+            block_urls=block_urls,
+        )
+    raise ValueError(
+        f"Unsupported browser engine: {engine}. Supported values: {', '.join(BROWSER_ENGINES)}"
+    )
@@ -0,0 +1,230 @@
+import atexit
+import os
+import threading
+from dataclasses import dataclass
+from platform import system
+from typing import Any, Dict, Optional, Tuple
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.json_files import read_json, write_json
+from pyautotk.core.logger_utils import initialize_logger
+
+FIREFOX_BIN_LINUX = os.path.join("/snap", "firefox", "current", "usr", "lib", "firefox", "firefox")
+FIREFOXDRIVE_BIN_LINUX = os.path.join(
+    "/snap", "firefox", "current", "usr", "lib", "firefox", "geckodriver"
+)
+CHROME_BIN_LINUX = os.path.join("/usr", "bin", "google-chrome")
+
+FIREFOX_BIN_WINDOWS = os.path.join("C:\\", "Program Files", "Mozilla Firefox", "firefox.exe")
+CHROME_BIN_WINDOWS = os.path.join(
+    "C:\\", "Program Files", "Google", "Chrome", "Application", "chrome.exe"
+)
+
+# Preferred install locations, used when they exist; anything else is resolved by Selenium Manager.
+KNOWN_BROWSER_PATHS = {
+    ("chrome", "Windows"): CHROME_BIN_WINDOWS,
+    ("firefox", "Windows"): FIREFOX_BIN_WINDOWS,
+    ("chrome", "Linux"): CHROME_BIN_LINUX,
+    ("firefox", "Linux"): FIREFOX_BIN_LINUX,
+}
+KNOWN_DRIVER_PATHS = {
+    ("firefox", "Linux"): FIREFOXDRIVE_BIN_LINUX,
+}
+
+# Driver processes that can serve several sessions at once; geckodriver only supports one session per process.
+SHAREABLE_DRIVERS = ("chrome",)
+
+_lock = threading.RLock()
+_shared_services: Dict[Tuple[str, str], "SharedDriverService"] = {}
+logger = initialize_logger("DriverServices")
+
+
+@dataclass
+class DriverPaths:
+    """
+    Resolved browser binary and driver executable of a browser type. An empty `browser_path` lets the driver
+    pick its default browser.
+    """
+
+    browser_path: str
+    driver_path: str
+    cached: bool = False
+
+
+def resolve_driver_paths(browser_type: str, refresh: bool = False) -> DriverPaths:
+    """
+    Returns the browser and driver paths of a browser type, read from the on-disk cache
+    (`config.driver_cache_path`) when the cached files still exist. Otherwise the known install locations are
+    checked and Selenium Manager resolves the rest, and the result is written back to the cache.
+
+    Args:
+        browser_type (str): 'chrome' or 'firefox'.
+        refresh (bool): Whether to ignore the cached entry and resolve the paths again. Default is False.
+
+    Returns:
+        DriverPaths: The resolved paths.
+    """
+    key = f"{browser_type}|{system()}"
+    with _lock:
+        cache = _read_cache()
+        entry = cache.get(key)
+        if not refresh and entry and _is_valid(entry):
+            return DriverPaths(entry["browser_path"], entry["driver_path"], cached=True)
+
+        paths = _discover(browser_type)
+        cache[key] = {"browser_path": paths.browser_path, "driver_path": paths.driver_path}
+        _write_cache(cache)
+        logger.debug(
+            "Resolved %s paths: browser=%s driver=%s",
+            browser_type,
+            paths.browser_path,
+            paths.driver_path,
+        )
+        return paths
+
+
+def _discover(browser_type: str) -> DriverPaths:
+    os_type = system()
+    browser_path = KNOWN_BROWSER_PATHS.get((browser_type, os_type), "")
+    browser_path = browser_path if os.path.isfile(browser_path) else ""
+    driver_path = KNOWN_DRIVER_PATHS.get((browser_type, os_type), "")
+    if os.path.isfile(driver_path):
+        return DriverPaths(browser_path, driver_path)
+
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+    arguments = ["--browser", browser_type]
+    if browser_path:
+        arguments += ["--browser-path", browser_path]
+    output = SeleniumManager().binary_paths(arguments)
+    return DriverPaths(browser_path or output.get("browser_path", ""), output["driver_path"])
+
+
+def _is_valid(entry: Dict[str, str]) -> bool:
+    browser_path = entry.get("browser_path", "")
+    return os.path.isfile(entry.get("driver_path", "")) and (
+        not browser_path or os.path.isfile(browser_path)
+    )
+
+
+def _read_cache() -> Dict[str, Dict[str, str]]:
+    cache = read_json(config.driver_cache_path, {})
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache: Dict[str, Dict[str, str]]) -> None:
+    path = config.driver_cache_path
+    try:
+        write_json(path, cache)
+    except OSError as e:
+        logger.warning("Could not write the driver path cache %s. Error: %s", path, e)
+
+
+class SharedDriverService:
+    """
+    Stands in for a Selenium Service so several WebDriver sessions attach to one long-lived driver process.
+    The process is started by the first session (or `start`) and kept running when sessions quit; it is
+    stopped by `shutdown_driver_services` at interpreter exit.
+    """
+
+    def __init__(self, service: Any) -> None:
+        """
+        Args:
+            service (Any): The Selenium Service (e.g. ChromeService) whose process is shared.
+        """
+        self._service = service
+        self._start_lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._service.path
+
+    @path.setter
+    def path(self, value: str) -> None:
+        self._service.path = value
+
+    @property
+    def service_url(self) -> str:
+        return self._service.service_url
+
+    def env_path(self) -> str:
+        return self._service.path
+
+    def is_running(self) -> bool:
+        process = getattr(self._service, "process", None)
+        return process is not None and process.poll() is None
+
+    def start(self) -> None:
+        """Starts the driver process unless it is already running."""
+        with self._start_lock:
+            if not self.is_running():
+                logger.info("Starting shared driver service: %s", self._service.path)
+                self._service.start()
+
+    def stop(self) -> None:
+        """Called by WebDriver.quit; the shared process outlives the session."""
+
+    def shutdown(self) -> None:
+        """Stops the driver process."""
+        with self._start_lock:
+            if self.is_running():
+                self._service.stop()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
+
+
+def shared_driver_service(browser_type: str, driver_path: str) -> Optional[SharedDriverService]:
+    """
+    Returns the shared driver service of a browser type and driver executable, creating it on first use.
+
+    Args:
+        browser_type (str): 'chrome' or 'firefox'.
+        driver_path (str): The driver executable.
+
+    Returns:
+        Optional[SharedDriverService]: The shared service, or None if the driver cannot serve several sessions.
+    """
+    if browser_type not in SHAREABLE_DRIVERS:
+        return None
+    with _lock:
+        service = _shared_services.get((browser_type, driver_path))
+        if service is None:
+            from selenium import webdriver
+
+            service = _shared_services[(browser_type, driver_path)] = SharedDriverService(
+                webdriver.ChromeService(executable_path=driver_path)
+            )
+        return service
+
+
+def prewarm_driver_services(*browser_types: str) -> None:
+    """
+    Resolves the paths and, when `config.shared_driver_service` is enabled, starts the shared driver processes
+    ahead of the first session, e.g. while a test suite is being collected.
+
+    Args:
+        *browser_types (str): Browser types to prepare. Defaults to `config.browser_type`.
+    """
+    for browser_type in browser_types or (config.browser_type,):
+        paths = resolve_driver_paths(browser_type)
+        if not config.shared_driver_service:
+            continue
+        service = shared_driver_service(browser_type, paths.driver_path)
+        if service is not None:
+            service.start()
+
+
+def shutdown_driver_services() -> None:
+    """Stops every shared driver process. Registered to run at interpreter exit."""
+    with _lock:
+        services = list(_shared_services.values())
+        _shared_services.clear()
+    for service in services:
+        try:
+            service.shutdown()
+        except Exception as e:
+            logger.warning("Could not stop shared driver service. Error: %s", e)
+
+
+atexit.register(shutdown_driver_services)
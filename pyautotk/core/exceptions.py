@@ -102,8 +102,42 @@ class WidgetExtractionException(WidgetException):
 
 class BrowserWaitForPageLoadException(WidgetException):
     """
-    Exception raised when the page does not load within the specified timeout.
+    Exception raised when the page does not load, or does not settle (network idle, stable DOM), within the
+    specified timeout.
     """
-    def __init__(self, timeout: int):
-        message = f"Page did not load completely within {timeout} seconds."
+
+    def __init__(self, timeout: int, condition: str = "ready"):
+        self.timeout = timeout
+        self.condition = condition
+        if condition == "ready":
+            message = f"Page did not load completely within {timeout} seconds."
+        else:
+            message = f"Page did not reach the '{condition}' state within {timeout} seconds."
+        super().__init__(message)
+
+
+class BatchActionException(WidgetException):
+    """
+    Exception raised when one or more operations of an action batch fail.
+    """
+
+    def __init__(self, failures: list):
+        self.failures = failures
+        details = "; ".join(
+            f"{failure.action} on '{failure.xpath}': {failure.error}" for failure in failures
+        )
+        message = f"{len(failures)} batched operation(s) failed. {details}"
         super().__init__(message)
+
+
+class UnsupportedEngineException(Exception):
+    """
+    Exception raised when a feature is not available on the browser engine of the session.
+    """
+
+    def __init__(self, feature: str, engine: str):
+        self.feature = feature
+        self.engine = engine
+        super().__init__(
+            f"{feature} is not supported on the '{engine}' engine. Use a Selenium session (PYAUTOTK_BROWSER_ENGINE=selenium)."
+        )
@@ -1,8 +1,68 @@
+from contextlib import contextmanager
+import re
+from typing import Any, Iterator, List, Optional
+
 from selenium.webdriver import ActionChains
+from selenium.webdriver.common.actions.mouse_button import MouseButton
+from selenium.webdriver.common.actions.wheel_input import ScrollOrigin
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+MOUSE_BUTTONS = {
+    "left": MouseButton.LEFT,
+    "middle": MouseButton.MIDDLE,
+    "right": MouseButton.RIGHT,
+    "back": MouseButton.BACK,
+    "forward": MouseButton.FORWARD,
+}
+
+KEY_NAMES = {
+    "ctrl": Keys.CONTROL,
+    "control": Keys.CONTROL,
+    "shift": Keys.SHIFT,
+    "alt": Keys.ALT,
+    "option": Keys.ALT,
+    "meta": Keys.META,
+    "cmd": Keys.COMMAND,
+    "command": Keys.COMMAND,
+    "enter": Keys.ENTER,
+    "return": Keys.RETURN,
+    "escape": Keys.ESCAPE,
+    "esc": Keys.ESCAPE,
+    "tab": Keys.TAB,
+    "space": Keys.SPACE,
+    "backspace": Keys.BACKSPACE,
+    "delete": Keys.DELETE,
+    "insert": Keys.INSERT,
+    "home": Keys.HOME,
+    "end": Keys.END,
+    "page_up": Keys.PAGE_UP,
+    "page_down": Keys.PAGE_DOWN,
+    "up": Keys.ARROW_UP,
+    "down": Keys.ARROW_DOWN,
+    "left": Keys.ARROW_LEFT,
+    "right": Keys.ARROW_RIGHT,
+    "arrow_up": Keys.ARROW_UP,
+    "arrow_down": Keys.ARROW_DOWN,
+    "arrow_left": Keys.ARROW_LEFT,
+    "arrow_right": Keys.ARROW_RIGHT,
+    **{f"f{number}": getattr(Keys, f"F{number}") for number in range(1, 13)},
+}
+
+# Key script tokens: a double- or single-quoted text run, or any other whitespace-separated token.
+KEY_SCRIPT_TOKEN = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\S+)')
+
 
 class KeyboardController:
+    """
+    Sends key presses to the browser. Single keys can be pressed directly with the `press_*` methods; longer
+    sequences are queued with the chainable methods (`tap`, `chord`, `type_text`, `hold`, `release`, `pause`,
+    `sequence`) and sent as a single W3C Actions request by `perform`:
+
+        KeyboardController(driver).sequence("ctrl+a 'new value' tab*2 enter").perform()
+    """
+
     def __init__(self, session_driver: WebDriver) -> None:
         """
         Initializes the Keyboard helper with an active WebDriver session.
@@ -10,7 +70,13 @@ class KeyboardController:
         Args:
             session_driver (WebDriver): The active WebDriver instance.
         """
-        self._actions = ActionChains(session_driver)
+        self._driver = session_driver
+        self._actions = ActionChains(session_driver, duration=0)
+        self.held: List[str] = []
+
+    @property
+    def _keys(self) -> Any:
+        return self._actions.w3c_actions.key_action
 
     def send_keys(self, key: str) -> None:
         """
@@ -19,7 +85,136 @@ class KeyboardController:
         Args:
             key (str): The key to be pressed.
         """
-        self._actions.send_keys(key).perform()
+        self.tap(key).perform()
+
+    def tap(self, key: str, times: int = 1) -> "KeyboardController":
+        """
+        Queues pressing and releasing a key.
+
+        Args:
+            key (str): A key name from `KEY_NAMES`, a single character or a `Keys` constant.
+            times (int): Number of presses. Default is 1.
+        """
+        return self.chord(key, times=times)
+
+    def chord(self, *keys: str, times: int = 1) -> "KeyboardController":
+        """
+        Queues a key combination: the keys are pressed in order and released in reverse order, so modifiers are
+        held while the last key is pressed (e.g. `chord("ctrl", "shift", "k")`).
+
+        Args:
+            *keys (str): Key names from `KEY_NAMES`, single characters or `Keys` constants.
+            times (int): Number of times the combination is pressed. Default is 1.
+        """
+        resolved = [resolve_key(key) for key in keys]
+        for _ in range(times):
+            for key in resolved:
+                self._keys.key_down(key)
+            for key in reversed(resolved):
+                self._keys.key_up(key)
+        return self
+
+    def type_text(self, text: str) -> "KeyboardController":
+        """
+        Queues typing a text run, one press per character.
+
+        Args:
+            text (str): The text to type.
+        """
+        self._keys.send_keys(text)
+        return self
+
+    def hold(self, *keys: str) -> "KeyboardController":
+        """
+        Queues pressing keys without releasing them. Held keys stay down across `perform` calls until
+        `release` or `release_all`, so they also apply to keys sent later.
+
+        Args:
+            *keys (str): Key names from `KEY_NAMES`, single characters or `Keys` constants.
+        """
+        for key in keys:
+            resolved = resolve_key(key)
+            if resolved not in self.held:
+                self._keys.key_down(resolved)
+                self.held.append(resolved)
+        return self
+
+    def release(self, *keys: str) -> "KeyboardController":
+        """
+        Queues releasing keys pressed with `hold`.
+
+        Args:
+            *keys (str): Key names from `KEY_NAMES`, single characters or `Keys` constants.
+        """
+        for key in keys:
+            resolved = resolve_key(key)
+            if resolved in self.held:
+                self._keys.key_up(resolved)
+                self.held.remove(resolved)
+        return self
+
+    def pause(self, seconds: float) -> "KeyboardController":
+        """
+        Adds a pause inside the sequence, executed by the browser rather than with a client-side sleep.
+
+        Args:
+            seconds (float): The pause duration in seconds.
+        """
+        self._keys.pause(seconds)
+        return self
+
+    def sequence(self, script: str) -> "KeyboardController":
+        """
+        Queues the steps of a key script. Tokens are separated by whitespace:
+
+        - `enter`, `a`: tap a key.
+        - `ctrl+shift+k`: press a chord.
+        - `down*50`, `ctrl+z*3`: repeat a key or chord.
+        - `'some text'` or `"some text"`: type a text run.
+        - `hold:shift`, `release:shift`: hold or release keys (`hold:ctrl+shift` for several).
+        - `pause:0.5`: pause, in seconds.
+
+        Args:
+            script (str): The key script.
+
+        Raises:
+            ValueError: If the script contains an unknown key name or a malformed token.
+        """
+        for match in KEY_SCRIPT_TOKEN.finditer(script):
+            double_quoted, single_quoted, token = match.groups()
+            if token is None:
+                self.type_text(double_quoted if double_quoted is not None else single_quoted)
+                continue
+            command, _, argument = token.partition(":")
+            if argument and command == "hold":
+                self.hold(*argument.split("+"))
+            elif argument and command == "release":
+                self.release(*argument.split("+"))
+            elif argument and command == "pause":
+                self.pause(float(argument))
+            else:
+                keys, _, times = token.rpartition("*") if "*" in token[1:] else (token, "", "1")
+                if not times.isdigit():
+                    raise ValueError(f"Invalid repeat count in key script token: {token}")
+                self.chord(*_split_chord(keys), times=int(times))
+        return self
+
+    def perform(self) -> None:
+        """
+        Sends every queued key action in one W3C Actions request and starts a new, empty sequence.
+        """
+        try:
+            if self._keys.source.actions:
+                self._actions.perform()
+        finally:
+            self._actions = ActionChains(self._driver, duration=0)
+
+    def release_all(self) -> None:
+        """Releases every key held with `hold` (or `press_control`, `press_shift`, `press_alt`) right away."""
+        for key in reversed(self.held):
+            self._keys.key_up(key)
+        self.held.clear()
+        self.perform()
 
     def press_enter(self) -> None:
         """Simulates pressing the Enter key."""
@@ -62,16 +257,16 @@ class KeyboardController:
         self.send_keys(Keys.SPACE)
 
     def press_control(self) -> None:
-        """Simulates pressing the Control key."""
-        self.send_keys(Keys.CONTROL)
+        """Holds the Control key down, so it modifies the keys sent next, until `release_all` is called."""
+        self.hold(Keys.CONTROL).perform()
 
     def press_shift(self) -> None:
-        """Simulates pressing the Shift key."""
-        self.send_keys(Keys.SHIFT)
+        """Holds the Shift key down, so it modifies the keys sent next, until `release_all` is called."""
+        self.hold(Keys.SHIFT).perform()
 
     def press_alt(self) -> None:
-        """Simulates pressing the Alt key."""
-        self.send_keys(Keys.ALT)
+        """Holds the Alt key down, so it modifies the keys sent next, until `release_all` is called."""
+        self.hold(Keys.ALT).perform()
 
     def press_function_key(self, function_key: int) -> None:
         """
@@ -86,6 +281,228 @@ class KeyboardController:
             raise ValueError("Function key must be between 1 and 12.")
 
 
+def resolve_key(key: str) -> str:
+    """
+    Returns the WebDriver key value of a key name, single character or `Keys` constant.
+
+    Args:
+        key (str): The key to resolve, e.g. 'ctrl', 'page_down', 'f5', 'a' or `Keys.ENTER`.
+
+    Returns:
+        str: The character sent in the W3C key action.
+
+    Raises:
+        ValueError: If the key name is unknown.
+    """
+    if len(key) == 1:
+        return key
+    try:
+        return KEY_NAMES[key.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown key: {key}. Use a single character or one of: {', '.join(KEY_NAMES)}"
+        )
+
+
+def _split_chord(keys: str) -> List[str]:
+    # A '+' next to another '+' (or alone) is the plus key itself, e.g. "ctrl++" or "+".
+    parts = keys.split("+")
+    chord, index = [], 0
+    while index < len(parts):
+        part = parts[index]
+        if part == "" and index + 1 < len(parts):
+            chord.append("+")
+            index += 2
+            continue
+        if part:
+            chord.append(part)
+        index += 1
+    return chord
+
+
 class MouseController:
-    def __init__(self):
-        pass
\ No newline at end of file
+    """
+    Builds pointer gestures and sends them to the browser as a single W3C Actions request.
+
+    Every gesture method queues its actions and returns the controller, so steps can be chained;
+    nothing is sent until `perform` is called:
+
+        MouseController(driver).move_to(source).press().move_by(120, 0).release().perform()
+    """
+
+    def __init__(self, session_driver: WebDriver, duration: int = 0) -> None:
+        """
+        Initializes the Mouse controller with an active WebDriver session.
+
+        Args:
+            session_driver (WebDriver): The active WebDriver instance.
+            duration (int): Duration in milliseconds of each pointer move. Default is 0, so moves are instantaneous
+                instead of Selenium's 250 ms animation.
+        """
+        self._driver = session_driver
+        self.duration = duration
+        self._actions = ActionChains(session_driver, duration=duration)
+
+    @property
+    def _pointer(self) -> Any:
+        return self._actions.w3c_actions.pointer_action
+
+    def move_to(
+        self, element: WebElement, x_offset: int = 0, y_offset: int = 0
+    ) -> "MouseController":
+        """
+        Moves the pointer to the element, optionally offset from its center.
+
+        Args:
+            element (WebElement): The element to move to.
+            x_offset (int): Horizontal offset from the center of the element, in pixels. Default is 0.
+            y_offset (int): Vertical offset from the center of the element, in pixels. Default is 0.
+        """
+        with self._step(self._pointer.source):
+            self._actions.move_to_element_with_offset(element, x_offset, y_offset)
+        return self
+
+    def move_by(self, x_offset: int, y_offset: int) -> "MouseController":
+        """
+        Moves the pointer by an offset from its current position.
+
+        Args:
+            x_offset (int): Horizontal offset in pixels.
+            y_offset (int): Vertical offset in pixels.
+        """
+        with self._step(self._pointer.source):
+            self._actions.move_by_offset(x_offset, y_offset)
+        return self
+
+    def press(
+        self, element: Optional[WebElement] = None, button: str = "left"
+    ) -> "MouseController":
+        """
+        Presses and holds a mouse button, on the element if given or at the current position.
+
+        Args:
+            element (Optional[WebElement]): The element to move to before pressing. Default is None.
+            button (str): One of `MOUSE_BUTTONS`. Default is 'left'.
+        """
+        if element is not None:
+            self.move_to(element)
+        with self._step(self._pointer.source):
+            self._pointer.pointer_down(self._button(button))
+        return self
+
+    def release(
+        self, element: Optional[WebElement] = None, button: str = "left"
+    ) -> "MouseController":
+        """
+        Releases a held mouse button, on the element if given or at the current position.
+
+        Args:
+            element (Optional[WebElement]): The element to move to before releasing. Default is None.
+            button (str): One of `MOUSE_BUTTONS`. Default is 'left'.
+        """
+        if element is not None:
+            self.move_to(element)
+        with self._step(self._pointer.source):
+            self._pointer.pointer_up(self._button(button))
+        return self
+
+    def click(
+        self, element: Optional[WebElement] = None, button: str = "left"
+    ) -> "MouseController":
+        """
+        Clicks a mouse button, on the element if given or at the current position.
+
+        Args:
+            element (Optional[WebElement]): The element to click. Default is None.
+            button (str): One of `MOUSE_BUTTONS`. Default is 'left'.
+        """
+        return self.press(element, button).release(button=button)
+
+    def double_click(self, element: Optional[WebElement] = None) -> "MouseController":
+        """
+        Double-clicks with the left button, so the page receives a real `dblclick` event.
+
+        Args:
+            element (Optional[WebElement]): The element to double-click. Default is None.
+        """
+        with self._step(self._pointer.source):
+            self._actions.double_click(element)
+        return self
+
+    def right_click(self, element: Optional[WebElement] = None) -> "MouseController":
+        """
+        Clicks with the right button, opening the context menu.
+
+        Args:
+            element (Optional[WebElement]): The element to right-click. Default is None.
+        """
+        with self._step(self._pointer.source):
+            self._actions.context_click(element)
+        return self
+
+    def scroll(
+        self, delta_x: int, delta_y: int, element: Optional[WebElement] = None
+    ) -> "MouseController":
+        """
+        Turns the mouse wheel, over the element if given or over the viewport.
+
+        Args:
+            delta_x (int): Horizontal scroll amount in pixels.
+            delta_y (int): Vertical scroll amount in pixels.
+            element (Optional[WebElement]): The element the wheel is turned over. Default is None.
+        """
+        with self._step(self._actions.w3c_actions.wheel_action.source):
+            if element is not None:
+                self._actions.scroll_from_origin(
+                    ScrollOrigin.from_element(element), delta_x, delta_y
+                )
+            else:
+                self._actions.scroll_by_amount(delta_x, delta_y)
+        return self
+
+    def pause(self, seconds: float) -> "MouseController":
+        """
+        Adds a pause inside the gesture, executed by the browser rather than with a client-side sleep.
+
+        Args:
+            seconds (float): The pause duration in seconds.
+        """
+        self._actions.pause(seconds)
+        return self
+
+    def perform(self) -> None:
+        """
+        Sends every queued action in one W3C Actions request and starts a new, empty gesture.
+        """
+        try:
+            self._actions.perform()
+        finally:
+            self._actions = ActionChains(self._driver, duration=self.duration)
+
+    @contextmanager
+    def _step(self, source: Any) -> Iterator[None]:
+        """
+        Keeps the input sources in lockstep around one gesture step. The browser runs W3C actions tick by tick
+        across sources, so every source that is used is padded with pauses to the same length; otherwise a
+        scroll queued after a click would run in the same tick as the first pointer move.
+        """
+        self._align(source)
+        yield
+        self._align()
+
+    def _align(self, *sources: Any) -> None:
+        devices = self._actions.w3c_actions.devices
+        ticks = max(len(device.actions) for device in devices)
+        for device in devices:
+            if device.actions or device in sources:
+                for _ in range(ticks - len(device.actions)):
+                    device.create_pause(0)
+
+    @staticmethod
+    def _button(button: str) -> int:
+        try:
+            return MOUSE_BUTTONS[button]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported mouse button: {button}. Supported values: {', '.join(MOUSE_BUTTONS)}"
+            )
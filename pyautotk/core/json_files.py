@@ -0,0 +1,100 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+# How long (in seconds) `update_json` waits for the lock file of another writer before giving up.
+LOCK_TIMEOUT = 10.0
+
+# Age (in seconds) after which a lock file is considered left behind by a crashed writer and removed.
+STALE_LOCK_AGE = 30.0
+
+
+def read_json(path: str, default: Any = None) -> Any:
+    """
+    Reads a JSON file.
+
+    Args:
+        path (str): The file to read.
+        default (Any): Returned when the file is missing, unreadable or not valid JSON. Default is None.
+
+    Returns:
+        Any: The decoded content, or `default`.
+    """
+    try:
+        with open(path, encoding="utf-8") as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path: str, data: Any, indent: Optional[int] = 2) -> None:
+    """
+    Writes data to a JSON file atomically, through a temporary file replaced in one step, so concurrent readers
+    (e.g. other worker processes) never see a partial file. Missing directories are created.
+
+    Args:
+        path (str): The destination file.
+        data (Any): The JSON-serializable data.
+        indent (Optional[int]): Indentation of the output, or None for a compact file. Default is 2.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=indent)
+    os.replace(temporary, path)
+
+
+def update_json(
+    path: str, update: Callable[[Any], Any], default: Any = None, indent: Optional[int] = 2
+) -> Any:
+    """
+    Reads a JSON file, passes its content to `update` and writes the result, holding a lock file in between so
+    concurrent writers (e.g. ParallelRunner worker processes) merge their changes instead of overwriting them.
+
+    Args:
+        path (str): The file to update.
+        update (Callable[[Any], Any]): Receives the current content (or `default`) and returns the new content.
+        default (Any): The content passed to `update` when the file is missing or not valid JSON. Default is None.
+        indent (Optional[int]): Indentation of the output, or None for a compact file. Default is 2.
+
+    Returns:
+        Any: The content that was written.
+
+    Raises:
+        OSError: If the lock cannot be acquired within `LOCK_TIMEOUT` seconds or the file cannot be written.
+    """
+    with _locked(path):
+        data = update(read_json(path, default))
+        write_json(path, data, indent)
+    return data
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[None]:
+    """Holds `<path>.lock`, created exclusively, removing lock files older than `STALE_LOCK_AGE`."""
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_AGE:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for the lock file {lock_path}")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.remove(lock_path)
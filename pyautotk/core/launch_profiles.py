@@ -0,0 +1,196 @@
+import itertools
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, List, Tuple
+
+from pyautotk.core.config_loader import config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+# Disk cache directories claimed by the running browsers of this process, with their open lock files.
+_claimed_lock = threading.Lock()
+_claimed: Dict[str, IO[str]] = {}
+
+# Chrome switches and Firefox preferences shared by the tuned profiles: no background throttling, no extensions,
+# no GPU process, and no smooth scrolling or animations.
+_CHROME_TUNING = (
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-gpu",
+    "--disable-smooth-scrolling",
+    "--force-prefers-reduced-motion",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-component-update",
+    "--disable-sync",
+    "--mute-audio",
+)
+
+_FIREFOX_TUNING = {
+    "dom.timeout.enable_budget_timer_throttling": False,
+    "dom.min_background_timeout_value": 4,
+    "extensions.update.enabled": False,
+    "extensions.getAddons.cache.enabled": False,
+    "app.update.auto": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "layers.acceleration.disabled": True,
+    "general.smoothScroll": False,
+    "ui.prefersReducedMotion": 1,
+    "toolkit.cosmeticAnimations.enabled": False,
+}
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """
+    A named set of launch options applied by the controllers when starting a browser.
+    """
+
+    name: str
+    page_load_strategy: str = "normal"
+    chrome_arguments: Tuple[str, ...] = ()
+    firefox_preferences: Dict[str, Any] = field(default_factory=dict)
+    # Whether browsers keep their disk cache across sessions, in a directory from `claim_cache_directory`.
+    reuse_disk_cache: bool = False
+
+    def chrome_launch_arguments(self, cache_directory: str = "") -> List[str]:
+        """Returns the Chrome switches of the profile, with the disk cache directory of the browser if given."""
+        arguments = list(self.chrome_arguments)
+        if cache_directory:
+            arguments.append(f"--disk-cache-dir={cache_directory}")
+        return arguments
+
+    def firefox_launch_preferences(self, cache_directory: str = "") -> Dict[str, Any]:
+        """Returns the Firefox preferences of the profile, with the disk cache directory of the browser if given."""
+        preferences = dict(self.firefox_preferences)
+        if cache_directory:
+            preferences["browser.cache.disk.parent_directory"] = cache_directory
+        return preferences
+
+
+LAUNCH_PROFILES = {
+    "default": LaunchProfile("default"),
+    "fast-ci": LaunchProfile(
+        "fast-ci",
+        page_load_strategy="eager",
+        chrome_arguments=_CHROME_TUNING,
+        firefox_preferences=dict(_FIREFOX_TUNING),
+        reuse_disk_cache=True,
+    ),
+    "low-memory": LaunchProfile(
+        "low-memory",
+        page_load_strategy="eager",
+        chrome_arguments=_CHROME_TUNING
+        + (
+            "--renderer-process-limit=2",
+            "--js-flags=--max-old-space-size=512",
+            "--disk-cache-size=1",
+            "--aggressive-cache-discard",
+        ),
+        firefox_preferences={
+            **_FIREFOX_TUNING,
+            "dom.ipc.processCount": 1,
+            "fission.autostart": False,
+            "browser.cache.memory.capacity": 32768,
+            "browser.sessionhistory.max_total_viewers": 0,
+            "browser.cache.disk.enable": False,
+        },
+    ),
+}
+
+
+def get_launch_profile(name: str = "") -> LaunchProfile:
+    """
+    Returns a launch profile by name, falling back to `config.browser_profile`. The page load strategy is
+    overridden by `config.page_load_strategy` when it is set.
+
+    Args:
+        name (str): One of `LAUNCH_PROFILES`. Defaults to `config.browser_profile`.
+
+    Returns:
+        LaunchProfile: The selected profile.
+
+    Raises:
+        ValueError: If the profile or the page load strategy is unknown.
+    """
+    name = (name or config.browser_profile).lower()
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(
+            f"Unsupported browser profile: {name}. Supported values: {', '.join(LAUNCH_PROFILES)}"
+        )
+    profile = LAUNCH_PROFILES[name]
+
+    strategy = config.page_load_strategy.lower()
+    if strategy:
+        if strategy not in PAGE_LOAD_STRATEGIES:
+            raise ValueError(
+                f"Unsupported page load strategy: {strategy}. Supported values: {', '.join(PAGE_LOAD_STRATEGIES)}"
+            )
+        profile = LaunchProfile(
+            profile.name,
+            strategy,
+            profile.chrome_arguments,
+            profile.firefox_preferences,
+            profile.reuse_disk_cache,
+        )
+    return profile
+
+
+def claim_cache_directory(browser_type: str) -> str:
+    """
+    Claims a disk cache directory under `config.browser_cache_dir` for one browser about to launch.
+
+    Two running browsers cannot use the same disk cache, so each one gets its own `slot-<n>` directory, held through
+    a lock on `slot-<n>.lock` until `release_cache_directory`. The operating system drops the lock when the process
+    exits, so the slots are reused by the next sessions and runs, which find the assets cached by earlier ones.
+
+    Args:
+        browser_type (str): 'chrome' or 'firefox'.
+
+    Returns:
+        str: The claimed directory.
+    """
+    root = os.path.join(config.browser_cache_dir, browser_type)
+    os.makedirs(root, exist_ok=True)
+    with _claimed_lock:
+        for slot in itertools.count():
+            path = os.path.join(root, f"slot-{slot}")
+            if path in _claimed:
+                continue
+            handle = open(f"{path}.lock", "a+")
+            if _try_lock(handle):
+                os.makedirs(path, exist_ok=True)
+                _claimed[path] = handle
+                return path
+            handle.close()
+
+
+def release_cache_directory(path: str) -> None:
+    """Releases a directory claimed by `claim_cache_directory` once its browser has quit. Other paths are ignored."""
+    with _claimed_lock:
+        handle = _claimed.pop(path, None)
+    if handle is not None:
+        handle.close()
+
+
+def _try_lock(handle: IO[str]) -> bool:
+    """Takes an exclusive lock on an open file without blocking; the lock is dropped when the file is closed."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,31 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the PEP 562 `__getattr__` and `__dir__` of a package whose public names are imported on first access.
+
+    Args:
+        package (str): The `__name__` of the package.
+        attributes (Dict[str, str]): Public names mapped to the module that defines them.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The module-level `__getattr__` and `__dir__`.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
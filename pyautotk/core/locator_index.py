@@ -0,0 +1,264 @@
+import atexit
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.json_files import read_json, update_json
+from pyautotk.core.locators import CSS_PREFIX
+from pyautotk.core.logger_utils import initialize_logger
+
+# Describes a located element by the properties its alternative locators are built from: id, a CSS path anchored
+# at the closest ancestor with an id, normalized text and aria-label.
+FINGERPRINT_SCRIPT = """
+    const el = arguments[0];
+    const path = [];
+    for (let node = el; node && node.nodeType === Node.ELEMENT_NODE; node = node.parentElement) {
+        if (node !== el && node.id) {
+            path.unshift('#' + CSS.escape(node.id));
+            break;
+        }
+        let index = 1;
+        for (let sibling = node.previousElementSibling; sibling; sibling = sibling.previousElementSibling) {
+            if (sibling.tagName === node.tagName) {
+                index++;
+            }
+        }
+        path.unshift(node.tagName.toLowerCase() + ':nth-of-type(' + index + ')');
+    }
+    return {
+        tag: el.tagName.toLowerCase(),
+        id: el.id || null,
+        css: path.join(' > '),
+        text: (el.textContent || '').trim().replace(/\\s+/g, ' '),
+        aria_label: el.getAttribute('aria-label'),
+    };
+"""
+
+# Longer texts are not used as locators; they change too often and make unreadable XPaths.
+MAX_TEXT_LENGTH = 80
+
+logger = initialize_logger("LocatorIndex")
+
+
+@dataclass
+class Alternative:
+    """
+    An alternative locator of an element and how often it found the element when the original locator missed.
+    """
+
+    kind: str
+    locator: str
+    hits: int = 0
+    tries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The smoothed hit rate, so alternatives that were never tried rank between reliable and failing ones."""
+        return (self.hits + 1) / (self.tries + 2)
+
+
+def page_key(url: str) -> str:
+    """Returns the index key of a page: its URL without query string and fragment."""
+    return urlsplit(url)._replace(query="", fragment="").geturl()
+
+
+def xpath_literal(value: str) -> str:
+    """Quotes a string for use in an XPath expression, including strings that contain both kinds of quotes."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ', "\'", '.join(f"'{part}'" for part in parts) + ")"
+
+
+def alternative_locators(fingerprint: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Builds the alternative locators of an element from its fingerprint.
+
+    Args:
+        fingerprint (Dict[str, Any]): The result of `FINGERPRINT_SCRIPT`.
+
+    Returns:
+        List[Tuple[str, str]]: (kind, locator) pairs for the 'id', 'aria-label', 'text' and 'css' alternatives.
+    """
+    alternatives = []
+    if fingerprint.get("id"):
+        alternatives.append(("id", f"//*[@id={xpath_literal(fingerprint['id'])}]"))
+    if fingerprint.get("aria_label"):
+        alternatives.append(
+            ("aria-label", f"//*[@aria-label={xpath_literal(fingerprint['aria_label'])}]")
+        )
+    text = fingerprint.get("text") or ""
+    if text and len(text) <= MAX_TEXT_LENGTH:
+        alternatives.append(
+            ("text", f"//{fingerprint['tag']}[normalize-space(.)={xpath_literal(text)}]")
+        )
+    if fingerprint.get("css"):
+        alternatives.append(("css", CSS_PREFIX + fingerprint["css"]))
+    return alternatives
+
+
+class LocatorIndex:
+    """
+    Alternative locators of the elements found on each page, with their hit rates, persisted as JSON so later runs
+    can recover from locators broken by layout changes without waiting for the full timeout.
+    """
+
+    def __init__(self, path: str = "") -> None:
+        """
+        Args:
+            path (str): The JSON file of the index. Defaults to `config.locator_index_path`.
+        """
+        self._path = path
+        self._pages: Dict[str, Dict[str, List[Alternative]]] = {}
+        # Changes since the last save, merged into the file by `save`: the alternatives recorded per (page, locator)
+        # and the [hits, tries] added per (page, locator, alternative).
+        self._recorded: Dict[Tuple[str, str], List[Alternative]] = {}
+        self._reported: Dict[Tuple[str, str, str], List[int]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path or config.locator_index_path
+
+    def alternatives(self, url: str, locator: str) -> List[Alternative]:
+        """
+        Returns the recorded alternatives of a locator on a page, best hit rate first.
+
+        Args:
+            url (str): The page URL.
+            locator (str): The original locator (XPath or `css=` selector).
+
+        Returns:
+            List[Alternative]: The alternatives, empty if the locator was never recorded.
+        """
+        with self._lock:
+            self._load()
+            alternatives = self._pages.get(page_key(url), {}).get(locator, [])
+            return sorted(alternatives, key=lambda alternative: alternative.hit_rate, reverse=True)
+
+    def has(self, url: str, locator: str) -> bool:
+        """Tells whether the locator was recorded on the page."""
+        with self._lock:
+            self._load()
+            return locator in self._pages.get(page_key(url), {})
+
+    def record(self, url: str, locator: str, fingerprint: Dict[str, Any]) -> None:
+        """
+        Records the alternatives of an element found with `locator`, keeping the statistics of known alternatives.
+
+        Args:
+            url (str): The page URL.
+            locator (str): The original locator.
+            fingerprint (Dict[str, Any]): The result of `FINGERPRINT_SCRIPT` for the element.
+        """
+        with self._lock:
+            self._load()
+            alternatives = [
+                Alternative(kind, alternative_locator)
+                for kind, alternative_locator in alternative_locators(fingerprint)
+                if alternative_locator != locator
+            ]
+            self._recorded[(page_key(url), locator)] = alternatives
+            _replace_alternatives(self._pages, page_key(url), locator, alternatives)
+
+    def report(self, url: str, locator: str, alternative: Alternative, hit: bool) -> None:
+        """
+        Updates the hit rate of an alternative after it was tried.
+
+        Args:
+            url (str): The page URL.
+            locator (str): The original locator.
+            alternative (Alternative): The alternative that was tried.
+            hit (bool): Whether it found the element.
+        """
+        with self._lock:
+            self._load()
+            for known in self._pages.get(page_key(url), {}).get(locator, []):
+                if known.locator == alternative.locator:
+                    known.tries += 1
+                    known.hits += hit
+                    counts = self._reported.setdefault(
+                        (page_key(url), locator, alternative.locator), [0, 0]
+                    )
+                    counts[0] += hit
+                    counts[1] += 1
+
+    def save(self) -> None:
+        """
+        Merges the changes since the last save into the JSON file, keeping what other processes saved in the
+        meantime. Registered to run at interpreter exit and, by ParallelRunner, at worker process exit.
+        """
+        with self._lock:
+            if not self._recorded and not self._reported:
+                return
+            try:
+                data = update_json(self.path, self._merge, {})
+                self._pages = _parse_pages(data, self.path)
+                self._recorded, self._reported = {}, {}
+            except OSError as e:
+                logger.warning("Could not write the locator index %s. Error: %s", self.path, e)
+
+    def _merge(self, data: Any) -> Dict[str, Any]:
+        """Applies the recorded alternatives and the reported hits to the index read from the file."""
+        pages = _parse_pages(data, self.path)
+        for (page, locator), alternatives in self._recorded.items():
+            _replace_alternatives(
+                pages, page, locator, [Alternative(a.kind, a.locator) for a in alternatives]
+            )
+        for (page, locator, alternative_locator), (hits, tries) in self._reported.items():
+            for known in pages.get(page, {}).get(locator, []):
+                if known.locator == alternative_locator:
+                    known.hits += hits
+                    known.tries += tries
+        return {
+            page: {
+                locator: [asdict(alternative) for alternative in alternatives]
+                for locator, alternatives in entries.items()
+            }
+            for page, entries in pages.items()
+        }
+
+    def _load(self) -> None:
+        """Reads the JSON file on first use. A file that does not hold an index is ignored."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._pages = _parse_pages(read_json(self.path, {}), self.path)
+
+
+def _parse_pages(data: Any, path: str) -> Dict[str, Dict[str, List[Alternative]]]:
+    """Builds the alternatives of each page from decoded JSON; data that does not hold an index gives an empty one."""
+    try:
+        return {
+            page: {
+                locator: [Alternative(**alternative) for alternative in alternatives]
+                for locator, alternatives in entries.items()
+            }
+            for page, entries in data.items()
+        }
+    except (AttributeError, TypeError):
+        logger.warning(
+            "Ignoring the locator index %s, it does not hold locator alternatives.", path
+        )
+        return {}
+
+
+def _replace_alternatives(
+    pages: Dict[str, Dict[str, List[Alternative]]],
+    page: str,
+    locator: str,
+    alternatives: List[Alternative],
+) -> None:
+    """Sets the alternatives of a locator, keeping the statistics of the ones already known."""
+    entries = pages.setdefault(page, {})
+    known = {alternative.locator: alternative for alternative in entries.get(locator, [])}
+    entries[locator] = [known.get(alternative.locator, alternative) for alternative in alternatives]
+
+
+locator_index = LocatorIndex()
+atexit.register(locator_index.save)
@@ -0,0 +1,79 @@
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from pyautotk.core.config_loader import config
+
+CSS_PREFIX = "css="
+
+_CSS_IDENTIFIER = re.compile(r"^-?[A-Za-z_][A-Za-z0-9_-]*$")
+
+AttributeItems = Tuple[Tuple[str, str], ...]
+
+
+def _normalize_attribute(attr: str) -> str:
+    """Converts a Python keyword argument name (e.g. `aria_label`) into the HTML attribute name."""
+    return attr.replace("_", "-")
+
+
+@lru_cache(maxsize=config.locator_cache_size)
+def build_xpath(attrs: AttributeItems) -> str:
+    """
+    Constructs the XPath string for the given attributes. Results are memoized in a bounded LRU cache,
+    since page objects build the same locators over and over.
+
+    Args:
+        attrs (AttributeItems): The (attribute, value) pairs, in the order they were given to the Widget.
+
+    Returns:
+        str: The constructed XPath for locating the element.
+    """
+    xpath = "//*"
+    conditions = []
+    for attr, value in attrs:
+        attr = _normalize_attribute(attr)
+        if attr == "text":
+            conditions.append(f"contains(text(), '{value}')")
+        elif "class-" in attr:
+            conditions.append(f"@class='{value}'")
+        else:
+            conditions.append(f"@{attr}='{value}'")
+
+    if conditions:
+        xpath += "[" + " and ".join(conditions) + "]"
+    return xpath
+
+
+@lru_cache(maxsize=config.locator_cache_size)
+def build_css_selector(attrs: AttributeItems) -> Optional[str]:
+    """
+    Constructs a CSS selector equivalent to `build_xpath` for the same attributes, when one exists.
+
+    Only attribute equality can be expressed, so attribute sets using `text` (or no attribute at all)
+    return None. Class attributes keep the XPath semantics of matching the whole class string.
+
+    Args:
+        attrs (AttributeItems): The (attribute, value) pairs, in the order they were given to the Widget.
+
+    Returns:
+        Optional[str]: The CSS selector, or None if the attributes cannot be expressed in CSS.
+    """
+    if not attrs:
+        return None
+
+    parts = []
+    for attr, value in attrs:
+        attr = _normalize_attribute(attr)
+        value = str(value)
+        if attr == "text":
+            return None
+        if "class-" in attr:
+            attr = "class"
+        if not _CSS_IDENTIFIER.match(attr):
+            return None
+        if attr == "id" and _CSS_IDENTIFIER.match(value):
+            parts.insert(0, f"#{value}")
+        else:
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+            parts.append(f'[{attr}="{escaped}"]')
+    return "".join(parts)
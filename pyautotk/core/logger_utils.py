@@ -1,8 +1,173 @@
+import atexit
+import json
 import logging
+import queue
 import sys
-from typing import Optional
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 from pyautotk.core.config_loader import config
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_lock = threading.RLock()
+_listeners: List[QueueListener] = []
+_shared_queue_handler: Optional["_DeferredQueueHandler"] = None
+_json_handler: Optional["JsonLinesHandler"] = None
+
+# Log arguments that cannot change between the logging call and their formatting by the listener thread.
+_IMMUTABLE_ARGUMENT_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class JsonLinesHandler(logging.Handler):
+    """
+    Writes one JSON object per record to a file. Records are buffered and written in batches, when
+    `batch_size` records are pending, when `flush_interval` seconds passed since the last write, or
+    immediately for records at ERROR level and above. A background thread writes records left pending
+    by a logger that went quiet.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100, flush_interval: float = 1.0) -> None:
+        """
+        Initializes the handler, opening the file in append mode.
+
+        Args:
+            path (str): The JSON-lines file to write to.
+            batch_size (int): Number of buffered records that triggers a write. Default is 100.
+            flush_interval (float): Maximum age in seconds of buffered records before a write. Default is 1 second.
+        """
+        super().__init__()
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._stream = open(path, "a", encoding="utf-8")
+        self._stopped = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_periodically, name="pyautotk-log-flush", daemon=True
+            ).start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = {
+                "time": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                "thread": record.threadName,
+                "process": record.process,
+            }
+            if record.exc_info:
+                entry["exception"] = logging.Formatter().formatException(record.exc_info)
+            self._buffer.append(json.dumps(entry, default=str))
+            if (
+                len(self._buffer) >= self.batch_size
+                or record.levelno >= logging.ERROR
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._buffer and not self._stream.closed:
+                self._stream.write("\n".join(self._buffer) + "\n")
+                self._stream.flush()
+                self._buffer.clear()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self.flush()
+        with self.lock:
+            self._stream.close()
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        """Writes pending records every `flush_interval` seconds until the handler is closed."""
+        while not self._stopped.wait(self.flush_interval):
+            if self._buffer:
+                self.flush()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched, so the message is merged with its arguments by the
+    listener thread instead of the logging thread. Records with mutable arguments (e.g. a dict or list)
+    are merged before they are queued, since the caller may change the arguments in the meantime.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args if isinstance(record.args, tuple) else (record.args,)
+        if record.args and not all(isinstance(arg, _IMMUTABLE_ARGUMENT_TYPES) for arg in args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _json_lines_handler() -> Optional[JsonLinesHandler]:
+    """Returns the process-wide JSON-lines sink configured through `PYAUTOTK_LOG_JSON_PATH`, if any."""
+    global _json_handler
+    if not config.log_json_path:
+        return None
+    with _lock:
+        if _json_handler is None or _json_handler.path != config.log_json_path:
+            _json_handler = JsonLinesHandler(
+                config.log_json_path, config.log_json_batch_size, config.log_json_flush_interval
+            )
+        return _json_handler
+
+
+def _queued(*handlers: logging.Handler) -> "_DeferredQueueHandler":
+    """Returns a queue handler whose records are passed to `handlers` by a background QueueListener."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    with _lock:
+        _listeners.append(listener)
+    return _DeferredQueueHandler(log_queue)
+
+
+def _shared_queue() -> "_DeferredQueueHandler":
+    """Returns the queue handler feeding the shared console (and JSON-lines) sinks in queue mode."""
+    global _shared_queue_handler
+    with _lock:
+        if _shared_queue_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+            sinks = [console_handler]
+            json_handler = _json_lines_handler()
+            if json_handler is not None:
+                sinks.append(json_handler)
+            _shared_queue_handler = _queued(*sinks)
+        return _shared_queue_handler
+
+
+def shutdown_logging() -> None:
+    """
+    Stops the queue listeners, writing every pending record, and flushes the JSON-lines sink.
+    Registered to run at interpreter exit.
+    """
+    global _shared_queue_handler
+    with _lock:
+        listeners = list(_listeners)
+        _listeners.clear()
+        _shared_queue_handler = None
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+    if _json_handler is not None:
+        _json_handler.flush()
+
+
+atexit.register(shutdown_logging)
+
 
 def initialize_logger(
     logger_name: str = "PyAutoTk",
@@ -12,6 +177,10 @@ def initialize_logger(
     """
     Initializes and configures the logger
 
+    With `config.log_queue` enabled, records are only put on a queue by the calling thread; formatting and
+    writing happen in a background listener. With `config.log_json_path` set, records are also written as
+    JSON lines in batches.
+
     Args:
         logger_name (str): The name to use for the logger. Helps in identifying logs from different components.
         log_level (str): The minimum log level to capture. Default is "INFO".
@@ -26,19 +195,27 @@ def initialize_logger(
     logger.setLevel(getattr(logging, log_level.upper(), "INFO"))
 
     if not logger.hasHandlers():
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        file_handler = None
+        if log_to_file:
+            file_handler = logging.FileHandler(log_to_file)
+            file_handler.setFormatter(formatter)
+
+        if config.log_queue:
+            logger.addHandler(_shared_queue())
+            if file_handler is not None:
+                logger.addHandler(_queued(file_handler))
+            return logger
+
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper(), "INFO"))
-
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
-        if log_to_file:
-            file_handler = logging.FileHandler(log_to_file)
+        if file_handler is not None:
             file_handler.setLevel(getattr(logging, log_level.upper(), "INFO"))
-            file_handler.setFormatter(formatter)
             logger.addHandler(file_handler)
+        json_handler = _json_lines_handler()
+        if json_handler is not None:
+            logger.addHandler(json_handler)
 
     return logger
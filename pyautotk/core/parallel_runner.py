@@ -0,0 +1,225 @@
+import queue
+import sys
+import time
+import traceback
+from multiprocessing import util as multiprocessing_util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.logger_utils import initialize_logger
+from pyautotk.core.locator_index import locator_index
+from pyautotk.core.session_pool import session_pool
+from pyautotk.core.wait_history import wait_history
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Outcome of a single scenario executed by the ParallelRunner.
+    """
+
+    name: str
+    passed: bool
+    duration: float
+    result: Any = None
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+
+
+def _shutdown_playwright() -> None:
+    """Stops the Playwright runtime of the calling thread, if the Playwright engine was loaded at all."""
+    playwright_controller = sys.modules.get("pyautotk.core.playwright_controller")
+    if playwright_controller is not None:
+        playwright_controller.shutdown_playwright()
+
+
+def _close_worker_process() -> None:
+    """Closes the warm sessions and the Playwright runtime of a worker process."""
+    session_pool.close_all()
+    _shutdown_playwright()
+
+
+def _close_worker_thread() -> None:
+    """
+    Closes the Playwright sessions and runtime of a worker thread. They are bound to the thread, so the `atexit`
+    hooks, which run on the main thread, cannot close them.
+    """
+    session_pool.close_thread()
+    _shutdown_playwright()
+
+
+def _init_worker_process() -> None:
+    """
+    Makes sure the warm sessions of a worker process are closed and the wait history and locator index it learned
+    are saved when the process exits, since multiprocessing workers skip the `atexit` hooks registered by the session
+    pool, the Playwright engine, the wait history and the locator index.
+    """
+    multiprocessing_util.Finalize(session_pool, _close_worker_process, exitpriority=10)
+    multiprocessing_util.Finalize(wait_history, wait_history.save, exitpriority=10)
+    multiprocessing_util.Finalize(locator_index, locator_index.save, exitpriority=10)
+
+
+def _run_scenario(
+    scenario: Callable[..., Any], url: str, browser_type: str, headless: bool, maximize: bool
+) -> ScenarioResult:
+    """
+    Runs one scenario on a pooled browser session and records its outcome. A session that fails to launch is
+    recorded as a failed scenario.
+
+    Kept at module level so it can be shipped to worker processes.
+    """
+    name = getattr(scenario, "__qualname__", repr(scenario))
+    start = time.perf_counter()
+    session = None
+    try:
+        session = session_pool.acquire(
+            browser_type=browser_type, headless=headless, maximize=maximize
+        )
+        session.open_url(url)
+        result = scenario(session)
+        return ScenarioResult(
+            name=name, passed=True, duration=time.perf_counter() - start, result=result
+        )
+    except Exception as e:
+        return ScenarioResult(
+            name=name,
+            passed=False,
+            duration=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+            traceback=traceback.format_exc(),
+        )
+    finally:
+        if session is not None:
+            session_pool.release(session)
+
+
+class ParallelRunner:
+    """
+    Spreads scenario functions with the `browser_session` signature (they receive the session as first argument)
+    across several browser sessions running concurrently.
+
+    Each worker reuses warm sessions from the session pool, so a browser is launched at most once per worker.
+    Thread workers close the Playwright sessions they launched once the scenarios run out, since those sessions
+    cannot be used or closed from another thread.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        workers: int = 0,
+        browser_type: str = "",
+        headless: bool = False,
+        maximize: bool = False,
+        use_processes: bool = False,
+    ) -> None:
+        """
+        Initializes the runner.
+
+        Args:
+            url (str): The URL opened before each scenario.
+            workers (int): Number of concurrent browser sessions. Defaults to `config.parallel_workers`.
+            browser_type (str): The type of browser to use. Supported values are 'firefox' or 'chrome'.
+            headless (bool): Whether to run the browsers in headless mode. Default is False.
+            maximize (bool): Whether to start the browsers maximized. Default is False.
+            use_processes (bool): Whether to run workers in separate processes instead of threads.
+                Scenarios must then be picklable (module-level functions). Default is False.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.url = url
+        self.workers = workers or config.parallel_workers
+        self.browser_type = browser_type
+        self.headless = headless
+        self.maximize = maximize
+        self.use_processes = use_processes
+
+    def run(self, scenarios: List[Callable[..., Any]]) -> List[ScenarioResult]:
+        """
+        Executes all scenarios and collects their results.
+
+        Args:
+            scenarios (List[Callable[..., Any]]): The scenario functions to run.
+
+        Returns:
+            List[ScenarioResult]: One result per scenario, in the same order as `scenarios`.
+        """
+        workers = max(1, min(self.workers, len(scenarios)))
+        self.logger.info(
+            "Running %s scenario(s) on %s %s worker(s).",
+            len(scenarios),
+            workers,
+            "process" if self.use_processes else "thread",
+        )
+
+        start = time.perf_counter()
+        results: List[Optional[ScenarioResult]] = [None] * len(scenarios)
+        if self.use_processes:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker_process
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_scenario,
+                        scenario,
+                        self.url,
+                        self.browser_type,
+                        self.headless,
+                        self.maximize,
+                    ): index
+                    for index, scenario in enumerate(scenarios)
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    self._log_result(results[futures[future]])
+        else:
+            pending: "queue.SimpleQueue[Tuple[int, Callable[..., Any]]]" = queue.SimpleQueue()
+            for index, scenario in enumerate(scenarios):
+                pending.put((index, scenario))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [
+                    executor.submit(self._work, pending, results) for _ in range(workers)
+                ]:
+                    future.result()
+
+        failed = sum(1 for result in results if not result.passed)
+        self.logger.info(
+            "Finished %s scenario(s) in %.2fs, %s failed.",
+            len(scenarios),
+            time.perf_counter() - start,
+            failed,
+        )
+        return results
+
+    def _work(
+        self,
+        pending: "queue.SimpleQueue[Tuple[int, Callable[..., Any]]]",
+        results: List[Optional[ScenarioResult]],
+    ) -> None:
+        """
+        Runs scenarios from the queue on the current worker thread until it is empty, then closes the sessions
+        bound to the thread.
+        """
+        try:
+            while True:
+                try:
+                    index, scenario = pending.get_nowait()
+                except queue.Empty:
+                    return
+                results[index] = _run_scenario(
+                    scenario, self.url, self.browser_type, self.headless, self.maximize
+                )
+                self._log_result(results[index])
+        finally:
+            _close_worker_thread()
+
+    def _log_result(self, result: ScenarioResult) -> None:
+        if result.passed:
+            self.logger.info("Scenario '%s' passed in %.2fs", result.name, result.duration)
+        else:
+            self.logger.error(
+                "Scenario '%s' failed in %.2fs. Error: %s",
+                result.name,
+                result.duration,
+                result.error,
+            )
@@ -0,0 +1,971 @@
+import atexit
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from playwright.sync_api import Browser, Locator, Page, sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from selenium.common.exceptions import TimeoutException
+
+from pyautotk.core.action_batch import ActionBatch
+from pyautotk.core.browser_controller import (
+    EXTRACT_TABLE_SCRIPT,
+    NETWORK_TRACKER_SCRIPT,
+    PAGE_SETTLE_SCRIPT,
+    PROPERTIES_SNAPSHOT_SCRIPT,
+    table_script_arguments,
+)
+from pyautotk.core.config_loader import config
+from pyautotk.core.launch_profiles import (
+    claim_cache_directory,
+    get_launch_profile,
+    release_cache_directory,
+)
+from pyautotk.core.exceptions import BrowserWaitForPageLoadException
+from pyautotk.core.locators import CSS_PREFIX
+from pyautotk.core.logger_utils import initialize_logger
+from pyautotk.core.profiler import profiled_operations, profiler
+from pyautotk.core.resource_blocking import is_blocked, resolve_blocking
+from pyautotk.core.session_state import (
+    APPLY_STORAGE_SCRIPT,
+    CAPTURE_STORAGE_SCRIPT,
+    RESTORE_LANDING_PATH,
+    SessionState,
+    from_protocol_cookie,
+    to_protocol_cookie,
+)
+from pyautotk.core.wait_history import wait_history
+
+# Same attribute semantics as Selenium's get_attribute: prefer the live property (e.g. the current value of
+# an input, the resolved href) and fall back to the raw attribute.
+GET_ATTRIBUTE_SCRIPT = """
+    (el, name) => {
+        if (!el.hasAttribute(name)) {
+            return (name === 'value' && typeof el.value === 'string') ? el.value : null;
+        }
+        const property = name === 'class' ? undefined : el[name];
+        return typeof property === 'string' ? property : el.getAttribute(name);
+    }
+"""
+
+# Wraps a Selenium-style script body (using `arguments[n]`) into a function Playwright can evaluate. The body is
+# pasted into the source instead of being compiled with `new Function`, which a Content-Security-Policy without
+# 'unsafe-eval' blocks.
+SELENIUM_SCRIPT_WRAPPER = "(args) => (function () {{\n{script}\n}}).apply(null, args)"
+
+# Same for asynchronous scripts, which receive a completion callback as their last argument.
+SELENIUM_ASYNC_SCRIPT_WRAPPER = "(args) => new Promise(resolve => (function () {{\n{script}\n}}).apply(null, args.concat([resolve])))"
+
+# Same for the properties snapshot, which receives the elements and the attribute names.
+PROPERTIES_SNAPSHOT_WRAPPER = (
+    "(elements, attributes) => (function () {{\n{script}\n}}).call(null, elements, attributes)"
+)
+
+# First and longest pause (in seconds) before checking the page again when a page wait is interrupted by navigation.
+PAGE_WAIT_RETRY_DELAY = 0.05
+PAGE_WAIT_MAX_RETRY_DELAY = 0.5
+
+# `goto` wait condition matching each WebDriver page load strategy of the launch profiles.
+PAGE_LOAD_WAIT_UNTIL = {"normal": "load", "eager": "domcontentloaded", "none": "commit"}
+
+
+class _PlaywrightRuntime(threading.local):
+    """
+    Per-thread Playwright driver and launched browsers. The sync API is bound to the thread that started it,
+    so each thread (e.g. each ParallelRunner worker) owns its runtime; controllers created on the same thread
+    share the browser process and only pay for a new browser context.
+    """
+
+    def __init__(self) -> None:
+        self.playwright = None
+        self.browsers: Dict[Tuple[str, bool, bool, str], Browser] = {}
+        # Disk cache directories claimed by the launched browsers, by browser key.
+        self.cache_directories: Dict[Tuple[str, bool, bool, str], str] = {}
+
+
+_runtime = _PlaywrightRuntime()
+
+
+def _get_browser(browser_type: str, headless: bool, maximize: bool) -> Browser:
+    """
+    Returns the launched browser of the current thread for the configuration, launching it if needed with the
+    launch profile selected through `config.browser_profile`.
+    """
+    if _runtime.playwright is None:
+        _runtime.playwright = sync_playwright().start()
+
+    profile = get_launch_profile()
+    key = (browser_type, headless, maximize, profile.name)
+    browser = _runtime.browsers.get(key)
+    if browser is None or not browser.is_connected():
+        if browser_type not in ("chrome", "firefox"):
+            raise ValueError(f"Unsupported browser type: {browser_type}")
+        release_cache_directory(_runtime.cache_directories.pop(key, ""))
+        cache_directory = claim_cache_directory(browser_type) if profile.reuse_disk_cache else ""
+        try:
+            if browser_type == "chrome":
+                args = (
+                    ["--start-maximized"] if maximize else []
+                ) + profile.chrome_launch_arguments(cache_directory)
+                browser = _runtime.playwright.chromium.launch(headless=headless, args=args)
+            else:
+                browser = _runtime.playwright.firefox.launch(
+                    headless=headless,
+                    firefox_user_prefs=profile.firefox_launch_preferences(cache_directory),
+                )
+        except Exception:
+            release_cache_directory(cache_directory)
+            raise
+        _runtime.browsers[key] = browser
+        _runtime.cache_directories[key] = cache_directory
+    return browser
+
+
+def shutdown_playwright() -> None:
+    """
+    Closes the browsers launched by the current thread and stops its Playwright driver.
+    """
+    for browser in _runtime.browsers.values():
+        if browser.is_connected():
+            browser.close()
+    _runtime.browsers.clear()
+    for cache_directory in _runtime.cache_directories.values():
+        release_cache_directory(cache_directory)
+    _runtime.cache_directories.clear()
+    if _runtime.playwright is not None:
+        _runtime.playwright.stop()
+        _runtime.playwright = None
+
+
+atexit.register(shutdown_playwright)
+
+
+def _fulfill_blank_page(route: Any) -> None:
+    """Answers a request with an empty HTML document, without reaching the network."""
+    route.fulfill(status=200, content_type="text/html", body="")
+
+
+@profiled_operations
+class PlaywrightBrowserController:
+    """
+    BrowserController implementation backed by Playwright. It exposes the same XPath-based API, so Widget and
+    browser_session work unchanged when `PYAUTOTK_BROWSER_ENGINE=playwright`.
+
+    Commands travel over Playwright's persistent connection instead of one HTTP request each, and every
+    controller is an isolated browser context inside a shared browser process. Elements are Playwright
+    locators, which are resolved lazily and never go stale. The Selenium `driver` attribute is not available.
+    """
+
+    # The automation engine of the controller, one of `controller_factory.BROWSER_ENGINES`.
+    engine = "playwright"
+
+    def __init__(
+        self,
+        browser_type: str,
+        maximize: bool,
+        headless: bool,
+        kill_browser: bool = True,
+        cache_elements: bool = False,
+        block_resources: List[str] = None,
+        block_urls: List[str] = None,
+    ) -> None:
+        """
+        Initializes the controller with a new browser context and page.
+
+        Args:
+            browser_type (str): The type of browser to use. Supported values: 'firefox' and 'chrome' (Chromium).
+            maximize (bool): Whether to maximize the browser window on startup. Default is False.
+            headless (bool): Whether to run the browser in headless mode. Default is False.
+            kill_browser (bool): Whether `close_browser` is expected at the end of the session. Default is True.
+            cache_elements (bool): Accepted for API compatibility; locators never go stale, so nothing is cached.
+            block_resources (List[str]): Resource types aborted by the context, from `resource_blocking.RESOURCE_TYPES`.
+                Defaults to `config.block_resources`.
+            block_urls (List[str]): URL patterns aborted by the context, where `*` matches any sequence of characters.
+                Defaults to `config.block_urls`.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.browser_type = browser_type.lower() or config.browser_type
+        self.maximize = maximize or config.maximize_browser
+        self.headless = headless or config.headless_mode
+        self.kill_browser = kill_browser
+        self.cache_elements = cache_elements
+        self.block_resources, self.block_urls = resolve_blocking(block_resources, block_urls)
+        self.launch_profile = get_launch_profile()
+        self._active_batch = None
+        self._network_tracker_installed = False
+        self._dialogs: List[Any] = []
+        self._watched_pages: List[Page] = []
+
+        self.browser = _get_browser(self.browser_type, self.headless, self.maximize)
+        self._open_context()
+
+    def open_url(self, url: str) -> None:
+        """
+        Opens the specified URL in the browser.
+
+        Args:
+            url (str): The URL to open in the browser.
+        """
+        self.logger.info("Open url: %s ", url)
+        self._flush_pending_batch()
+        self.page.goto(url, wait_until=PAGE_LOAD_WAIT_UNTIL[self.launch_profile.page_load_strategy])
+
+    def close_browser(self) -> None:
+        """
+        Closes the browser context of this controller. The browser process stays available for other controllers.
+        """
+        self.logger.debug("Closing browser context")
+        self.context.close()
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        """
+        Executes a Selenium-style JavaScript function body, with `args` available as `arguments[0..n]`.
+
+        Args:
+            script (str): The JavaScript function body to execute.
+            *args (Any): Serializable arguments passed to the script.
+
+        Returns:
+            Any: The value returned by the script.
+        """
+        return self.page.evaluate(SELENIUM_SCRIPT_WRAPPER.format(script=script), list(args))
+
+    def batch(
+        self, stop_on_error: bool = True, raise_on_error: bool = True, native_text: bool = False
+    ) -> ActionBatch:
+        """
+        Creates an action batch that records DOM-level operations and runs them in a single script call.
+        See `BrowserController.batch`.
+        """
+        return ActionBatch(
+            self,
+            stop_on_error=stop_on_error,
+            raise_on_error=raise_on_error,
+            native_text=native_text,
+        )
+
+    def is_alive(self) -> bool:
+        """
+        Checks whether the browser context is still responsive.
+
+        Returns:
+            bool: True if the page answered a trivial evaluation, False otherwise.
+        """
+        try:
+            return self.browser.is_connected() and self.page.evaluate("true") is True
+        except PlaywrightError as e:
+            self.logger.warning("Browser session health check failed. Error: %s", e)
+            return False
+
+    def reset_session(self) -> None:
+        """
+        Replaces the browser context with a new one, so the next test starts without the cookies, storage and tabs
+        of every origin the previous one visited.
+        """
+        self.logger.debug("Replacing the browser context to reset the session.")
+        self.context.close()
+        self._dialogs.clear()
+        self._watched_pages.clear()
+        self._network_tracker_installed = False
+        self._open_context()
+
+    def save_session_state(self, path: str = "") -> SessionState:
+        """
+        Captures the cookies, localStorage and sessionStorage of the current page and its URL.
+        See `BrowserController.save_session_state`.
+        """
+        self._flush_pending_batch()
+        storage = self.execute_script(CAPTURE_STORAGE_SCRIPT)
+        cookies = [from_protocol_cookie(cookie) for cookie in self.context.cookies()]
+        state = SessionState(
+            self.page.url, storage["origin"], cookies, storage["local"], storage["session"]
+        )
+        if path:
+            state.save(path)
+            self.logger.info("Session state of %s saved to %s", state.origin, path)
+        return state
+
+    def restore_session_state(
+        self, state: Union[SessionState, str], navigate: bool = False
+    ) -> None:
+        """
+        Restores a state captured by `save_session_state`. Cookies are added to the context; the storage is written
+        on a blank document of the origin served by the context itself, so no request reaches the site.
+
+        Args:
+            state (Union[SessionState, str]): The state, or the JSON file it was saved to.
+            navigate (bool): Whether to open the captured URL afterwards. Default is False.
+        """
+        if isinstance(state, str):
+            state = SessionState.load(state)
+        self.logger.info(
+            "Restoring session state of %s (%s cookies).", state.origin, len(state.cookies)
+        )
+        self._flush_pending_batch()
+        if state.cookies:
+            self.context.add_cookies([to_protocol_cookie(cookie) for cookie in state.cookies])
+        if state.origin not in ("", "null") and (state.local_storage or state.session_storage):
+            landing = state.origin + RESTORE_LANDING_PATH
+            self.page.route(landing, _fulfill_blank_page)
+            try:
+                self.page.goto(landing)
+                self.execute_script(
+                    APPLY_STORAGE_SCRIPT, state.origin, state.local_storage, state.session_storage
+                )
+            finally:
+                self.page.unroute(landing, _fulfill_blank_page)
+        if navigate:
+            self.open_url(state.url)
+
+    def accept_alert(self, timeout: int = 5) -> None:
+        """
+        Waits for and accepts a JavaScript alert.
+
+        Args:
+            timeout (int): The maximum time in seconds to wait for the alert.
+
+        Raises:
+            TimeoutException: If no alert is present within the timeout period.
+        """
+        self.logger.debug("Waiting for alert for %s seconds.", timeout)
+        try:
+            if not self._dialogs:
+                self.page.wait_for_event("dialog", timeout=timeout * 1000)
+        except PlaywrightTimeoutError as e:
+            self.logger.error("No alert was present within %s seconds.", timeout)
+            raise TimeoutException(f"No alert was present within {timeout} seconds.") from e
+        dialog = self._dialogs.pop(0)
+        self.logger.info("Accepting alert with text: '%s'", dialog.message)
+        dialog.accept()
+
+    def switch_to_new_tab(self) -> None:
+        """
+        Switches the focus to the most recently opened tab.
+        """
+        self.logger.debug("Attempting to switch to the new tab.")
+        pages = self.context.pages
+        if len(pages) > 1:
+            self.page = pages[-1]
+            self.logger.info("Switched to new tab with URL: %s", self.page.url)
+        else:
+            self.logger.warning("No new tab to switch to. Only one tab is open.")
+
+    def switch_to_original_tab(self) -> None:
+        """
+        Switches the focus back to the original tab, or to the first available tab if it was closed.
+        """
+        self.logger.debug("Switching back to the original tab.")
+        if not self.original_window.is_closed():
+            self.page = self.original_window
+        elif self.context.pages:
+            self.logger.warning(
+                "Original tab seems to be closed. Switching to the first available tab."
+            )
+            self.page = self.context.pages[0]
+        else:
+            self.logger.error("No tabs available to switch to. The browser might be closed.")
+
+    def close_current_tab(self) -> None:
+        """
+        Closes the focused tab and switches back to the original tab. The last open tab is never closed.
+        """
+        self.logger.debug("Attempting to close the current tab.")
+        if len(self.context.pages) > 1:
+            self.page.close()
+            self.switch_to_original_tab()
+        else:
+            self.logger.warning(
+                "Cannot close the tab as it is the only one open. Use `close_browser()` to end the session."
+            )
+
+    def find_element(self, xpath: str, timeout: int = 10, strategy: str = None) -> Locator:
+        """
+        Waits until the element identified by the given XPath is visible and enabled and returns its locator.
+
+        Args:
+            xpath (str): The XPath locator string for the desired element.
+            timeout (int): The maximum time (in seconds) to wait. Default is 10 seconds.
+            strategy (str): Accepted for API compatibility; Playwright waits are always event-driven.
+
+        Returns:
+            Locator: The locator of the first matching element.
+        """
+        self.logger.debug("Searching for a element using the following xpath: %s", xpath)
+        return self._locate(xpath, "clickable", timeout)
+
+    def run_on_element(
+        self,
+        xpath: str,
+        action: Callable[[Any], Any],
+        timeout: int = 10,
+        condition: str = "clickable",
+    ) -> Any:
+        """
+        Locates the element and calls `action` with its locator, returning its result.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            action (Callable[[Any], Any]): The callable that receives the Locator.
+            timeout (int): Maximum time (in seconds) to wait for the element. Default is 10 seconds.
+            condition (str): The wait condition ('present', 'visible' or 'clickable').
+
+        Returns:
+            Any: The value returned by `action`.
+        """
+        return action(self._locate(xpath, condition, timeout))
+
+    def invalidate_element_cache(self, xpath: str = None) -> None:
+        """Accepted for API compatibility; locators are resolved on every use."""
+
+    def click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Clicks on the element specified by the given XPath (JavaScript click, like BrowserController).
+
+        Args:
+            xpath (str): The XPath locator string for the element to be clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        self.logger.debug("Click a element using the following xpath: %s", xpath)
+        if self._active_batch is not None:
+            return self._active_batch.record("click", xpath)
+        self.run_on_element(xpath, lambda locator: locator.evaluate("el => el.click()"), timeout)
+
+    def double_click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Double-clicks the element with native pointer events.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be double-clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        self.logger.debug("Double-click a element using the following xpath: %s", xpath)
+        self.run_on_element(
+            xpath, lambda locator: locator.dblclick(timeout=timeout * 1000), timeout
+        )
+
+    def right_click_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Right-clicks the element with native pointer events, opening its context menu.
+
+        Args:
+            xpath (str): The XPath locator string for the element to be right-clicked.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        self.logger.debug("Right-click a element using the following xpath: %s", xpath)
+        self.run_on_element(
+            xpath, lambda locator: locator.click(button="right", timeout=timeout * 1000), timeout
+        )
+
+    def hover_element(self, xpath: str, timeout: int = 10) -> None:
+        self.run_on_element(xpath, lambda locator: locator.hover(timeout=timeout * 1000), timeout)
+
+    def unhover_element(self, timeout: int = 10) -> None:
+        """
+        Moves the mouse to the <body> element to un-hover any active element.
+
+        Args:
+            timeout (int): Maximum time to wait for the body element to be present.
+        """
+        self.logger.debug("Unhovering by moving mouse to the body element.")
+        self.run_on_element(
+            "//body",
+            lambda locator: locator.hover(timeout=timeout * 1000, force=True),
+            timeout,
+            "present",
+        )
+
+    def drag_and_drop(self, source_xpath: str, target_xpath: str, timeout: int = 10) -> None:
+        """
+        Performs a drag-and-drop action from a source element to a target element.
+
+        Args:
+            source_xpath (str): The XPath locator for the element to drag.
+            target_xpath (str): The XPath locator for the element to drop onto.
+            timeout (int): Maximum time to wait for the elements.
+        """
+        source = self.find_element(source_xpath, timeout)
+        target = self.find_element(target_xpath, timeout)
+        source.drag_to(target, timeout=timeout * 1000)
+        self.logger.info("Drag and drop action completed successfully via Playwright.")
+
+    def enter_text_safely(self, xpath: str, text: str, timeout: int = 10) -> None:
+        """
+        Clears the input field and types the text with real key events.
+
+        Args:
+            xpath (str): The XPath locator string for the input field.
+            text (str): The text to be entered into the field.
+            timeout (int): Maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        self.logger.debug("Enter text safely: %s into element with XPath: %s", text, xpath)
+        if self._active_batch is not None and not self._active_batch.native_text:
+            return self._active_batch.record("enter_text", xpath, text)
+
+        def enter_text(locator: Locator) -> None:
+            locator.focus()
+            locator.clear()
+            locator.press_sequentially(text)
+
+        self.run_on_element(xpath, enter_text, timeout)
+
+    def set_element_value(self, xpath: str, value: str, timeout: int = 10) -> None:
+        """
+        Sets the value of an element directly using JavaScript and dispatches a 'change' event.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            value (str): The value to set for the element.
+            timeout (int): Maximum time (in seconds) to wait for the element.
+        """
+        self.logger.debug(
+            "Setting value '%s' for element with XPath: %s using JavaScript.", value, xpath
+        )
+        if self._active_batch is not None:
+            return self._active_batch.record("set_value", xpath, value)
+        self.run_on_element(
+            xpath,
+            lambda locator: locator.evaluate(
+                "(el, v) => { el.value = v; el.dispatchEvent(new Event('change')); }", value
+            ),
+            timeout,
+        )
+
+    def scroll_to_element(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Scrolls the page until the element identified by the given XPath is in view.
+
+        Args:
+            xpath (str): The XPath locator string for the element to scroll to.
+            timeout (int): The maximum time (in seconds) to wait for the element. Default is 10 seconds.
+        """
+        self.logger.debug("Scrolling to a element using the following xpath: %s", xpath)
+        self.run_on_element(
+            xpath,
+            lambda locator: locator.scroll_into_view_if_needed(timeout=timeout * 1000),
+            timeout,
+        )
+
+    def wait_for_element(self, xpath: str, timeout: int = 10, strategy: str = None) -> Locator:
+        """
+        Waits until the element identified by the given XPath is visible.
+
+        Args:
+            xpath (str): The XPath locator string for the element to wait for.
+            timeout (int): The maximum time (in seconds) to wait. Default is 10 seconds.
+            strategy (str): Accepted for API compatibility; Playwright waits are always event-driven.
+
+        Returns:
+            Locator: The locator of the first matching element.
+        """
+        self.logger.debug("Wait for a element using the following xpath: %s", xpath)
+        return self._locate(xpath, "visible", timeout)
+
+    def wait_for_page_load(self, timeout: int = 30) -> None:
+        """
+        Waits until `document.readyState` is 'complete'.
+
+        Args:
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the document is not ready within the given time.
+        """
+        self.logger.debug("Wait for the document to be ready.")
+        self._wait_for_page("ready", 0, timeout)
+
+    def wait_for_network_idle(self, idle_time: float = 0.5, timeout: int = 30) -> None:
+        """
+        Waits until the document is ready and no fetch/XHR request has been in flight for `idle_time` seconds.
+        The request tracker is registered for every new document of the context on the first call.
+
+        Args:
+            idle_time (float): How long (in seconds) the network must stay idle. Default is 0.5 seconds.
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the network does not become idle within the given time.
+        """
+        self.logger.debug("Wait for the network to be idle for %ss.", idle_time)
+        if not self._network_tracker_installed:
+            self.context.add_init_script(NETWORK_TRACKER_SCRIPT)
+            self._network_tracker_installed = True
+        self._wait_for_page("network_idle", idle_time, timeout)
+
+    def wait_for_dom_stable(self, stable_time: float = 0.5, timeout: int = 30) -> None:
+        """
+        Waits until the document is ready and has not changed (nodes, attributes or text) for `stable_time` seconds.
+
+        Args:
+            stable_time (float): How long (in seconds) the DOM must stay unchanged. Default is 0.5 seconds.
+            timeout (int): The maximum time (in seconds) to wait. Default is 30 seconds.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the DOM does not settle within the given time.
+        """
+        self.logger.debug("Wait for the DOM to be stable for %ss.", stable_time)
+        self._wait_for_page("dom_stable", stable_time, timeout)
+
+    def wait_for_all_elements(
+        self, xpath: str, timeout: int = 10, strategy: str = None
+    ) -> List[Locator]:
+        """
+        Waits until at least one element identified by the given XPath is present and returns all matches.
+
+        Args:
+            xpath (str): The XPath locator string for the elements to wait for.
+            timeout (int): The maximum time (in seconds) to wait. Default is 10 seconds.
+            strategy (str): Accepted for API compatibility; Playwright waits are always event-driven.
+
+        Returns:
+            List[Locator]: One locator per matching element.
+        """
+        self.logger.debug("Wait for all elements using the following xpath: %s", xpath)
+        self._locate(xpath, "present", timeout)
+        return self._locator(xpath).all()
+
+    def get_element_properties(
+        self, xpath: str, attributes: List[str], timeout: int = 10, all_matches: bool = False
+    ) -> Any:
+        """
+        Retrieves a snapshot of the element properties using a single evaluation.
+        See `BrowserController.get_element_properties`.
+        """
+        self.logger.debug("Taking a properties snapshot of the element(s) with XPath: %s", xpath)
+        script = PROPERTIES_SNAPSHOT_WRAPPER.format(script=PROPERTIES_SNAPSHOT_SCRIPT)
+        if all_matches:
+            self._locate(xpath, "present", timeout)
+            return self._locator(xpath).evaluate_all(script, attributes)
+
+        locator = self._locate(xpath, "visible", timeout)
+        return locator.evaluate(
+            f"(element, attributes) => ({script})([element], attributes)[0]", attributes
+        )
+
+    def locator_properties(self, locator: Locator, attributes: List[str]) -> Dict[str, Any]:
+        """
+        Reads the properties of a located element one by one, with the same shape as `Widget._extract_element_properties`
+        builds from a Selenium WebElement. Used by Widget when the properties are not taken as a snapshot.
+
+        Args:
+            locator (Locator): The locator of the element.
+            attributes (List[str]): The attributes to read; the ones the element does not have are left out.
+
+        Returns:
+            Dict[str, Any]: The text, tag name, attributes, page location, size, visibility and enabled state.
+        """
+        values = {name: locator.evaluate(GET_ATTRIBUTE_SCRIPT, name) for name in attributes}
+        displayed = locator.is_visible()
+        box = locator.bounding_box() or {"x": 0, "y": 0, "width": 0, "height": 0}
+        scroll_x, scroll_y = self.page.evaluate("() => [window.pageXOffset, window.pageYOffset]")
+        return {
+            "text": locator.inner_text().strip() if displayed else "",
+            "tag_name": locator.evaluate("el => el.tagName.toLowerCase()"),
+            "attributes": {name: value for name, value in values.items() if value is not None},
+            "location": {"x": round(box["x"] + scroll_x), "y": round(box["y"] + scroll_y)},
+            "size": {"height": round(box["height"]), "width": round(box["width"])},
+            "displayed": displayed,
+            "enabled": locator.is_enabled(),
+        }
+
+    def extract_table(
+        self,
+        xpath: str,
+        attributes: List[str] = None,
+        text: bool = True,
+        rect: bool = False,
+        displayed: bool = False,
+        timeout: int = 10,
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts the chosen fields of every element matching the XPath with a single evaluation.
+        See `BrowserController.extract_table`.
+        """
+        attributes, fields = table_script_arguments(attributes, text, rect, displayed)
+        self.logger.debug(
+            "Extracting columns %s and attributes %s for XPath: %s", fields, attributes, xpath
+        )
+        if timeout:
+            self._locate(xpath, "present", timeout)
+        else:
+            self._flush_pending_batch()
+        return self.execute_script(EXTRACT_TABLE_SCRIPT, xpath, attributes, fields)
+
+    def get_element_attribute(self, xpath: str, attribute_name: str, timeout: int = 10) -> Any:
+        """
+        Retrieves the value of an attribute from the element identified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            attribute_name (str): The name of the attribute to retrieve.
+            timeout (int): Maximum time (in seconds) to wait for the element to be visible. Default is 10 seconds.
+
+        Returns:
+            Any: The attribute value, or None if the element does not have it.
+        """
+        self.logger.debug(
+            "Getting attribute '%s' from element with XPath: %s", attribute_name, xpath
+        )
+        return self.run_on_element(
+            xpath,
+            lambda locator: locator.evaluate(GET_ATTRIBUTE_SCRIPT, attribute_name),
+            timeout,
+            condition="visible",
+        )
+
+    def upload_file(self, xpath: str, file_path: str, timeout: int = 10) -> None:
+        """
+        Uploads a file by setting it on a file input element.
+
+        Args:
+            xpath (str): The XPath locator string for the file input element.
+            file_path (str): The absolute path to the file to be uploaded.
+            timeout (int): Maximum time (in seconds) to wait for the element to be present. Default is 10 seconds.
+
+        Raises:
+            FileNotFoundError: If the file specified by file_path does not exist.
+            ValueError: If the provided file_path is not an absolute path.
+        """
+        self.logger.debug("Uploading file '%s' to element with XPath: %s", file_path, xpath)
+        if not os.path.isabs(file_path):
+            raise ValueError("File path for upload must be an absolute path.")
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file to upload was not found at: {file_path}")
+        self.run_on_element(
+            xpath, lambda locator: locator.set_input_files(file_path), timeout, condition="present"
+        )
+
+    def select_option_by_text(self, xpath: str, text: str, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown by its visible text.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            text (str): The visible text of the option to select.
+            timeout (int): Maximum time to wait for the element.
+        """
+        self.logger.debug("Selecting option '%s' by text from dropdown with XPath: %s", text, xpath)
+        if self._active_batch is not None:
+            return self._active_batch.record("select", xpath, text, by="text")
+        self._add_to_selection(xpath, {"label": text}, timeout)
+
+    def select_option_by_value(self, xpath: str, value: str, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown by its 'value' attribute.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            value (str): The value attribute of the option to select.
+            timeout (int): Maximum time to wait for the element.
+        """
+        self.logger.debug(
+            "Selecting option with value '%s' from dropdown with XPath: %s", value, xpath
+        )
+        if self._active_batch is not None:
+            return self._active_batch.record("select", xpath, value, by="value")
+        self._add_to_selection(xpath, {"value": value}, timeout)
+
+    def select_option_by_index(self, xpath: str, index: int, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown by its index.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            index (int): The index of the option to select (0-based).
+            timeout (int): Maximum time to wait for the element.
+        """
+        self.logger.debug("Selecting option at index %s from dropdown with XPath: %s", index, xpath)
+        if self._active_batch is not None:
+            return self._active_batch.record("select", xpath, index, by="index")
+        self._add_to_selection(xpath, {"index": index}, timeout)
+
+    def deselect_all_options(self, xpath: str, timeout: int = 10) -> None:
+        """
+        Deselects all options in a multi-select dropdown.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            timeout (int): Maximum time to wait for the element.
+        """
+        self.logger.debug("Deselecting all options from dropdown with XPath: %s", xpath)
+
+        def deselect_all(locator: Locator) -> None:
+            if locator.evaluate("el => el.multiple"):
+                locator.select_option([])
+            else:
+                self.logger.warning("Deselect_all is only applicable to multi-select dropdowns.")
+
+        self.run_on_element(xpath, deselect_all, timeout)
+
+    def deselect_option_by_text(self, xpath: str, text: str, timeout: int = 10) -> None:
+        """
+        Deselects an option from a multi-select dropdown by its visible text.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            text (str): The visible text of the option to deselect.
+            timeout (int): Maximum time to wait for the element.
+        """
+        self.logger.debug(
+            "Deselecting option '%s' by text from dropdown with XPath: %s", text, xpath
+        )
+
+        def deselect_by_text(locator: Locator) -> None:
+            if locator.evaluate("el => el.multiple"):
+                selected = [label for label in self._selected_labels(locator) if label != text]
+                locator.select_option(label=selected)
+            else:
+                self.logger.warning("Deselection is only applicable to multi-select dropdowns.")
+
+        self.run_on_element(xpath, deselect_by_text, timeout)
+
+    def get_all_selected_options_text(self, xpath: str, timeout: int = 10) -> List[str]:
+        """
+        Gets the text of all selected options from a dropdown.
+
+        Args:
+            xpath (str): The XPath locator for the <select> element.
+            timeout (int): Maximum time to wait for the element.
+        """
+        return self.run_on_element(xpath, self._selected_labels, timeout)
+
+    def _add_to_selection(self, xpath: str, option: Dict[str, Any], timeout: int) -> None:
+        """
+        Selects an option. Like Selenium's Select, options already selected in a multi-select stay selected.
+        """
+
+        def select(locator: Locator) -> None:
+            if locator.evaluate("el => el.multiple"):
+                index = locator.evaluate(
+                    """(el, option) => Array.from(el.options).findIndex((o, i) =>
+                        ('label' in option && o.text.trim() === option.label.trim()) ||
+                        ('value' in option && o.value === option.value) ||
+                        ('index' in option && i === option.index))""",
+                    option,
+                )
+                if index < 0:
+                    raise ValueError(
+                        f"Could not locate option {option} in dropdown with XPath: {xpath}"
+                    )
+                selected = locator.evaluate(
+                    "el => Array.from(el.options).map((o, i) => o.selected ? i : -1).filter(i => i >= 0)"
+                )
+                locator.select_option(index=sorted(set(selected + [index])), timeout=timeout * 1000)
+            else:
+                locator.select_option(timeout=timeout * 1000, **option)
+
+        self.run_on_element(xpath, select, timeout)
+
+    @staticmethod
+    def _selected_labels(locator: Locator) -> List[str]:
+        """Returns the text of the selected options of a <select> element."""
+        return locator.evaluate("el => Array.from(el.selectedOptions).map(o => o.text)")
+
+    def _open_context(self) -> None:
+        """Opens a new browser context and its first page, which becomes the original window."""
+        self.context = self.browser.new_context(no_viewport=self.maximize)
+        self.context.on("page", self._watch_dialogs)
+        if self.block_resources or self.block_urls:
+            self.context.route("**/*", self._route_request)
+        self.page: Page = self.context.new_page()
+        self._watch_dialogs(self.page)
+        self.original_window = self.page
+
+    def _watch_dialogs(self, page: Page) -> None:
+        """Keeps dialogs open until `accept_alert` handles them, instead of Playwright's auto-dismiss."""
+        if page not in self._watched_pages:
+            self._watched_pages.append(page)
+            page.on("dialog", self._dialogs.append)
+
+    def _route_request(self, route: Any) -> None:
+        """Aborts requests for blocked resource types or URLs and lets every other request through."""
+        request = route.request
+        if is_blocked(request.url, request.resource_type, self.block_resources, self.block_urls):
+            route.abort("blockedbyclient")
+        else:
+            route.continue_()
+
+    def _flush_pending_batch(self) -> None:
+        """Runs the operations queued by an active batch before an operation that is not batched."""
+        if self._active_batch is not None:
+            self._active_batch.flush()
+
+    def _locator(self, xpath: str) -> Locator:
+        """Returns a lazy locator for every element matching the XPath (or `css=` selector) in the focused tab."""
+        return self.page.locator(xpath if xpath.startswith(CSS_PREFIX) else f"xpath={xpath}")
+
+    def _wait_for_page(self, condition: str, quiet_time: float, timeout: float) -> None:
+        """
+        Waits for one of the page conditions of BrowserController inside the page. If the page navigates while
+        waiting, the condition is checked again on the new document for the remaining time, pausing between attempts
+        (from `PAGE_WAIT_RETRY_DELAY` up to `PAGE_WAIT_MAX_RETRY_DELAY` seconds) while the evaluation keeps failing.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the condition is not met within the given time.
+        """
+        self._flush_pending_batch()
+        deadline = time.monotonic() + timeout
+        wrapped = SELENIUM_ASYNC_SCRIPT_WRAPPER.format(script=PAGE_SETTLE_SCRIPT)
+        retry_delay = PAGE_WAIT_RETRY_DELAY
+        with profiler.waiting():
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BrowserWaitForPageLoadException(timeout, condition)
+                try:
+                    settled = self.page.evaluate(
+                        wrapped, [condition, int(quiet_time * 1000), int(remaining * 1000)]
+                    )
+                except PlaywrightError as e:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise BrowserWaitForPageLoadException(timeout, condition) from e
+                    self.logger.debug(
+                        "Page wait for '%s' interrupted (%s), checking the new document.",
+                        condition,
+                        e.message,
+                    )
+                    time.sleep(min(retry_delay, remaining))
+                    retry_delay = min(retry_delay * 2, PAGE_WAIT_MAX_RETRY_DELAY)
+                    continue
+                if not settled:
+                    raise BrowserWaitForPageLoadException(timeout, condition)
+                return
+
+    def _locate(self, xpath: str, condition: str, timeout: float) -> Locator:
+        """
+        Waits for the first element matching the XPath to satisfy the condition. With `config.adaptive_timeouts`,
+        the timeout is learned from the wait history of the XPath on the current page and every wait is added to it,
+        as in BrowserController.
+
+        Raises:
+            TimeoutException: If the condition is not met within the given time, for parity with BrowserController.
+        """
+        self._flush_pending_batch()
+        page = self.page.url
+        if config.adaptive_timeouts:
+            timeout = wait_history.timeout_for(page, xpath, timeout)
+        locator = self._locator(xpath).first
+        started = time.monotonic()
+        try:
+            with profiler.waiting():
+                locator.wait_for(
+                    state="attached" if condition == "present" else "visible",
+                    timeout=timeout * 1000,
+                )
+                if condition == "clickable":
+                    self.page.wait_for_function(
+                        "el => !el.disabled",
+                        arg=locator.element_handle(timeout=timeout * 1000),
+                        timeout=timeout * 1000,
+                    )
+        except PlaywrightTimeoutError as e:
+            if config.adaptive_timeouts:
+                wait_history.record_timeout(page, xpath, timeout)
+            raise TimeoutException(
+                f"Element with XPath '{xpath}' did not become {condition} within {timeout} seconds."
+            ) from e
+        if config.adaptive_timeouts:
+            wait_history.record(page, xpath, time.monotonic() - started)
+        return locator
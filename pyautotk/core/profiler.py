@@ -0,0 +1,315 @@
+import atexit
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.logger_utils import initialize_logger
+
+# Upper bounds (in milliseconds) of the latency histogram buckets; the last bucket collects everything slower.
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+# Names of the first parameter that identify the locator of a profiled controller method.
+XPATH_PARAMETERS = ("xpath", "source_xpath")
+
+
+@dataclass
+class OperationRecord:
+    """
+    Measurements of a single profiled operation, passed to the profiler hooks.
+    """
+
+    operation: str
+    xpath: Optional[str]
+    duration: float
+    round_trips: int = 0
+    wait_time: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class OperationStats:
+    """
+    Aggregated measurements of an operation or locator: totals plus a latency histogram.
+    """
+
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    round_trips: int = 0
+    wait_time: float = 0.0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS_MS) + 1))
+
+    def add(self, record: OperationRecord) -> None:
+        self.count += 1
+        self.errors += record.error is not None
+        self.total_time += record.duration
+        self.max_time = max(self.max_time, record.duration)
+        self.round_trips += record.round_trips
+        self.wait_time += record.wait_time
+        self.histogram[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, record.duration * 1000)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": round(self.total_time, 6),
+            "mean_time": round(self.total_time / self.count, 6) if self.count else 0.0,
+            "max_time": round(self.max_time, 6),
+            "round_trips": self.round_trips,
+            "wait_time": round(self.wait_time, 6),
+            "histogram_ms": {
+                (
+                    f"<={bound}"
+                    if index < len(HISTOGRAM_BUCKETS_MS)
+                    else f">{HISTOGRAM_BUCKETS_MS[-1]}"
+                ): hits
+                for index, (bound, hits) in enumerate(
+                    zip(HISTOGRAM_BUCKETS_MS + (None,), self.histogram)
+                )
+                if hits
+            },
+        }
+
+
+class _Frame:
+    """Counters of an operation in progress; nested operations each keep their own (inclusive) counters."""
+
+    __slots__ = ("round_trips", "wait_time")
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.wait_time = 0.0
+
+
+class Profiler:
+    """
+    Records wall time, WebDriver round trips and time spent waiting for every profiled operation, and aggregates
+    them per operation and per XPath.
+
+    Disabled by default (`PYAUTOTK_PROFILE`); while disabled the instrumented methods only pay a flag check.
+    """
+
+    def __init__(self) -> None:
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.enabled = config.profile
+        self.by_operation: Dict[str, OperationStats] = {}
+        self.by_xpath: Dict[str, OperationStats] = {}
+        self._hooks: List[Callable[[OperationRecord], None]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def add_hook(self, hook: Callable[[OperationRecord], None]) -> None:
+        """
+        Registers a callable that receives the OperationRecord of every profiled operation.
+
+        Args:
+            hook (Callable[[OperationRecord], None]): The callable to register.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[OperationRecord], None]) -> None:
+        """
+        Unregisters a hook added with `add_hook`.
+
+        Args:
+            hook (Callable[[OperationRecord], None]): The callable to remove.
+        """
+        self._hooks.remove(hook)
+
+    def reset(self) -> None:
+        """Discards every aggregated measurement."""
+        with self._lock:
+            self.by_operation.clear()
+            self.by_xpath.clear()
+
+    @contextmanager
+    def operation(self, name: str, xpath: Optional[str] = None) -> Iterator[None]:
+        """
+        Measures the wrapped block as one operation.
+
+        Args:
+            name (str): The operation name, e.g. `BrowserController.click_element`.
+            xpath (Optional[str]): The locator the operation works on, if any.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        frame = _Frame()
+        stack = self._stack()
+        stack.append(frame)
+        error = None
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            self._record(
+                OperationRecord(name, xpath, duration, frame.round_trips, frame.wait_time, error)
+            )
+
+    @contextmanager
+    def waiting(self) -> Iterator[None]:
+        """Adds the time spent in the wrapped block to the wait time of the operations in progress."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for frame in self._stack():
+                frame.wait_time += elapsed
+
+    def count_round_trip(self) -> None:
+        """Counts one WebDriver command for the operations in progress."""
+        if self.enabled:
+            for frame in self._stack():
+                frame.round_trips += 1
+
+    def attach(self, driver: Any) -> None:
+        """
+        Instruments a Selenium WebDriver so each command it sends is counted as a round trip.
+
+        Args:
+            driver (Any): The WebDriver instance.
+        """
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def counting_execute(*args: Any, **kwargs: Any) -> Any:
+            self.count_round_trip()
+            return execute(*args, **kwargs)
+
+        driver.execute = counting_execute
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the aggregated measurements as JSON-serializable data.
+
+        Returns:
+            Dict[str, Any]: Stats keyed by operation (`operations`) and by XPath (`xpaths`).
+        """
+        with self._lock:
+            return {
+                "operations": {name: stats.to_dict() for name, stats in self.by_operation.items()},
+                "xpaths": {xpath: stats.to_dict() for xpath, stats in self.by_xpath.items()},
+            }
+
+    def dump(self, path: str) -> None:
+        """
+        Writes the aggregated measurements to a JSON file.
+
+        Args:
+            path (str): The destination file.
+        """
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(self.to_dict(), output, indent=2)
+        self.logger.info("Profiling data written to %s", path)
+
+    def summary(self, limit: int = 20) -> str:
+        """
+        Builds a text table of the slowest operations and XPaths, sorted by total time.
+
+        Args:
+            limit (int): Maximum number of rows per table. Default is 20.
+
+        Returns:
+            str: The formatted summary.
+        """
+        with self._lock:
+            sections = [("Operation", self.by_operation), ("XPath", self.by_xpath)]
+            lines = []
+            for title, table in sections:
+                rows = sorted(table.items(), key=lambda item: item[1].total_time, reverse=True)[
+                    :limit
+                ]
+                lines.append(
+                    f"{title:<60} {'count':>7} {'total s':>9} {'mean ms':>9} {'max ms':>9} {'trips':>7} {'wait s':>8}"
+                )
+                for name, stats in rows:
+                    lines.append(
+                        f"{name[:60]:<60} {stats.count:>7} {stats.total_time:>9.3f} "
+                        f"{stats.total_time / stats.count * 1000:>9.1f} {stats.max_time * 1000:>9.1f} "
+                        f"{stats.round_trips:>7} {stats.wait_time:>8.3f}"
+                    )
+                lines.append("")
+        return "\n".join(lines)
+
+    def report(self) -> None:
+        """
+        Logs the summary table and writes the JSON file configured through `PYAUTOTK_PROFILE_OUTPUT`.
+        Registered to run at interpreter exit.
+        """
+        if not self.by_operation:
+            return
+        self.logger.info("Profiling summary:\n%s", self.summary())
+        if config.profile_output:
+            self.dump(config.profile_output)
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, record: OperationRecord) -> None:
+        with self._lock:
+            self.by_operation.setdefault(record.operation, OperationStats()).add(record)
+            if record.xpath:
+                self.by_xpath.setdefault(record.xpath, OperationStats()).add(record)
+        for hook in self._hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                self.logger.warning("Profiler hook %r failed: %s", hook, e)
+
+
+profiler = Profiler()
+atexit.register(profiler.report)
+
+
+def profiled_operations(cls: type) -> type:
+    """
+    Class decorator that measures every public method of `cls` with the profiler.
+
+    The XPath of an operation is the `xpath` attribute of the instance (Widget) or the first argument of
+    methods whose first parameter is one of `XPATH_PARAMETERS` (controllers).
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        setattr(cls, name, _profiled(method, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _profiled(method: Callable[..., Any], operation: str) -> Callable[..., Any]:
+    parameters = list(inspect.signature(method).parameters)
+    takes_xpath = len(parameters) > 1 and parameters[1] in XPATH_PARAMETERS
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not profiler.enabled:
+            return method(self, *args, **kwargs)
+        if takes_xpath:
+            xpath = args[0] if args else kwargs.get(parameters[1])
+        else:
+            xpath = getattr(self, "xpath", None)
+        with profiler.operation(operation, xpath):
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,166 @@
+import json
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from pyautotk.core.config_loader import config
+
+# File extensions of the blockable resource types, matched against the URL path (with or without a query string).
+RESOURCE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "ogv", "mp3", "wav", "m4a", "mov"),
+    "stylesheet": ("css",),
+}
+
+# Hosts of common analytics and advertising services, blocked by the 'analytics' resource type.
+ANALYTICS_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*cdn.segment.com*",
+    "*clarity.ms*",
+)
+
+RESOURCE_TYPES = tuple(RESOURCE_EXTENSIONS) + ("analytics",)
+
+# Unroutable proxy that blocked Firefox requests are sent to, so they fail immediately.
+FIREFOX_BLACKHOLE_PROXY = "PROXY 127.0.0.1:9"
+
+
+def resolve_blocking(
+    resource_types: Optional[List[str]] = None, url_patterns: Optional[List[str]] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Returns the resource types and URL patterns to block, falling back to `config.block_resources` and
+    `config.block_urls` for the values that are not given.
+
+    Args:
+        resource_types (Optional[List[str]]): Resource types from `RESOURCE_TYPES`.
+        url_patterns (Optional[List[str]]): URL patterns where `*` matches any sequence of characters.
+
+    Returns:
+        Tuple[List[str], List[str]]: The normalized resource types and URL patterns.
+
+    Raises:
+        ValueError: If a resource type is not one of `RESOURCE_TYPES`.
+    """
+    types = [
+        name.lower()
+        for name in (config.block_resources if resource_types is None else resource_types)
+    ]
+    unknown = [name for name in types if name not in RESOURCE_TYPES]
+    if unknown:
+        raise ValueError(
+            f"Unsupported resource types: {unknown}. Supported values: {', '.join(RESOURCE_TYPES)}"
+        )
+    patterns = list(config.block_urls if url_patterns is None else url_patterns)
+    return types, patterns
+
+
+def blocked_url_patterns(resource_types: List[str], url_patterns: List[str]) -> List[str]:
+    """
+    Expands resource types into URL patterns, in the wildcard syntax of CDP `Network.setBlockedURLs`.
+
+    Args:
+        resource_types (List[str]): Resource types from `RESOURCE_TYPES`.
+        url_patterns (List[str]): Additional URL patterns.
+
+    Returns:
+        List[str]: Every pattern to block, without duplicates.
+    """
+    patterns = []
+    for name in resource_types:
+        if name == "analytics":
+            patterns.extend(ANALYTICS_PATTERNS)
+            continue
+        for extension in RESOURCE_EXTENSIONS[name]:
+            patterns.extend((f"*.{extension}", f"*.{extension}?*"))
+    patterns.extend(url_patterns)
+    return list(dict.fromkeys(patterns))
+
+
+def chrome_preferences(resource_types: List[str]) -> Dict[str, Any]:
+    """
+    Returns Chrome profile preferences for the resource types that Chrome can block natively. Images are
+    blocked by content setting, which also covers images whose URL has no file extension.
+    """
+    if "image" in resource_types:
+        return {"profile.managed_default_content_settings.images": 2}
+    return {}
+
+
+def firefox_preferences(resource_types: List[str], url_patterns: List[str]) -> Dict[str, Any]:
+    """
+    Returns Firefox preferences that block the resources. Images and web fonts have native preferences; the
+    remaining patterns are matched by a PAC script that sends blocked requests to an unroutable proxy.
+
+    Firefox passes only the scheme and host of HTTPS URLs to PAC scripts, so for HTTPS pages the path based
+    patterns (file extensions) do not match; host patterns such as the 'analytics' ones always do. For 'media',
+    autoplay is also disabled, which stops media from starting but does not prevent its download.
+    """
+    preferences: Dict[str, Any] = {}
+    if "image" in resource_types:
+        preferences["permissions.default.image"] = 2
+    if "font" in resource_types:
+        preferences["browser.display.use_document_fonts"] = 0
+    if "media" in resource_types:
+        preferences["media.autoplay.default"] = 5
+
+    patterns = blocked_url_patterns(
+        [name for name in resource_types if name not in ("image", "font")], url_patterns
+    )
+    if patterns:
+        preferences["network.proxy.type"] = 2
+        preferences["network.proxy.autoconfig_url"] = "data:text/javascript," + quote(
+            pac_script(patterns)
+        )
+    return preferences
+
+
+def pac_script(patterns: List[str]) -> str:
+    """
+    Builds a proxy auto-config script that routes URLs matching any of the patterns to an unroutable proxy.
+
+    Args:
+        patterns (List[str]): URL patterns where `*` matches any sequence of characters.
+
+    Returns:
+        str: The PAC script source.
+    """
+    return (
+        "function FindProxyForURL(url, host) {"
+        f" var patterns = {json.dumps(patterns)};"
+        " for (var i = 0; i < patterns.length; i++) {"
+        f" if (shExpMatch(url, patterns[i])) return {json.dumps(FIREFOX_BLACKHOLE_PROXY)};"
+        " }"
+        ' return "DIRECT"; }'
+    )
+
+
+def is_blocked(
+    url: str, resource_type: str, resource_types: List[str], url_patterns: List[str]
+) -> bool:
+    """
+    Tells whether a request is blocked, for engines that intercept requests and report their resource type
+    (Playwright).
+
+    Args:
+        url (str): The request URL.
+        resource_type (str): The resource type reported by the engine, e.g. 'image' or 'stylesheet'.
+        resource_types (List[str]): The blocked resource types.
+        url_patterns (List[str]): The blocked URL patterns.
+
+    Returns:
+        bool: True if the request must be aborted.
+    """
+    if resource_type in resource_types:
+        return True
+    patterns = list(url_patterns) + (
+        list(ANALYTICS_PATTERNS) if "analytics" in resource_types else []
+    )
+    return any(fnmatchcase(url, pattern) for pattern in patterns)
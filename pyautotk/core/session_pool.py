@@ -0,0 +1,191 @@
+import atexit
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.controller_factory import create_controller
+from pyautotk.core.logger_utils import initialize_logger
+
+if TYPE_CHECKING:
+    from pyautotk.core.browser_controller import BrowserController
+
+PoolKey = Tuple[str, bool, bool, str, int]
+
+
+class SessionPool:
+    """
+    Process-wide pool of warm BrowserController instances, keyed by (browser_type, headless, maximize),
+    the browser engine and the owning thread of engines bound to a thread.
+
+    Launching a browser and its driver service is the most expensive step of a session, so the pool
+    keeps idle controllers around and hands them out again after resetting their state. Controllers are
+    recycled after `max_uses` sessions or as soon as they fail a health check.
+
+    Playwright controllers only work on the thread that launched them, so they are pooled per thread and
+    closed by `close_thread` on that thread.
+    """
+
+    def __init__(self, max_uses: int = None) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            max_uses (int): Number of sessions a controller can serve before it is recycled.
+                Defaults to `config.session_pool_max_uses`.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self._max_uses = max_uses
+        self._idle: Dict[PoolKey, List["BrowserController"]] = {}
+        self._uses: Dict["BrowserController", int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_uses(self) -> int:
+        """Number of sessions a controller can serve before it is recycled."""
+        return self._max_uses or config.session_pool_max_uses
+
+    @staticmethod
+    def make_key(
+        browser_type: str = "", headless: bool = False, maximize: bool = False, engine: str = ""
+    ) -> PoolKey:
+        """
+        Builds the pool key, resolving empty values with the global configuration the same way
+        BrowserController does.
+
+        Args:
+            browser_type (str): The type of browser ('firefox' or 'chrome').
+            headless (bool): Whether the browser runs in headless mode.
+            maximize (bool): Whether the browser window is maximized.
+            engine (str): The browser engine. Defaults to `config.browser_engine`.
+
+        Returns:
+            PoolKey: The normalized (browser_type, headless, maximize, engine, owner) tuple, where `owner` is the
+                current thread identifier on the Playwright engine and 0 on engines usable from any thread.
+        """
+        engine = (engine or config.browser_engine).lower()
+        return (
+            browser_type.lower() or config.browser_type,
+            headless or config.headless_mode,
+            maximize or config.maximize_browser,
+            engine,
+            threading.get_ident() if engine == "playwright" else 0,
+        )
+
+    def prewarm(
+        self, browser_type: str = "", headless: bool = False, maximize: bool = False, count: int = 1
+    ) -> None:
+        """
+        Launches controllers ahead of time so the first sessions do not pay the browser startup cost.
+
+        Args:
+            browser_type (str): The type of browser ('firefox' or 'chrome').
+            headless (bool): Whether the browser runs in headless mode.
+            maximize (bool): Whether the browser window is maximized.
+            count (int): Number of controllers to launch. Default is 1.
+        """
+        key = self.make_key(browser_type, headless, maximize)
+        self.logger.info("Pre-warming %s browser session(s) for %s", count, key)
+        for _ in range(count):
+            controller = self._launch(key)
+            with self._lock:
+                self._idle.setdefault(key, []).append(controller)
+
+    def acquire(
+        self, browser_type: str = "", headless: bool = False, maximize: bool = False
+    ) -> "BrowserController":
+        """
+        Hands out an idle healthy controller for the given configuration, launching one if none is available.
+
+        Args:
+            browser_type (str): The type of browser ('firefox' or 'chrome').
+            headless (bool): Whether the browser runs in headless mode.
+            maximize (bool): Whether the browser window is maximized.
+
+        Returns:
+            BrowserController: A controller ready to open a URL.
+        """
+        key = self.make_key(browser_type, headless, maximize)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                controller = idle.pop() if idle else None
+            if controller is None:
+                self.logger.debug("No idle browser session for %s, launching a new one.", key)
+                return self._launch(key)
+            if controller.is_alive():
+                self.logger.debug("Reusing pooled browser session for %s", key)
+                return controller
+            self._discard(controller)
+
+    def release(self, controller: "BrowserController") -> None:
+        """
+        Returns a controller to the pool, resetting its state or recycling it if it is worn out or unhealthy.
+
+        Args:
+            controller (BrowserController): The controller previously obtained from `acquire`.
+        """
+        key = self.make_key(
+            controller.browser_type, controller.headless, controller.maximize, controller.engine
+        )
+        with self._lock:
+            self._uses[controller] = self._uses.get(controller, 0) + 1
+            uses = self._uses[controller]
+
+        if uses >= self.max_uses:
+            self.logger.debug("Recycling browser session after %s uses.", uses)
+            self._discard(controller)
+            return
+
+        try:
+            controller.reset_session()
+        except Exception as e:
+            self.logger.warning(
+                "Failed to reset pooled browser session, recycling it. Error: %s", e
+            )
+            self._discard(controller)
+            return
+
+        with self._lock:
+            self._idle.setdefault(key, []).append(controller)
+
+    def close_all(self) -> None:
+        """
+        Closes every idle controller the calling thread can close: the ones usable from any thread and the
+        ones it launched. Controllers owned by other threads are left to `close_thread` on their thread.
+        """
+        self._close(lambda owner: owner in (0, threading.get_ident()))
+
+    def close_thread(self) -> None:
+        """
+        Closes the idle controllers launched by the calling thread. Threads that pooled Playwright controllers
+        (e.g. ParallelRunner workers) call it before they finish.
+        """
+        self._close(lambda owner: owner == threading.get_ident())
+
+    def _close(self, closes: Callable[[int], bool]) -> None:
+        """Closes the idle controllers whose key owner is accepted by `closes`."""
+        with self._lock:
+            keys = [key for key in self._idle if closes(key[-1])]
+            controllers = [controller for key in keys for controller in self._idle.pop(key)]
+        for controller in controllers:
+            self._discard(controller)
+
+    def _launch(self, key: PoolKey) -> "BrowserController":
+        """Starts a new controller for the given pool key."""
+        browser_type, headless, maximize, engine, _ = key
+        return create_controller(
+            browser_type=browser_type, maximize=maximize, headless=headless, engine=engine
+        )
+
+    def _discard(self, controller: "BrowserController") -> None:
+        """Closes a controller and forgets its usage counter."""
+        with self._lock:
+            self._uses.pop(controller, None)
+        try:
+            controller.close_browser()
+        except Exception as e:
+            self.logger.debug("Ignoring error while closing a recycled browser session: %s", e)
+
+
+session_pool = SessionPool()
+atexit.register(session_pool.close_all)
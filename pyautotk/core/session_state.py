@@ -0,0 +1,136 @@
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.json_files import write_json
+
+# Reads the origin, localStorage and sessionStorage of the current document.
+CAPTURE_STORAGE_SCRIPT = """
+    const dump = (storage) => {
+        const items = {};
+        for (let i = 0; i < storage.length; i++) {
+            const key = storage.key(i);
+            items[key] = storage.getItem(key);
+        }
+        return items;
+    };
+    return {origin: window.location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Writes captured storage into the current document when it belongs to the captured origin.
+APPLY_STORAGE_FUNCTION = """
+    function (origin, local, session) {
+        if (window.location.origin !== origin) {
+            return false;
+        }
+        for (const [key, value] of Object.entries(local)) {
+            window.localStorage.setItem(key, value);
+        }
+        for (const [key, value] of Object.entries(session)) {
+            window.sessionStorage.setItem(key, value);
+        }
+        return true;
+    }
+"""
+
+APPLY_STORAGE_SCRIPT = f"return ({APPLY_STORAGE_FUNCTION}).apply(null, arguments);"
+
+# Cheap same-origin page opened by drivers that can only set cookies and storage on a document of the origin.
+RESTORE_LANDING_PATH = "/favicon.ico"
+
+# WebDriver cookie fields shared with the CDP and Playwright cookie formats, which name the expiry `expires`.
+_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+
+
+@dataclass
+class SessionState:
+    """
+    Cookies, localStorage and sessionStorage of a page, and its URL, captured so a fresh session can start where a
+    setup or login flow left off. Cookies use the WebDriver format.
+    """
+
+    url: str
+    origin: str
+    cookies: List[Dict[str, Any]] = field(default_factory=list)
+    local_storage: Dict[str, str] = field(default_factory=dict)
+    session_storage: Dict[str, str] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    def is_expired(self, ttl: float = None) -> bool:
+        """
+        Tells whether the state is older than `ttl` seconds.
+
+        Args:
+            ttl (float): Maximum age in seconds; 0 never expires. Defaults to `config.session_state_ttl`.
+
+        Returns:
+            bool: True if the state is too old to be restored.
+        """
+        ttl = config.session_state_ttl if ttl is None else ttl
+        return ttl > 0 and time.time() - self.created_at > ttl
+
+    def save(self, path: str) -> None:
+        """
+        Writes the state to a JSON file, atomically so concurrent readers never see a partial file.
+
+        Args:
+            path (str): The destination file.
+        """
+        write_json(path, asdict(self))
+
+    @classmethod
+    def load(cls, path: str) -> "SessionState":
+        """
+        Reads a state written by `save`.
+
+        Args:
+            path (str): The JSON file.
+
+        Returns:
+            SessionState: The state.
+        """
+        with open(path, encoding="utf-8") as state_file:
+            return cls(**json.load(state_file))
+
+    def storage_seed_script(self) -> str:
+        """Returns a script applying the storage of the state to documents of its origin, for new-document hooks."""
+        arguments = ", ".join(
+            json.dumps(value) for value in (self.origin, self.local_storage, self.session_storage)
+        )
+        return f"({APPLY_STORAGE_FUNCTION})({arguments});"
+
+
+def load_session_state(path: str, ttl: float = None) -> Optional[SessionState]:
+    """
+    Reads a saved state if it exists and has not expired.
+
+    Args:
+        path (str): The JSON file written by `SessionState.save`.
+        ttl (float): Maximum age in seconds; 0 never expires. Defaults to `config.session_state_ttl`.
+
+    Returns:
+        Optional[SessionState]: The state, or None if the file is missing, unreadable or expired.
+    """
+    try:
+        state = SessionState.load(path)
+    except (OSError, ValueError, TypeError):
+        return None
+    return None if state.is_expired(ttl) else state
+
+
+def to_protocol_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a WebDriver cookie to the format of CDP `Network.setCookies` and Playwright `add_cookies`."""
+    converted = {name: cookie[name] for name in _COOKIE_FIELDS if name in cookie}
+    if "expiry" in cookie:
+        converted["expires"] = cookie["expiry"]
+    return converted
+
+
+def from_protocol_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a Playwright (or CDP) cookie to the WebDriver format; session cookies have no expiry."""
+    converted = {name: cookie[name] for name in _COOKIE_FIELDS if name in cookie}
+    if cookie.get("expires", -1) >= 0:
+        converted["expiry"] = int(cookie["expires"])
+    return converted
@@ -0,0 +1,111 @@
+import time
+from typing import Any
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pyautotk.core.browser_controller import BrowserController
+from pyautotk.core.exceptions import BrowserWaitForPageLoadException
+from pyautotk.core.profiler import profiled_operations
+from pyautotk.core.window_routing import WindowFocus, WindowRouter, routed_copy
+
+# Navigates the page once the script has returned, so the driver does not wait for the new page to load. The current
+# document is marked first: the navigation has committed once the tab shows a document without the mark.
+START_NAVIGATION_SCRIPT = """
+    const url = arguments[0];
+    document.__pyautotkNavigationPending = true;
+    window.setTimeout(function () { window.location.href = url; }, 0);
+"""
+NAVIGATION_COMMITTED_SCRIPT = "return document.__pyautotkNavigationPending !== true;"
+NAVIGATION_POLL_INTERVAL = 0.1
+
+
+@profiled_operations
+class BrowserTab(BrowserController):
+    """
+    A tab opened by `BrowserController.open_tab`, exposing the controller API on its own window so Widget works
+    unchanged. The tab shares the WebDriver session of its controller: each command switches to the tab only when
+    another window has the focus, so tabs can be used in any order (or from several threads) while the others load.
+    """
+
+    def __init__(self, controller: BrowserController, window: str, focus: WindowFocus) -> None:
+        """
+        Initializes the tab with the configuration of the controller that opened it.
+
+        Args:
+            controller (BrowserController): The controller whose session hosts the tab.
+            window (str): The window handle of the tab.
+            focus (WindowFocus): The focus of the shared session.
+        """
+        super().__init__(
+            controller.browser_type,
+            controller.maximize,
+            controller.headless,
+            kill_browser=controller.kill_browser,
+            cache_elements=controller.cache_elements,
+            block_resources=controller.block_resources,
+            block_urls=controller.block_urls,
+            driver=routed_copy(
+                controller.driver, lambda execute: WindowRouter(focus, execute, window)
+            ),
+        )
+        self.controller = controller
+        self._window_focus = focus
+        self._navigation_pending = False
+
+    def start_loading(self, url: str) -> None:
+        """
+        Starts navigating the tab to the URL without waiting for the page to load, so several tabs load at once.
+        The next page or element wait on the tab first waits for the navigation to commit, so it never runs against
+        the document the tab is leaving.
+
+        Args:
+            url (str): The URL to open in the tab.
+        """
+        self.logger.info("Start loading url: %s ", url)
+        self._flush_pending_batch()
+        self.invalidate_element_cache()
+        self.driver.execute_script(START_NAVIGATION_SCRIPT, url)
+        self._navigation_pending = True
+
+    def _wait_for_page(self, condition: str, quiet_time: float, timeout: float) -> None:
+        """
+        Waits for the navigation started by `start_loading` to commit, then for the page condition for the
+        remaining time.
+        """
+        started = time.monotonic()
+        self._wait_for_navigation_commit(timeout)
+        super()._wait_for_page(condition, quiet_time, timeout - (time.monotonic() - started))
+
+    def _locate(self, xpath: str, condition: str, timeout: int, strategy: str = None) -> Any:
+        """
+        Waits for the navigation started by `start_loading` to commit, then locates the element as usual.
+        """
+        self._wait_for_navigation_commit(timeout)
+        return super()._locate(xpath, condition, timeout, strategy)
+
+    def _wait_for_navigation_commit(self, timeout: float) -> None:
+        """
+        Polls until the document marked by `START_NAVIGATION_SCRIPT` has been replaced. The check runs only once
+        per `start_loading` call.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the navigation does not commit within the given time.
+        """
+        if not self._navigation_pending:
+            return
+        self.logger.debug("Wait for the navigation of tab %s to commit.", self.original_window)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=NAVIGATION_POLL_INTERVAL).until(
+                lambda driver: driver.execute_script(NAVIGATION_COMMITTED_SCRIPT)
+            )
+        except TimeoutException as e:
+            raise BrowserWaitForPageLoadException(timeout, "navigation") from e
+        self._navigation_pending = False
+
+    def close_browser(self) -> None:
+        """
+        Closes this tab. The browser and the other tabs stay open.
+        """
+        self.logger.debug("Closing tab %s", self.original_window)
+        self.driver.close()
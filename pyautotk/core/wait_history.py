@@ -0,0 +1,169 @@
+import atexit
+import math
+import threading
+from typing import Any, Dict, List, Set, Tuple
+
+from pyautotk.core.config_loader import config
+from pyautotk.core.json_files import read_json, update_json
+from pyautotk.core.locator_index import page_key
+from pyautotk.core.logger_utils import initialize_logger
+
+# Durations kept per locator; older samples are dropped so the history follows the application.
+MAX_SAMPLES = 50
+
+# Samples needed before a locator gets an adaptive timeout instead of the one passed by the caller.
+MIN_SAMPLES = 5
+
+# Element timeout of the Widget and controller methods when the caller does not pass one. Only this timeout is
+# shortened by the history (see `WaitHistory.timeout_for`).
+DEFAULT_TIMEOUT = 10
+
+# A wait that timed out is recorded as this many times its timeout, since the element needed longer than that.
+TIMEOUT_BACKOFF = 2.0
+
+logger = initialize_logger("WaitHistory")
+
+
+def percentile(samples: List[float], rank: float) -> float:
+    """Returns the nearest-rank percentile of the samples, e.g. `rank=95` for the 95th percentile."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+def _is_history(data: Any) -> bool:
+    """Tells whether decoded JSON has the shape of a history: durations by locator by page."""
+    return isinstance(data, dict) and all(
+        isinstance(entries, dict)
+        and all(
+            isinstance(samples, list)
+            and all(isinstance(sample, (int, float)) for sample in samples)
+            for samples in entries.values()
+        )
+        for entries in data.values()
+    )
+
+
+class WaitHistory:
+    """
+    How long each locator took to satisfy its wait condition on each page, persisted as JSON so element waits can
+    use timeouts learned from earlier runs (see `timeout_for`).
+    """
+
+    def __init__(self, path: str = "") -> None:
+        """
+        Args:
+            path (str): The JSON file of the history. Defaults to `config.wait_history_path`.
+        """
+        self._path = path
+        self._pages: Dict[str, Dict[str, List[float]]] = {}
+        # Locators whose latest wait timed out, by page, until they are found again.
+        self._timed_out: Set[Tuple[str, str]] = set()
+        # Samples recorded since the last save, merged into the file by `save`.
+        self._new: Dict[str, Dict[str, List[float]]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path or config.wait_history_path
+
+    def record(self, url: str, locator: str, duration: float) -> None:
+        """
+        Records how long a successful wait took.
+
+        Args:
+            url (str): The page URL.
+            locator (str): The locator (XPath or `css=` selector) that was waited for.
+            duration (float): The wait duration in seconds.
+        """
+        with self._lock:
+            self._load()
+            for pages in (self._pages, self._new):
+                samples = pages.setdefault(page_key(url), {}).setdefault(locator, [])
+                samples.append(round(duration, 3))
+                del samples[:-MAX_SAMPLES]
+            self._timed_out.discard((page_key(url), locator))
+
+    def record_timeout(self, url: str, locator: str, timeout: float) -> None:
+        """
+        Records a wait that timed out. The element needed more than `timeout` seconds, so `TIMEOUT_BACKOFF` times
+        the timeout is recorded and the next waits for the locator back off upward.
+
+        Args:
+            url (str): The page URL.
+            locator (str): The locator that was waited for.
+            timeout (float): The timeout of the failed wait in seconds.
+        """
+        self.record(url, locator, timeout * TIMEOUT_BACKOFF)
+        with self._lock:
+            self._timed_out.add((page_key(url), locator))
+
+    def timeout_for(self, url: str, locator: str, timeout: float) -> float:
+        """
+        Returns the timeout of a wait. The learned timeout is `config.adaptive_timeout_percentile` of the recorded
+        durations, or the sample recorded by `record_timeout` if the latest wait timed out and it is longer, plus
+        `config.adaptive_timeout_margin` seconds, capped at `config.adaptive_timeout_max`.
+
+        The learned timeout replaces the default timeout (`DEFAULT_TIMEOUT`), shortening or lengthening it. A timeout
+        passed by the caller is never shortened: the learned timeout is only used when it is longer. A timeout of
+        `DEFAULT_TIMEOUT` seconds counts as the default, since both cannot be told apart.
+
+        Args:
+            url (str): The page URL.
+            locator (str): The locator that will be waited for.
+            timeout (float): The timeout given by the caller, used until `MIN_SAMPLES` durations were recorded.
+
+        Returns:
+            float: The timeout in seconds.
+        """
+        with self._lock:
+            self._load()
+            samples = self._pages.get(page_key(url), {}).get(locator, [])
+            if len(samples) < MIN_SAMPLES:
+                return timeout
+            slowest = percentile(samples, config.adaptive_timeout_percentile)
+            if (page_key(url), locator) in self._timed_out:
+                slowest = max(slowest, samples[-1])
+        learned = min(slowest + config.adaptive_timeout_margin, config.adaptive_timeout_max)
+        return learned if timeout == DEFAULT_TIMEOUT else max(learned, timeout)
+
+    def save(self) -> None:
+        """
+        Adds the samples recorded since the last save to the JSON file, keeping the samples other processes saved
+        in the meantime. Registered to run at interpreter exit and, by ParallelRunner, at worker process exit.
+        """
+        with self._lock:
+            if not self._new:
+                return
+            try:
+                self._pages = update_json(self.path, self._merge, {}, indent=None)
+                self._new = {}
+            except OSError as e:
+                logger.warning("Could not write the wait history %s. Error: %s", self.path, e)
+
+    def _merge(self, data: Any) -> Dict[str, Dict[str, List[float]]]:
+        """Appends the new samples to the history read from the file, which is replaced if malformed."""
+        pages = data if _is_history(data) else {}
+        for page, entries in self._new.items():
+            for locator, samples in entries.items():
+                merged = pages.setdefault(page, {}).setdefault(locator, [])
+                merged.extend(samples)
+                del merged[:-MAX_SAMPLES]
+        return pages
+
+    def _load(self) -> None:
+        """Reads the JSON file on first use. A file that does not hold a history is ignored."""
+        if self._loaded:
+            return
+        self._loaded = True
+        data = read_json(self.path, {})
+        if _is_history(data):
+            self._pages = data
+        else:
+            logger.warning(
+                "Ignoring the wait history %s, it does not hold wait durations.", self.path
+            )
+
+
+wait_history = WaitHistory()
+atexit.register(wait_history.save)
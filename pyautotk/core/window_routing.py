@@ -0,0 +1,101 @@
+import copy
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from selenium.webdriver.remote.command import Command
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# Longest in-page wait (in seconds) sent as one command on a session shared by several windows. A WebDriver session
+# runs one command at a time, so longer waits are split to let the other tabs and contexts take turns.
+SHARED_SESSION_WAIT_SLICE = 1.0
+
+# Driver helpers bound to the WebDriver instance, rebuilt for every routed copy.
+_DRIVER_BOUND_HELPERS = ("_switch_to", "_mobile", "_fedcm")
+
+
+class WindowFocus:
+    """
+    The focused window of a WebDriver session shared by several routed drivers, and the lock that keeps each
+    command together with the switch that precedes it.
+    """
+
+    def __init__(self, window: Optional[str]) -> None:
+        self.lock = threading.RLock()
+        self.window = window
+
+
+class WindowRouter:
+    """
+    Sends the commands of a driver to one window of a shared session, switching to it first only when another
+    window has the focus. Switching windows through the driver moves it to the new window, and the current window
+    handle is answered without a round trip.
+    """
+
+    def __init__(self, focus: WindowFocus, execute: Callable[..., Any], window: str) -> None:
+        """
+        Args:
+            focus (WindowFocus): The focus of the shared session.
+            execute (Callable[..., Any]): The unrouted `execute` of the driver.
+            window (str): The handle of the window the driver works on.
+        """
+        self.focus = focus
+        self.window = window
+        self._execute = execute
+
+    def execute(self, driver_command: str, params: dict = None) -> Any:
+        if not isinstance(driver_command, str):
+            # WebDriver BiDi commands name their browsing context themselves.
+            return self._execute(driver_command, params)
+        if driver_command == Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+            return {"value": self.window}
+        with self.focus.lock:
+            if driver_command != Command.SWITCH_TO_WINDOW and self.focus.window != self.window:
+                self._execute(Command.SWITCH_TO_WINDOW, {"handle": self.window})
+                self.focus.window = self.window
+
+            response = self._execute(driver_command, params)
+            if driver_command == Command.SWITCH_TO_WINDOW:
+                self.window = self.focus.window = params["handle"]
+            elif driver_command == Command.CLOSE:
+                self.focus.window = None
+            return response
+
+
+def route_driver(driver: "WebDriver", focus: WindowFocus) -> None:
+    """
+    Routes the commands of a driver, e.g. the driver of a controller that opened tabs, to the window it currently
+    works on.
+
+    Args:
+        driver (WebDriver): The driver to route in place.
+        focus (WindowFocus): The focus of its session.
+    """
+    driver.execute = WindowRouter(focus, driver.execute, focus.window).execute
+
+
+def routed_copy(
+    driver: "WebDriver", router_factory: Callable[[Callable[..., Any]], WindowRouter]
+) -> "WebDriver":
+    """
+    Returns a shallow copy of a driver that shares its session and connection, with its commands sent through a
+    router of its own. Elements found through the copy use the same routing.
+
+    Args:
+        driver (WebDriver): The session driver.
+        router_factory (Callable[[Callable[..., Any]], WindowRouter]): Builds the router from the unrouted `execute`
+            of the copy.
+
+    Returns:
+        WebDriver: The routed copy. Its `quit` is routed to the router's `quit` when the router has one.
+    """
+    routed = copy.copy(driver)
+    for name in _DRIVER_BOUND_HELPERS:
+        if name in vars(routed):
+            setattr(routed, name, type(getattr(routed, name))(routed))
+    router = router_factory(type(driver).execute.__get__(routed))
+    routed.execute = router.execute
+    if hasattr(router, "quit"):
+        routed.quit = router.quit
+    return routed
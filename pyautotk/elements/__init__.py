@@ -1,2 +1,19 @@
-from .widget import Widget  # noqa
-from .helpers.session_helpers import browser_session  # noqa
+from typing import TYPE_CHECKING
+
+from pyautotk.core.lazy_imports import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    "Widget": "pyautotk.elements.widget",
+    "AsyncWidget": "pyautotk.elements.async_widget",
+    "browser_session": "pyautotk.elements.helpers.session_helpers",
+    "async_browser_session": "pyautotk.elements.helpers.session_helpers",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .widget import Widget  # noqa
+    from .async_widget import AsyncWidget  # noqa
+    from .helpers.session_helpers import browser_session  # noqa
+    from .helpers.session_helpers import async_browser_session  # noqa
@@ -0,0 +1,460 @@
+import warnings
+from typing import Dict, Any, List, Optional
+from pyautotk.core.config_loader import config
+from pyautotk.core.exceptions import ElementNotVisibleException
+from pyautotk.core.logger_utils import initialize_logger
+from pyautotk.elements.widget import DOUBLE_CLICK_DELAY_DEPRECATION, Widget, PROPERTY_ATTRIBUTES
+
+
+class AsyncWidget(Widget):
+    """
+    Coroutine version of Widget, to be used with an AsyncBrowserController. XPath construction is shared with
+    Widget; every interaction method is awaitable.
+    """
+
+    async def click(self, timeout: int = 10) -> None:
+        """
+        Clicks on the element identified by the constructed XPath.
+
+        Args:
+            timeout (int): Maximum time to wait for the element to be present before clicking. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Attempting to click on element with XPath: %s (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
+        )
+        try:
+            await self.controller.click_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to click on element with XPath: %s. Error: %s", self.xpath, e)
+            raise
+
+    async def double_click(self, delay: Optional[float] = None, timeout: int = 10) -> None:
+        """
+        Performs a native double-click on the element, so the page receives a real `dblclick` event. Both clicks are
+        sent in a single request.
+
+        Args:
+            delay (Optional[float]): Deprecated and ignored; passing it emits a DeprecationWarning.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        if delay is not None:
+            warnings.warn(DOUBLE_CLICK_DELAY_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self.logger.info("Performing double-click on element with XPath: %s", self.xpath)
+        try:
+            await self.controller.double_click_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to double-click on element. Error: %s", e)
+            raise
+
+    async def right_click(self, timeout: int = 10) -> None:
+        """
+        Performs a native right-click on the element, opening its context menu.
+
+        Args:
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info("Performing right-click on element with XPath: %s", self.xpath)
+        try:
+            await self.controller.right_click_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to right-click on element. Error: %s", e)
+            raise
+
+    async def hover(self, timeout: int = 10) -> None:
+        """
+        Simulates a mouse hover action over the element identified by the XPath.
+
+        Args:
+            timeout (int): Maximum time to wait for the element to become present before hovering. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Attempting to hover over element with XPath: %s (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
+        )
+        try:
+            await self.controller.hover_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error(
+                "Failed to hover over element with XPath: %s. Error: %s", self.xpath, e
+            )
+            raise
+
+    async def unhover(self, timeout: int = 10) -> None:
+        """
+        Moves the mouse away from the current element to remove the hover state.
+
+        Args:
+            timeout (int): Maximum time to wait for the action to complete. Default is 10 seconds.
+        """
+        self.logger.info("Attempting to unhover from element with XPath: %s", self.xpath)
+        try:
+            await self.controller.unhover_element(timeout)
+        except Exception as e:
+            self.logger.error("Failed to unhover. Error: %s", e)
+            raise
+
+    async def enter_text(self, text: str, timeout: int = 10) -> None:
+        """
+        Enters text into the element (e.g., an input field) identified by the XPath.
+
+        Args:
+            text (str): The text to be entered into the element.
+            timeout (int): Maximum time to wait for the element to be present before entering text. Default is 10 seconds.
+        """
+        self.logger.info("Entering text '%s' into element with XPath: %s", text, self.xpath)
+        try:
+            await self.controller.enter_text_safely(self.locator, text, timeout)
+        except Exception as e:
+            self.logger.error(
+                "Failed to enter text into element with XPath: %s. Error: %s", self.xpath, e
+            )
+            raise
+
+    async def scroll_to(self, timeout: int = 10) -> None:
+        """
+        Scrolls to the element using the specified XPath.
+
+        Args:
+            timeout (int): Maximum time to wait for the element to be present before scrolling. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Scrolling to element with XPath: %s (Timeout: %s seconds)", self.xpath, timeout
+        )
+        try:
+            await self.controller.scroll_to_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error(
+                "Failed to scroll to element with XPath: %s. Error: %s", self.xpath, e
+            )
+            raise
+
+    async def wait_for(self, timeout: int = 10) -> Any:
+        """
+        Waits until the element identified by the XPath is visible.
+
+        Args:
+            timeout (int): Maximum time to wait for the element to become visible. Default is 10 seconds.
+
+        Returns:
+            Any: The WebElement if found and visible.
+        """
+        self.logger.info(
+            "Waiting for element with XPath: %s to become visible (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
+        )
+        try:
+            return await self.controller.wait_for_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to wait for element with XPath: %s. Error: %s", self.xpath, e)
+            raise ElementNotVisibleException(self.xpath, timeout, e)
+
+    async def properties(self, timeout: int = 10, snapshot: bool = False) -> Dict[str, Any]:
+        """
+        Extracts and returns properties of the first element identified by the XPath.
+
+        Args:
+            timeout (int): Maximum time to wait for the element to be present before retrieving properties. Default is 10 seconds.
+            snapshot (bool): Whether to collect all the properties in a single script call. Default is False,
+                unless enabled globally through `config.snapshot_properties`.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing properties for the first matching element.
+        """
+        self.logger.info(
+            "Attempting to retrieve information from the first element with XPath: %s", self.xpath
+        )
+        try:
+            if snapshot or config.snapshot_properties:
+                return await self.controller.get_element_properties(
+                    self.locator, PROPERTY_ATTRIBUTES, timeout
+                )
+            return await self.controller.run_on_element(
+                self.locator, self._extract_element_properties, timeout, condition="visible"
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve information from element with XPath: %s. Error: %s",
+                self.xpath,
+                e,
+            )
+            raise
+
+    async def all_properties(
+        self, timeout: int = 10, snapshot: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Extracts and returns properties of all elements that match the XPath.
+
+        Args:
+            timeout (int): Maximum time to wait for the elements to be present before retrieving properties. Default is 10 seconds.
+            snapshot (bool): Whether to collect the properties of every match in a single script call. Default is False,
+                unless enabled globally through `config.snapshot_properties`.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing properties for a matching element.
+        """
+        self.logger.info(
+            "Attempting to retrieve information from all elements with XPath: %s", self.xpath
+        )
+        try:
+            if snapshot or config.snapshot_properties:
+                return await self.controller.get_element_properties(
+                    self.locator, PROPERTY_ATTRIBUTES, timeout, all_matches=True
+                )
+            elements = await self.controller.wait_for_all_elements(self.locator, timeout)
+            return [
+                await self.controller.run(self._extract_element_properties, element)
+                for element in elements
+            ]
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve information from elements with XPath: %s. Error: %s",
+                self.xpath,
+                e,
+            )
+            raise
+
+    async def get_attribute(self, attribute_name: str, timeout: int = 10) -> str:
+        """
+        Retrieves the value of a specific attribute from the element.
+
+        Args:
+            attribute_name (str): The name of the attribute to retrieve.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+
+        Returns:
+            str: The value of the specified attribute, or None if not found.
+        """
+        self.logger.info(
+            "Getting attribute '%s' for element with XPath: %s", attribute_name, self.xpath
+        )
+        try:
+            return await self.controller.get_element_attribute(
+                self.locator, attribute_name, timeout
+            )
+        except Exception as e:
+            self.logger.error("Failed to get attribute '%s'. Error: %s", attribute_name, e)
+            raise
+
+    async def extract_table(
+        self,
+        attributes: List[str] = None,
+        text: bool = True,
+        rect: bool = False,
+        displayed: bool = False,
+        timeout: int = 10,
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts the chosen fields of every element matching the XPath in a single call, as one list per field.
+
+        Args:
+            attributes (List[str]): The attribute names to extract, each becoming a column. Default is none.
+            text (bool): Whether to include the `text` column. Default is True.
+            rect (bool): Whether to include the `x`, `y`, `width` and `height` columns. Default is False.
+            displayed (bool): Whether to include the `displayed` column. Default is False.
+            timeout (int): Maximum time to wait for at least one element. Default is 10 seconds.
+
+        Returns:
+            Dict[str, List[Any]]: The extracted columns, all of the same length and in document order.
+        """
+        self.logger.info("Extracting a table from all elements with XPath: %s", self.xpath)
+        try:
+            return await self.controller.extract_table(
+                self.locator, attributes, text, rect, displayed, timeout
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to extract a table from elements with XPath: %s. Error: %s", self.xpath, e
+            )
+            raise
+
+    @staticmethod
+    async def extract_all_elements_with_attribute(
+        controller: Any, attribute: str, timeout: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Retrieves all elements in the page that have a specific attribute. The wait polls from the event loop, so no
+        worker thread is held while the elements appear, and the values are read with a single `extract_table` call.
+
+        Args:
+            controller (Any): The AsyncBrowserController to use for locating the elements.
+            attribute (str): The attribute to search for in the elements.
+            timeout (int): Maximum time to wait for at least one element. Default is 10 seconds.
+
+        Returns:
+            Dict[str, Any]: A dictionary where the keys are the attribute values and the values are the corresponding elements.
+        """
+        logger = initialize_logger("AsyncWidget")
+        logger.info("Retrieving all elements with attribute: %s", attribute)
+        xpath = f"//*[@{attribute}]"
+        try:
+            elements = await controller.wait_for_all_elements(xpath, timeout)
+            values = (await controller.extract_table(xpath, [attribute], text=False, timeout=0))[
+                attribute
+            ]
+            if len(values) != len(elements):
+                logger.warning(
+                    "Page changed while reading attribute '%s', reading it per element instead.",
+                    attribute,
+                )
+                values = await controller.run(
+                    lambda: [element.get_attribute(attribute) for element in elements]
+                )
+            return dict(zip(values, elements))
+        except Exception as e:
+            logger.error("Failed to retrieve elements with attribute: %s. Error: %s", attribute, e)
+            raise
+
+    async def upload_file(self, file_path: str, timeout: int = 10) -> None:
+        """
+        Uploads a file to the element, which should be a file input.
+
+        Args:
+            file_path (str): The absolute path of the file to upload.
+            timeout (int): Maximum time to wait for the element to be present. Default is 10 seconds.
+        """
+        self.logger.info("Uploading file '%s' to element with XPath: %s", file_path, self.xpath)
+        try:
+            await self.controller.upload_file(self.locator, file_path, timeout)
+        except Exception as e:
+            self.logger.error(
+                "Failed to upload file to element with XPath: %s. Error: %s", self.xpath, e
+            )
+            raise
+
+    async def select_by_text(self, text: str, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown element by its visible text.
+
+        Args:
+            text (str): The visible text of the option to select.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Selecting option '%s' by text from dropdown with XPath: %s", text, self.xpath
+        )
+        try:
+            await self.controller.select_option_by_text(self.locator, text, timeout)
+        except Exception as e:
+            self.logger.error("Failed to select option by text. Error: %s", e)
+            raise
+
+    async def select_by_value(self, value: str, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown element by its 'value' attribute.
+
+        Args:
+            value (str): The value attribute of the option to select.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Selecting option with value '%s' from dropdown with XPath: %s", value, self.xpath
+        )
+        try:
+            await self.controller.select_option_by_value(self.locator, value, timeout)
+        except Exception as e:
+            self.logger.error("Failed to select option by value. Error: %s", e)
+            raise
+
+    async def select_by_index(self, index: int, timeout: int = 10) -> None:
+        """
+        Selects an option from a dropdown element by its index (0-based).
+
+        Args:
+            index (int): The index of the option to select.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Selecting option at index %s from dropdown with XPath: %s", index, self.xpath
+        )
+        try:
+            await self.controller.select_option_by_index(self.locator, index, timeout)
+        except Exception as e:
+            self.logger.error("Failed to select option by index. Error: %s", e)
+            raise
+
+    async def deselect_all(self, timeout: int = 10) -> None:
+        """
+        Deselects all options in a multi-select dropdown.
+
+        Args:
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info("Deselecting all options from dropdown with XPath: %s", self.xpath)
+        try:
+            await self.controller.deselect_all_options(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to deselect all options. Error: %s", e)
+            raise
+
+    async def deselect_by_text(self, text: str, timeout: int = 10) -> None:
+        """
+        Deselects an option from a multi-select dropdown by its visible text.
+
+        Args:
+            text (str): The visible text of the option to deselect.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Deselecting option '%s' by text from dropdown with XPath: %s", text, self.xpath
+        )
+        try:
+            await self.controller.deselect_option_by_text(self.locator, text, timeout)
+        except Exception as e:
+            self.logger.error("Failed to deselect option by text. Error: %s", e)
+            raise
+
+    async def get_selected_texts(self, timeout: int = 10) -> list[str]:
+        """
+        Gets the text of all selected options from a dropdown.
+
+        Args:
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+
+        Returns:
+            list[str]: A list of the visible text of all selected options.
+        """
+        self.logger.info("Getting selected options' text from dropdown with XPath: %s", self.xpath)
+        try:
+            return await self.controller.get_all_selected_options_text(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to get selected options' text. Error: %s", e)
+            raise
+
+    async def set_value(self, value: str, timeout: int = 10) -> None:
+        """
+        Sets the value of an element directly using JavaScript.
+
+        Args:
+            value (str): The value to set on the element.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        self.logger.info("Setting value '%s' for element with XPath: %s", value, self.xpath)
+        try:
+            await self.controller.set_element_value(self.locator, value, timeout)
+        except Exception as e:
+            self.logger.error(
+                "Failed to set value for element with XPath: %s. Error: %s", self.xpath, e
+            )
+            raise
+
+    async def drag_to(self, target_widget: Widget, timeout: int = 10) -> None:
+        """
+        Drags the current widget and drops it onto the target widget.
+
+        Args:
+            target_widget (Widget): The widget instance to drop onto.
+            timeout (int): Maximum time to wait for the elements. Default is 10 seconds.
+        """
+        self.logger.info("Dragging element '%s' to '%s'.", self.xpath, target_widget.xpath)
+        try:
+            await self.controller.drag_and_drop(self.locator, target_widget.locator, timeout)
+        except Exception as e:
+            self.logger.error(
+                "Failed to drag element '%s' to '%s'. Error: %s", self.xpath, target_widget.xpath, e
+            )
+            raise
@@ -1,18 +1,37 @@
-from pyautotk.core.input import KeyboardController
+from pyautotk.core.exceptions import UnsupportedEngineException
+from pyautotk.core.input import KeyboardController, MouseController
 from pyautotk.core.logger_utils import initialize_logger
 from typing import Any
 
 
+def _webdriver(controller: Any, feature: str) -> Any:
+    """
+    Returns the Selenium WebDriver of a controller, which Keyboard and Mouse send their input actions to.
+
+    Raises:
+        UnsupportedEngineException: If the controller runs on an engine without a WebDriver (Playwright).
+    """
+    engine = getattr(controller, "engine", "selenium")
+    if engine != "selenium":
+        raise UnsupportedEngineException(feature, engine)
+    return controller.driver
+
+
 class Keyboard:
+    """Key presses, shortcuts and typed text sent to the focused element of a session."""
+
     def __init__(self, controller: Any) -> None:
         """
         Initializes the interface for keyboard actions.
-        
+
         Args:
             controller (Any): The controller instance that provides keyboard actions.
+
+        Raises:
+            UnsupportedEngineException: If the session runs on the Playwright engine.
         """
         self.logger = initialize_logger(self.__class__.__name__)
-        self.controller = KeyboardController(controller.driver)
+        self.controller = KeyboardController(_webdriver(controller, "Keyboard"))
 
     def enter(self) -> None:
         """Simulates pressing the Enter key."""
@@ -65,20 +84,57 @@ class Keyboard:
         self.controller.press_space()
 
     def control(self) -> None:
-        """Simulates pressing the Control key."""
+        """Holds the Control key down for the keys sent next, until `release_modifiers` is called."""
         self.logger.info("Pressing Control key.")
         self.controller.press_control()
 
     def shift(self) -> None:
-        """Simulates pressing the Shift key."""
+        """Holds the Shift key down for the keys sent next, until `release_modifiers` is called."""
         self.logger.info("Pressing Shift key.")
         self.controller.press_shift()
 
     def alt(self) -> None:
-        """Simulates pressing the Alt key."""
+        """Holds the Alt key down for the keys sent next, until `release_modifiers` is called."""
         self.logger.info("Pressing Alt key.")
         self.controller.press_alt()
 
+    def release_modifiers(self) -> None:
+        """Releases the modifier keys held by `control`, `shift` and `alt`."""
+        self.logger.info("Releasing held keys.")
+        self.controller.release_all()
+
+    def shortcut(self, *keys: str, times: int = 1) -> None:
+        """
+        Presses a key combination, holding the modifiers while the last key is pressed.
+
+        Args:
+            *keys (str): Key names such as 'ctrl', 'shift', 'k' (see `pyautotk.core.input.KEY_NAMES`).
+            times (int): Number of times the combination is pressed. Default is 1.
+        """
+        self.logger.info("Pressing shortcut %s (x%s).", "+".join(keys), times)
+        self.controller.chord(*keys, times=times).perform()
+
+    def type_text(self, text: str) -> None:
+        """
+        Types a text run into the focused element.
+
+        Args:
+            text (str): The text to type.
+        """
+        self.logger.info("Typing %s characters.", len(text))
+        self.controller.type_text(text).perform()
+
+    def sequence(self, script: str) -> None:
+        """
+        Sends a key script (chords, repeats, holds, text runs and pauses) in a single request,
+        e.g. `"ctrl+a 'new value' tab*2 enter"`. See `KeyboardController.sequence` for the syntax.
+
+        Args:
+            script (str): The key script.
+        """
+        self.logger.info("Sending key sequence: %s", script)
+        self.controller.sequence(script).perform()
+
     def function_key(self, function_key: int) -> None:
         """
         Simulates pressing a function key (F1 through F12).
@@ -87,8 +143,79 @@ class Keyboard:
             function_key (int): The number of the function key (1-12).
         """
         if 1 <= function_key <= 12:
-            self.logger.info(f"Pressing Function key F{function_key}.")
+            self.logger.info("Pressing Function key F%s.", function_key)
             self.controller.press_function_key(function_key)
         else:
-            self.logger.error(f"Invalid Function key: F{function_key}. Must be between F1 and F12.")
-            raise ValueError("Function key must be between F1 and F12.")
\ No newline at end of file
+            self.logger.error(
+                "Invalid Function key: F%s. Must be between F1 and F12.", function_key
+            )
+            raise ValueError("Function key must be between F1 and F12.")
+
+
+class Mouse:
+    """Drags, wheel scrolls and custom pointer gestures, each sent to the browser in one request."""
+
+    def __init__(self, controller: Any) -> None:
+        """
+        Initializes the interface for pointer actions.
+
+        Args:
+            controller (Any): The controller instance whose driver receives the pointer actions.
+
+        Raises:
+            UnsupportedEngineException: If the session runs on the Playwright engine.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.session = controller
+        self.controller = MouseController(_webdriver(controller, "Mouse"))
+
+    def gesture(self) -> MouseController:
+        """
+        Returns the underlying MouseController to chain a custom gesture, sent with `perform()`.
+
+        Returns:
+            MouseController: The pointer action builder.
+        """
+        return self.controller
+
+    def drag_by(
+        self, widget: Any, x_offset: int, y_offset: int, steps: int = 1, timeout: int = 10
+    ) -> None:
+        """
+        Presses the left button on the widget, moves the pointer by the offset and releases it.
+
+        Args:
+            widget (Any): The Widget to drag.
+            x_offset (int): Horizontal distance in pixels.
+            y_offset (int): Vertical distance in pixels.
+            steps (int): Number of intermediate pointer moves, for pages tracking `mousemove`. Default is 1.
+            timeout (int): Maximum time to wait for the widget. Default is 10 seconds.
+        """
+        self.logger.info(
+            "Dragging element with XPath: %s by (%s, %s).", widget.xpath, x_offset, y_offset
+        )
+        self.controller.press(self._element(widget, timeout))
+        steps = max(1, steps)
+        moved_x = moved_y = 0
+        for step in range(1, steps + 1):
+            target_x, target_y = x_offset * step // steps, y_offset * step // steps
+            self.controller.move_by(target_x - moved_x, target_y - moved_y)
+            moved_x, moved_y = target_x, target_y
+        self.controller.release().perform()
+
+    def scroll(self, delta_x: int, delta_y: int, widget: Any = None, timeout: int = 10) -> None:
+        """
+        Turns the mouse wheel over the widget, or over the viewport when no widget is given.
+
+        Args:
+            delta_x (int): Horizontal scroll amount in pixels.
+            delta_y (int): Vertical scroll amount in pixels.
+            widget (Any): The Widget the wheel is turned over. Default is None.
+            timeout (int): Maximum time to wait for the widget. Default is 10 seconds.
+        """
+        self.logger.info("Scrolling by (%s, %s).", delta_x, delta_y)
+        element = self._element(widget, timeout) if widget is not None else None
+        self.controller.scroll(delta_x, delta_y, element).perform()
+
+    def _element(self, widget: Any, timeout: int) -> Any:
+        return self.session.find_element(widget.locator, timeout)
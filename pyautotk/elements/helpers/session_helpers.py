@@ -1,5 +1,9 @@
 from functools import wraps
-from pyautotk.core.browser_controller import BrowserController
+from typing import Callable, List
+from pyautotk.core.controller_factory import create_controller
+from pyautotk.core.config_loader import config
+from pyautotk.core.session_pool import session_pool
+from pyautotk.core.session_state import load_session_state
 
 
 def browser_session(
@@ -8,6 +12,12 @@ def browser_session(
     maximize: bool = False,
     headless: bool = False,
     kill_browser: bool = True,
+    pooled: bool = False,
+    block_resources: List[str] = None,
+    block_urls: List[str] = None,
+    browser_context: bool = False,
+    restore_from: str = "",
+    setup: Callable = None,
 ):
     """
     A decorator that manages a browser session using the BrowserController, with support for configuring
@@ -16,6 +26,7 @@ def browser_session(
     This decorator automates the setup and teardown of the browser session. It initializes the
     BrowserController with the specified configuration, opens the URL, and closes the browser when the
     function completes. This simplifies the workflow by handling browser instantiation and cleanup.
+    The automation engine (Selenium or Playwright) is selected through `config.browser_engine`.
 
     Args:
         url (str): The URL to open when starting the browser session.
@@ -23,6 +34,21 @@ def browser_session(
         maximize (bool): Whether to start the browser maximized. Default is False.
         headless (bool): Whether to run the browser in headless mode. Default is False.
         kill_browser (bool): Whether to close the browser after the function completes. Default is True.
+        pooled (bool): Whether to take a warm browser from the process-wide session pool and return it to the
+            pool (reset) instead of closing it. Default is False, unless enabled through `config.session_pool`.
+        block_resources (List[str]): Resource types the browser never downloads, e.g. ['image', 'font', 'analytics'].
+            Defaults to `config.block_resources`. Passing it (or `block_urls`) starts a dedicated browser instead of a
+            pooled one, since pooled browsers use the configured blocklist.
+        block_urls (List[str]): URL patterns the browser never downloads, where `*` matches any sequence of
+            characters. Defaults to `config.block_urls`.
+        browser_context (bool): Whether the session is an isolated browser context inside a shared browser instead
+            of a browser of its own, closed when the function completes. Default is False, unless enabled through
+            `config.browser_contexts`. Takes precedence over `pooled`; the Playwright engine always uses contexts.
+        restore_from (str): JSON file of a session state (cookies, localStorage, sessionStorage) restored before the
+            URL is opened, so login and setup flows are not repeated. Ignored when missing or older than
+            `config.session_state_ttl`.
+        setup (Callable): Called with the session after the URL is opened when `restore_from` has no usable state;
+            the resulting state is then saved to `restore_from` for the next sessions.
 
     Returns:
         Callable: The wrapped function with the browser session management.
@@ -42,16 +68,109 @@ def browser_session(
             Returns:
                 Any: The result of the decorated function.
             """
-            session = BrowserController(
-                browser_type=browser_type, maximize=maximize, headless=headless, kill_browser=kill_browser
+            custom_blocking = block_resources is not None or block_urls is not None
+            use_context = (
+                (browser_context or config.browser_contexts)
+                and kill_browser
+                and config.browser_engine.lower() == "selenium"
             )
+            use_pool = (
+                (pooled or config.session_pool)
+                and kill_browser
+                and not custom_blocking
+                and not use_context
+            )
+            if use_context:
+                from pyautotk.core.browser_contexts import acquire_context
+
+                session = acquire_context(
+                    browser_type=browser_type,
+                    headless=headless,
+                    maximize=maximize,
+                    block_resources=block_resources,
+                    block_urls=block_urls,
+                )
+            elif use_pool:
+                session = session_pool.acquire(
+                    browser_type=browser_type, headless=headless, maximize=maximize
+                )
+            else:
+                session = create_controller(
+                    browser_type=browser_type,
+                    maximize=maximize,
+                    headless=headless,
+                    kill_browser=kill_browser,
+                    block_resources=block_resources,
+                    block_urls=block_urls,
+                )
             try:
+                state = load_session_state(restore_from) if restore_from else None
+                if state is not None:
+                    session.restore_session_state(state)
                 session.open_url(url)
+                if restore_from and state is None and setup is not None:
+                    setup(session)
+                    session.save_session_state(restore_from)
                 return func(session, *args, **kwargs)
             finally:
-                if kill_browser:
+                if use_pool:
+                    session_pool.release(session)
+                elif kill_browser:
                     session.close_browser()
 
         return wrapper
 
     return decorator
+
+
+def async_browser_session(
+    url: str,
+    browser_type: str = "",
+    maximize: bool = False,
+    headless: bool = False,
+    kill_browser: bool = True,
+    block_resources: List[str] = None,
+    block_urls: List[str] = None,
+):
+    """
+    The asyncio counterpart of `browser_session`, for coroutine functions that receive an AsyncBrowserController.
+
+    The browser is launched and the URL opened without blocking the event loop, so several decorated
+    coroutines can run concurrently, e.g. with `asyncio.gather`.
+
+    Args:
+        url (str): The URL to open when starting the browser session.
+        browser_type (str): The type of browser to use. Supported values are 'firefox' or 'chrome'. Default is 'chrome'.
+        maximize (bool): Whether to start the browser maximized. Default is False.
+        headless (bool): Whether to run the browser in headless mode. Default is False.
+        kill_browser (bool): Whether to close the browser after the coroutine completes. Default is True.
+        block_resources (List[str]): Resource types the browser never downloads. Defaults to `config.block_resources`.
+        block_urls (List[str]): URL patterns the browser never downloads. Defaults to `config.block_urls`.
+
+    Returns:
+        Callable: The wrapped coroutine function with the browser session management.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            from pyautotk.core.async_browser_controller import AsyncBrowserController
+
+            session = await AsyncBrowserController.create(
+                browser_type=browser_type,
+                maximize=maximize,
+                headless=headless,
+                kill_browser=kill_browser,
+                block_resources=block_resources,
+                block_urls=block_urls,
+            )
+            try:
+                await session.open_url(url)
+                return await func(session, *args, **kwargs)
+            finally:
+                if kill_browser:
+                    await session.close_browser()
+
+        return wrapper
+
+    return decorator
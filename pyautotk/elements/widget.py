@@ -1,11 +1,17 @@
-import re
-import time
-from typing import Dict, Any, List
+import warnings
+from typing import Dict, Any, List, Optional
 from pyautotk.core.logger_utils import initialize_logger
+from pyautotk.core.config_loader import config
+from pyautotk.core.locators import CSS_PREFIX, build_css_selector, build_xpath
+from pyautotk.core.profiler import profiled_operations
 from pyautotk.core.exceptions import ElementNotVisibleException
 
+PROPERTY_ATTRIBUTES = ["id", "class", "name", "type", "value", "href", "src", "alt", "aria-label"]
 
+DOUBLE_CLICK_DELAY_DEPRECATION = "The 'delay' argument of double_click is deprecated and ignored."
 
+
+@profiled_operations
 class Widget:
     """
     Represents a UI element on the page and provides methods to interact with it using the specified controller.
@@ -20,13 +26,19 @@ class Widget:
             **kwargs (str): Keyword arguments representing the attributes of the element to build the XPath.
         """
         self.logger = initialize_logger(self.__class__.__name__)
-        self.logger.debug(f"Initializing Widget with attributes: {kwargs}")
+        self.logger.debug("Initializing Widget with attributes: %s", kwargs)
 
         self.controller = controller
         self.attrs = kwargs
         self.xpath = self._build_xpath()
+        self.css_selector = self._build_css_selector()
+        # Locator handed to the controller: the CSS selector when preferred and expressible, the XPath otherwise.
+        if config.prefer_css_selectors and self.css_selector:
+            self.locator = CSS_PREFIX + self.css_selector
+        else:
+            self.locator = self.xpath
 
-        self.logger.debug(f"Constructed XPath for Widget: {self.xpath}")
+        self.logger.debug("Constructed XPath for Widget: %s", self.xpath)
 
     def click(self, timeout: int = 10) -> None:
         """
@@ -36,28 +48,46 @@ class Widget:
             timeout (int): Maximum time to wait for the element to be present before clicking. Default is 10 seconds.
         """
         self.logger.info(
-            f"Attempting to click on element with XPath: {self.xpath} (Timeout: {timeout} seconds)"
+            "Attempting to click on element with XPath: %s (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
         )
         try:
-            self.controller.click_element(self.xpath, timeout)
+            self.controller.click_element(self.locator, timeout)
+        except Exception as e:
+            self.logger.error("Failed to click on element with XPath: %s. Error: %s", self.xpath, e)
+            raise
+
+    def double_click(self, delay: Optional[float] = None, timeout: int = 10) -> None:
+        """
+        Performs a native double-click on the element, so the page receives a real `dblclick` event. Both clicks are
+        sent to the browser in a single request.
+
+        Args:
+            delay (Optional[float]): Deprecated and ignored; passing it emits a DeprecationWarning.
+            timeout (int): Maximum time to wait for the element. Default is 10 seconds.
+        """
+        if delay is not None:
+            warnings.warn(DOUBLE_CLICK_DELAY_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self.logger.info("Performing double-click on element with XPath: %s", self.xpath)
+        try:
+            self.controller.double_click_element(self.locator, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to click on element with XPath: {self.xpath}. Error: {e}")
+            self.logger.error("Failed to double-click on element. Error: %s", e)
             raise
 
-    def double_click(self, delay: float = 0.1, timeout: int = 10) -> None:
+    def right_click(self, timeout: int = 10) -> None:
         """
-        Performs a double-click on the element.
+        Performs a native right-click on the element, opening its context menu.
 
         Args:
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Performing double-click on element with XPath: {self.xpath}")
+        self.logger.info("Performing right-click on element with XPath: %s", self.xpath)
         try:
-            for _ in range(2):
-                self.click(timeout)
-                time.sleep(delay)
+            self.controller.right_click_element(self.locator, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to double-click on element. Error: {e}")
+            self.logger.error("Failed to right-click on element. Error: %s", e)
             raise
 
     def hover(self, timeout: int = 10) -> None:
@@ -70,12 +100,18 @@ class Widget:
         Raises:
             Exception: If the element cannot be found or the hover action fails.
         """
-        self.logger.info(f"Attempting to hover over element with XPath: {self.xpath} (Timeout: {timeout} seconds)")
+        self.logger.info(
+            "Attempting to hover over element with XPath: %s (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
+        )
         try:
-            self.controller.hover_element(self.xpath)
-            self.logger.info(f"Successfully hovered over element with XPath: {self.xpath}")
+            self.controller.hover_element(self.locator)
+            self.logger.info("Successfully hovered over element with XPath: %s", self.xpath)
         except Exception as e:
-            self.logger.error(f"Failed to hover over element with XPath: {self.xpath}. Error: {e}")
+            self.logger.error(
+                "Failed to hover over element with XPath: %s. Error: %s", self.xpath, e
+            )
             raise
 
     def unhover(self, timeout: int = 10) -> None:
@@ -86,12 +122,12 @@ class Widget:
         Args:
             timeout (int): Maximum time to wait for the action to complete. Default is 10 seconds.
         """
-        self.logger.info(f"Attempting to unhover from element with XPath: {self.xpath}")
+        self.logger.info("Attempting to unhover from element with XPath: %s", self.xpath)
         try:
             self.controller.unhover_element(timeout)
             self.logger.info("Successfully unhovered by moving mouse away.")
         except Exception as e:
-            self.logger.error(f"Failed to unhover. Error: {e}")
+            self.logger.error("Failed to unhover. Error: %s", e)
             raise
 
     def enter_text(self, text: str, timeout: int = 10) -> None:
@@ -102,12 +138,12 @@ class Widget:
             text (str): The text to be entered into the element.
             timeout (int): Maximum time to wait for the element to be present before entering text. Default is 10 seconds.
         """
-        self.logger.info(f"Entering text '{text}' into element with XPath: {self.xpath}")
+        self.logger.info("Entering text '%s' into element with XPath: %s", text, self.xpath)
         try:
-            self.controller.enter_text_safely(self.xpath, text, timeout)
+            self.controller.enter_text_safely(self.locator, text, timeout)
         except Exception as e:
             self.logger.error(
-                f"Failed to enter text into element with XPath: {self.xpath}. Error: {e}"
+                "Failed to enter text into element with XPath: %s. Error: %s", self.xpath, e
             )
             raise
 
@@ -119,12 +155,14 @@ class Widget:
             timeout (int): Maximum time to wait for the element to be present before scrolling. Default is 10 seconds.
         """
         self.logger.info(
-            f"Scrolling to element with XPath: {self.xpath} (Timeout: {timeout} seconds)"
+            "Scrolling to element with XPath: %s (Timeout: %s seconds)", self.xpath, timeout
         )
         try:
-            self.controller.scroll_to_element(self.xpath, timeout)
+            self.controller.scroll_to_element(self.locator, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to scroll to element with XPath: {self.xpath}. Error: {e}")
+            self.logger.error(
+                "Failed to scroll to element with XPath: %s. Error: %s", self.xpath, e
+            )
             raise
 
     def wait_for(self, timeout: int = 10) -> Any:
@@ -138,23 +176,26 @@ class Widget:
             Any: The WebElement if found and visible, or raises an exception if not found.
         """
         self.logger.info(
-            f"Waiting for element with XPath: {self.xpath} to become visible (Timeout: {timeout} seconds)"
+            "Waiting for element with XPath: %s to become visible (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
         )
         try:
-            element = self.controller.wait_for_element(self.xpath, timeout)
-            self.logger.info(f"Element with XPath: {self.xpath} is now visible.")
+            element = self.controller.wait_for_element(self.locator, timeout)
+            self.logger.info("Element with XPath: %s is now visible.", self.xpath)
             return element
         except Exception as e:
-            self.logger.error(f"Failed to wait for element with XPath: {self.xpath}. Error: {e}")
+            self.logger.error("Failed to wait for element with XPath: %s. Error: %s", self.xpath, e)
             raise ElementNotVisibleException(self.xpath, timeout, e)
 
-
-    def properties(self, timeout: int = 10) -> Dict[str, Any]:
+    def properties(self, timeout: int = 10, snapshot: bool = False) -> Dict[str, Any]:
         """
         Extracts and returns properties of the first element identified by the XPath.
 
         Args:
             timeout (int): Maximum time to wait for the element to be present before retrieving properties. Default is 10 seconds.
+            snapshot (bool): Whether to collect all the properties in a single script call. Default is False,
+                unless enabled globally through `config.snapshot_properties`.
 
         Returns:
             Dict[str, Any]: A dictionary containing properties for the first matching element.
@@ -162,24 +203,39 @@ class Widget:
         Raises:
             Exception: If the properties cannot be retrieved.
         """
-        self.logger.info(f"Attempting to retrieve information from the first element with XPath: {self.xpath} (Timeout: {timeout} seconds)")
+        self.logger.info(
+            "Attempting to retrieve information from the first element with XPath: %s (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
+        )
         try:
-            element = self.controller.wait_for_element(self.xpath, timeout)
-            element_data = self._extract_element_properties(element)
+            if snapshot or config.snapshot_properties:
+                element_data = self.controller.get_element_properties(
+                    self.locator, PROPERTY_ATTRIBUTES, timeout
+                )
+            else:
+                element_data = self.controller.run_on_element(
+                    self.locator, self._extract_element_properties, timeout, condition="visible"
+                )
 
-            self.logger.info(f"Successfully retrieved information for the element: {element_data}")
+            self.logger.info("Successfully retrieved information for the element: %s", element_data)
             return element_data
         except Exception as e:
-            self.logger.error(f"Failed to retrieve information from element with XPath: {self.xpath}. Error: {e}")
+            self.logger.error(
+                "Failed to retrieve information from element with XPath: %s. Error: %s",
+                self.xpath,
+                e,
+            )
             raise
 
-
-    def all_properties(self, timeout: int = 10) -> List[Dict[str, Any]]:
+    def all_properties(self, timeout: int = 10, snapshot: bool = False) -> List[Dict[str, Any]]:
         """
         Extracts and returns properties of all elements that match the XPath.
 
         Args:
             timeout (int): Maximum time to wait for the elements to be present before retrieving properties. Default is 10 seconds.
+            snapshot (bool): Whether to collect the properties of every match in a single script call. Default is False,
+                unless enabled globally through `config.snapshot_properties`.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing properties for a matching element.
@@ -187,18 +243,32 @@ class Widget:
         Raises:
             Exception: If the properties cannot be retrieved.
         """
-        self.logger.info(f"Attempting to retrieve information from all elements with XPath: {self.xpath} (Timeout: {timeout} seconds)")
+        self.logger.info(
+            "Attempting to retrieve information from all elements with XPath: %s (Timeout: %s seconds)",
+            self.xpath,
+            timeout,
+        )
         try:
-            elements = self.controller.wait_for_all_elements(self.xpath)
-            elements_data = [self._extract_element_properties(element) for element in elements]
+            if snapshot or config.snapshot_properties:
+                elements_data = self.controller.get_element_properties(
+                    self.locator, PROPERTY_ATTRIBUTES, timeout, all_matches=True
+                )
+            else:
+                elements = self.controller.wait_for_all_elements(self.locator, timeout)
+                elements_data = [self._extract_element_properties(element) for element in elements]
 
-            self.logger.info(f"Successfully retrieved information for {len(elements_data)} elements.")
+            self.logger.info(
+                "Successfully retrieved information for %s elements.", len(elements_data)
+            )
             return elements_data
         except Exception as e:
-            self.logger.error(f"Failed to retrieve information from elements with XPath: {self.xpath}. Error: {e}")
+            self.logger.error(
+                "Failed to retrieve information from elements with XPath: %s. Error: %s",
+                self.xpath,
+                e,
+            )
             raise
 
-
     def get_attribute(self, attribute_name: str, timeout: int = 10) -> str:
         """
         Retrieves the value of a specific attribute from the element.
@@ -210,33 +280,79 @@ class Widget:
         Returns:
             str: The value of the specified attribute, or None if not found.
         """
-        self.logger.info(f"Getting attribute '{attribute_name}' for element with XPath: {self.xpath}")
+        self.logger.info(
+            "Getting attribute '%s' for element with XPath: %s", attribute_name, self.xpath
+        )
+        try:
+            return self.controller.get_element_attribute(self.locator, attribute_name, timeout)
+        except Exception as e:
+            self.logger.error("Failed to get attribute '%s'. Error: %s", attribute_name, e)
+            raise
+
+    def extract_table(
+        self,
+        attributes: List[str] = None,
+        text: bool = True,
+        rect: bool = False,
+        displayed: bool = False,
+        timeout: int = 10,
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts the chosen fields of every element matching the XPath in a single call, as one list per field.
+
+        Args:
+            attributes (List[str]): The attribute names to extract, each becoming a column. Default is none.
+            text (bool): Whether to include the `text` column. Default is True.
+            rect (bool): Whether to include the `x`, `y`, `width` and `height` columns. Default is False.
+            displayed (bool): Whether to include the `displayed` column. Default is False.
+            timeout (int): Maximum time to wait for at least one element. Default is 10 seconds.
+
+        Returns:
+            Dict[str, List[Any]]: The extracted columns, all of the same length and in document order.
+        """
+        self.logger.info("Extracting a table from all elements with XPath: %s", self.xpath)
         try:
-            element = self.controller.wait_for_element(self.xpath, timeout)
-            return element.get_attribute(attribute_name)
+            return self.controller.extract_table(
+                self.locator, attributes, text, rect, displayed, timeout
+            )
         except Exception as e:
-            self.logger.error(f"Failed to get attribute '{attribute_name}'. Error: {e}")
+            self.logger.error(
+                "Failed to extract a table from elements with XPath: %s. Error: %s", self.xpath, e
+            )
             raise
 
     @staticmethod
-    def extract_all_elements_with_attribute(controller: Any, attribute: str) -> Dict[str, str]:
+    def extract_all_elements_with_attribute(
+        controller: Any, attribute: str, timeout: int = 10
+    ) -> Dict[str, Any]:
         """
         Retrieves all elements in the page that have a specific attribute.
 
+        The attribute values are read with a single `extract_table` call instead of one request per element.
+
         Args:
             controller (Any): The controller instance to use for locating the elements.
             attribute (str): The attribute to search for in the elements.
+            timeout (int): Maximum time to wait for at least one element. Default is 10 seconds.
 
         Returns:
-            Dict[str, WebElement]: A dictionary where the keys are the attribute values and the values are the corresponding WebElements.
+            Dict[str, Any]: A dictionary where the keys are the attribute values and the values are the corresponding elements.
         """
         logger = initialize_logger("Widget")
-        logger.info(f"Retrieving all elements with attribute: {attribute}")
+        logger.info("Retrieving all elements with attribute: %s", attribute)
+        xpath = f"//*[@{attribute}]"
         try:
-            elements = controller.wait_for_element(f"//*[@{attribute}]")
-            return elements
+            elements = controller.wait_for_all_elements(xpath, timeout)
+            values = controller.extract_table(xpath, [attribute], text=False, timeout=0)[attribute]
+            if len(values) != len(elements):
+                logger.warning(
+                    "Page changed while reading attribute '%s', reading it per element instead.",
+                    attribute,
+                )
+                values = [element.get_attribute(attribute) for element in elements]
+            return dict(zip(values, elements))
         except Exception as e:
-            logger.error(f"Failed to retrieve elements with attribute: {attribute}. Error: {e}")
+            logger.error("Failed to retrieve elements with attribute: %s. Error: %s", attribute, e)
             raise
 
     def upload_file(self, file_path: str, timeout: int = 10) -> None:
@@ -247,12 +363,12 @@ class Widget:
             file_path (str): The absolute path of the file to upload.
             timeout (int): Maximum time to wait for the element to be present. Default is 10 seconds.
         """
-        self.logger.info(f"Uploading file '{file_path}' to element with XPath: {self.xpath}")
+        self.logger.info("Uploading file '%s' to element with XPath: %s", file_path, self.xpath)
         try:
-            self.controller.upload_file(self.xpath, file_path, timeout)
+            self.controller.upload_file(self.locator, file_path, timeout)
         except Exception as e:
             self.logger.error(
-                f"Failed to upload file to element with XPath: {self.xpath}. Error: {e}"
+                "Failed to upload file to element with XPath: %s. Error: %s", self.xpath, e
             )
             raise
 
@@ -264,11 +380,13 @@ class Widget:
             text (str): The visible text of the option to select.
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Selecting option '{text}' by text from dropdown with XPath: {self.xpath}")
+        self.logger.info(
+            "Selecting option '%s' by text from dropdown with XPath: %s", text, self.xpath
+        )
         try:
-            self.controller.select_option_by_text(self.xpath, text, timeout)
+            self.controller.select_option_by_text(self.locator, text, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to select option by text. Error: {e}")
+            self.logger.error("Failed to select option by text. Error: %s", e)
             raise
 
     def select_by_value(self, value: str, timeout: int = 10) -> None:
@@ -279,11 +397,13 @@ class Widget:
             value (str): The value attribute of the option to select.
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Selecting option with value '{value}' from dropdown with XPath: {self.xpath}")
+        self.logger.info(
+            "Selecting option with value '%s' from dropdown with XPath: %s", value, self.xpath
+        )
         try:
-            self.controller.select_option_by_value(self.xpath, value, timeout)
+            self.controller.select_option_by_value(self.locator, value, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to select option by value. Error: {e}")
+            self.logger.error("Failed to select option by value. Error: %s", e)
             raise
 
     def select_by_index(self, index: int, timeout: int = 10) -> None:
@@ -294,11 +414,13 @@ class Widget:
             index (int): The index of the option to select.
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Selecting option at index {index} from dropdown with XPath: {self.xpath}")
+        self.logger.info(
+            "Selecting option at index %s from dropdown with XPath: %s", index, self.xpath
+        )
         try:
-            self.controller.select_option_by_index(self.xpath, index, timeout)
+            self.controller.select_option_by_index(self.locator, index, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to select option by index. Error: {e}")
+            self.logger.error("Failed to select option by index. Error: %s", e)
             raise
 
     def deselect_all(self, timeout: int = 10) -> None:
@@ -308,11 +430,11 @@ class Widget:
         Args:
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Deselecting all options from dropdown with XPath: {self.xpath}")
+        self.logger.info("Deselecting all options from dropdown with XPath: %s", self.xpath)
         try:
-            self.controller.deselect_all_options(self.xpath, timeout)
+            self.controller.deselect_all_options(self.locator, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to deselect all options. Error: {e}")
+            self.logger.error("Failed to deselect all options. Error: %s", e)
             raise
 
     def deselect_by_text(self, text: str, timeout: int = 10) -> None:
@@ -323,11 +445,13 @@ class Widget:
             text (str): The visible text of the option to deselect.
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Deselecting option '{text}' by text from dropdown with XPath: {self.xpath}")
+        self.logger.info(
+            "Deselecting option '%s' by text from dropdown with XPath: %s", text, self.xpath
+        )
         try:
-            self.controller.deselect_option_by_text(self.xpath, text, timeout)
+            self.controller.deselect_option_by_text(self.locator, text, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to deselect option by text. Error: {e}")
+            self.logger.error("Failed to deselect option by text. Error: %s", e)
             raise
 
     def get_selected_texts(self, timeout: int = 10) -> list[str]:
@@ -340,11 +464,11 @@ class Widget:
         Returns:
             list[str]: A list of the visible text of all selected options.
         """
-        self.logger.info(f"Getting selected options' text from dropdown with XPath: {self.xpath}")
+        self.logger.info("Getting selected options' text from dropdown with XPath: %s", self.xpath)
         try:
-            return self.controller.get_all_selected_options_text(self.xpath, timeout)
+            return self.controller.get_all_selected_options_text(self.locator, timeout)
         except Exception as e:
-            self.logger.error(f"Failed to get selected options' text. Error: {e}")
+            self.logger.error("Failed to get selected options' text. Error: %s", e)
             raise
 
     def set_value(self, value: str, timeout: int = 10) -> None:
@@ -356,12 +480,12 @@ class Widget:
             value (str): The value to set on the element.
             timeout (int): Maximum time to wait for the element. Default is 10 seconds.
         """
-        self.logger.info(f"Setting value '{value}' for element with XPath: {self.xpath}")
+        self.logger.info("Setting value '%s' for element with XPath: %s", value, self.xpath)
         try:
-            self.controller.set_element_value(self.xpath, value, timeout)
+            self.controller.set_element_value(self.locator, value, timeout)
         except Exception as e:
             self.logger.error(
-                f"Failed to set value for element with XPath: {self.xpath}. Error: {e}"
+                "Failed to set value for element with XPath: %s. Error: %s", self.xpath, e
             )
             raise
 
@@ -373,51 +497,57 @@ class Widget:
             target_widget (Widget): The widget instance to drop onto.
             timeout (int): Maximum time to wait for the elements. Default is 10 seconds.
         """
-        self.logger.info(f"Dragging element '{self.xpath}' to '{target_widget.xpath}'.")
+        self.logger.info("Dragging element '%s' to '%s'.", self.xpath, target_widget.xpath)
         try:
-            self.controller.drag_and_drop(self.xpath, target_widget.xpath, timeout)
+            self.controller.drag_and_drop(self.locator, target_widget.locator, timeout)
         except Exception as e:
             self.logger.error(
-                f"Failed to drag element '{self.xpath}' to '{target_widget.xpath}'. Error: {e}"
+                "Failed to drag element '%s' to '%s'. Error: %s", self.xpath, target_widget.xpath, e
             )
             raise
 
     def _build_xpath(self) -> str:
         """
-        Constructs the XPath string based on the provided attributes.
+        Constructs the XPath string based on the provided attributes. Built XPaths are memoized, so
+        re-creating the same Widget does not rebuild its locator.
 
         Returns:
             str: The constructed XPath for locating the element.
         """
-        xpath = "//*"
-        conditions = []
-        for attr, value in self.attrs.items():
-            attr = re.sub(r"_", "-", attr)
-            if attr == "text":
-                conditions.append(f"contains(text(), '{value}')")
-            elif "class-" in attr:
-                conditions.append(f"@class='{value}'")
-            else:
-                conditions.append(f"@{attr}='{value}'")
+        try:
+            return build_xpath(tuple(self.attrs.items()))
+        except TypeError:
+            # Unhashable attribute values cannot be cached.
+            return build_xpath.__wrapped__(tuple(self.attrs.items()))
 
-        if conditions:
-            xpath += "[" + " and ".join(conditions) + "]"
-        self.logger.debug(f"Generated XPath: {xpath} based on attributes: {self.attrs}")
-        return xpath
+    def _build_css_selector(self) -> Optional[str]:
+        """
+        Constructs the CSS selector equivalent to the XPath, when the attributes can be expressed in CSS.
+
+        Returns:
+            Optional[str]: The CSS selector, or None if the attributes require XPath (e.g. `text`).
+        """
+        try:
+            return build_css_selector(tuple(self.attrs.items()))
+        except TypeError:
+            return build_css_selector.__wrapped__(tuple(self.attrs.items()))
 
     def _extract_element_properties(self, element: Any) -> Dict[str, Any]:
         """
         Extracts properties from a single element.
 
         Args:
-            element (Any): The WebElement to extract properties from.
+            element (Any): The WebElement, or the Playwright Locator on the Playwright engine, to extract properties from.
 
         Returns:
             Dict[str, Any]: A dictionary containing properties for the given element.
         """
+        if getattr(self.controller, "engine", "selenium") == "playwright":
+            return self.controller.locator_properties(element, PROPERTY_ATTRIBUTES)
+
         attributes = {
             attr_name: element.get_attribute(attr_name)
-            for attr_name in ["id", "class", "name", "type", "value", "href", "src", "alt", "aria-label"]
+            for attr_name in PROPERTY_ATTRIBUTES
             if element.get_attribute(attr_name) is not None
         }
 
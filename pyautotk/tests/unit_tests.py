@@ -1,6 +1,82 @@
+import asyncio
+import json
+import logging
+import os
+import platform
+import tempfile
+import threading
+import time
 import unittest
-from pyautotk.elements.widget import Widget
-from unittest.mock import MagicMock
+import warnings
+from logging.handlers import QueueHandler
+from pyautotk.elements.widget import Widget, PROPERTY_ATTRIBUTES
+from unittest.mock import MagicMock, call, patch
+from pyautotk.core.session_pool import SessionPool
+from pyautotk.core.parallel_runner import ParallelRunner, _init_worker_process
+from pyautotk.core.controller_factory import create_controller
+from pyautotk.core.browser_controller import (
+    BrowserController,
+    EXTRACT_TABLE_SCRIPT,
+    MUTATION_WAIT_SCRIPT,
+    NETWORK_TRACKER_SCRIPT,
+    PAGE_SETTLE_SCRIPT,
+)
+from pyautotk.core.action_batch import BATCH_SCRIPT
+from pyautotk.core.locators import build_xpath
+from pyautotk.core.input import KeyboardController, MouseController
+from pyautotk.core.profiler import profiler
+from pyautotk.core.launch_profiles import (
+    claim_cache_directory,
+    get_launch_profile,
+    release_cache_directory,
+)
+from pyautotk.core import browser_contexts
+from pyautotk.core.browser_contexts import BrowserHost, acquire_context
+from pyautotk.core.window_routing import WindowFocus
+from pyautotk.core.tabs import NAVIGATION_COMMITTED_SCRIPT, START_NAVIGATION_SCRIPT
+from pyautotk.core.driver_services import (
+    DriverPaths,
+    SharedDriverService,
+    prewarm_driver_services,
+    resolve_driver_paths,
+)
+from pyautotk.core.session_state import SessionState, load_session_state
+from pyautotk.core.locator_index import (
+    FINGERPRINT_SCRIPT,
+    LocatorIndex,
+    alternative_locators,
+    locator_index,
+)
+from pyautotk.core.wait_history import MIN_SAMPLES, TIMEOUT_BACKOFF, WaitHistory, wait_history
+from pyautotk.elements.helpers.session_helpers import browser_session
+from pyautotk.elements.helpers.input_helpers import Keyboard, Mouse
+from pyautotk.core.resource_blocking import (
+    blocked_url_patterns,
+    firefox_preferences,
+    is_blocked,
+    resolve_blocking,
+)
+from pyautotk.core.config_loader import config
+from pyautotk.core.logger_utils import JsonLinesHandler, initialize_logger, shutdown_logging
+from pyautotk.benchmarks.runner import run_benchmarks
+from pyautotk.benchmarks.import_time import measure_import_time
+from pyautotk.core.exceptions import (
+    BatchActionException,
+    BrowserWaitForPageLoadException,
+    UnsupportedEngineException,
+)
+from pyautotk.core.async_browser_controller import AsyncBrowserController
+from pyautotk.elements.async_widget import AsyncWidget
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webelement import WebElement
 
 
 class TestWidgetXPath(unittest.TestCase):
@@ -26,3 +102,1630 @@ class TestWidgetXPath(unittest.TestCase):
             expected_xpath,
             "XPath generation failed for multiple attributes.",
         )
+
+
+class TestWidgetLocators(unittest.TestCase):
+    def setUp(self):
+        self.controller = MagicMock()
+
+    def test_xpath_is_memoized(self):
+        build_xpath.cache_clear()
+        Widget(self.controller, id="cached-btn", name="go")
+        Widget(self.controller, id="cached-btn", name="go")
+        self.assertEqual(build_xpath.cache_info().hits, 1)
+
+    def test_css_selector_generation(self):
+        widget = Widget(
+            self.controller, id="submit-btn", class_name="btn primary", data_test='say "hi"'
+        )
+        self.assertEqual(
+            widget.css_selector, '#submit-btn[class="btn primary"][data-test="say \\"hi\\""]'
+        )
+
+    def test_no_css_selector_with_text(self):
+        widget = Widget(self.controller, id="submit-btn", text="Submit")
+        self.assertIsNone(widget.css_selector)
+        self.assertEqual(widget.locator, widget.xpath)
+
+    def test_locator_prefers_css_when_enabled(self):
+        with patch("pyautotk.elements.widget.config.prefer_css_selectors", True):
+            widget = Widget(self.controller, id="submit-btn")
+            widget.click()
+        self.assertEqual(widget.locator, "css=#submit-btn")
+        self.controller.click_element.assert_called_once_with("css=#submit-btn", 10)
+
+
+class TestWidgetPropertiesSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.controller = MagicMock()
+
+    def test_properties_snapshot_uses_single_controller_call(self):
+        expected = {"text": "Submit", "tag_name": "button", "attributes": {"id": "submit-btn"}}
+        self.controller.get_element_properties.return_value = expected
+        widget = Widget(self.controller, id="submit-btn")
+
+        self.assertEqual(widget.properties(snapshot=True), expected)
+        self.controller.get_element_properties.assert_called_once_with(
+            widget.xpath, PROPERTY_ATTRIBUTES, 10
+        )
+        self.controller.wait_for_element.assert_not_called()
+
+    def test_all_properties_snapshot_requests_all_matches(self):
+        self.controller.get_element_properties.return_value = [{"text": "a"}, {"text": "b"}]
+        widget = Widget(self.controller, class_name="row")
+
+        self.assertEqual(len(widget.all_properties(snapshot=True)), 2)
+        self.controller.get_element_properties.assert_called_once_with(
+            widget.xpath, PROPERTY_ATTRIBUTES, 10, all_matches=True
+        )
+        self.controller.wait_for_all_elements.assert_not_called()
+
+    def test_properties_of_a_controller_without_engine_are_read_from_the_webelement(self):
+        del self.controller.engine
+        element = MagicMock(
+            text="Submit",
+            tag_name="button",
+            location={"x": 1, "y": 2},
+            size={"height": 3, "width": 4},
+        )
+        element.get_attribute.side_effect = {"id": "submit-btn"}.get
+        self.controller.run_on_element.side_effect = (
+            lambda locator, action, timeout, condition: action(element)
+        )
+
+        properties = Widget(self.controller, id="submit-btn").properties()
+
+        self.assertEqual(
+            (properties["text"], properties["attributes"]), ("Submit", {"id": "submit-btn"})
+        )
+        self.controller.locator_properties.assert_not_called()
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("pyautotk.core.session_pool.create_controller")
+        self.controller_cls = patcher.start()
+        self.controller_cls.side_effect = lambda **kwargs: MagicMock(
+            browser_type=kwargs["browser_type"],
+            headless=kwargs["headless"],
+            maximize=kwargs["maximize"],
+            engine=kwargs["engine"],
+        )
+        self.addCleanup(patcher.stop)
+
+    def test_released_session_is_reset_and_reused(self):
+        pool = SessionPool(max_uses=5)
+        first = pool.acquire("chrome", headless=True)
+        pool.release(first)
+
+        first.reset_session.assert_called_once()
+        self.assertIs(pool.acquire("chrome", headless=True), first)
+        self.assertEqual(self.controller_cls.call_count, 1)
+
+    def test_session_is_recycled_after_max_uses(self):
+        pool = SessionPool(max_uses=1)
+        first = pool.acquire("chrome", headless=True)
+        pool.release(first)
+
+        first.close_browser.assert_called_once()
+        self.assertIsNot(pool.acquire("chrome", headless=True), first)
+
+    def test_unhealthy_session_is_discarded(self):
+        pool = SessionPool(max_uses=5)
+        first = pool.acquire("chrome", headless=True)
+        pool.release(first)
+        first.is_alive.return_value = False
+
+        self.assertIsNot(pool.acquire("chrome", headless=True), first)
+        first.close_browser.assert_called_once()
+
+    def acquire_and_release_on_thread(self, pool):
+        acquired = []
+
+        def worker():
+            acquired.append(pool.acquire("chrome", headless=True))
+            pool.release(acquired[0])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        return acquired[0]
+
+    def test_playwright_sessions_are_pooled_per_thread(self):
+        pool = SessionPool(max_uses=5)
+        with patch.object(config, "browser_engine", "playwright"):
+            other = self.acquire_and_release_on_thread(pool)
+            own = pool.acquire("chrome", headless=True)
+
+        self.assertIsNot(own, other)
+        self.assertEqual(self.controller_cls.call_count, 2)
+
+    def test_sessions_of_other_threads_are_left_to_their_thread(self):
+        pool = SessionPool(max_uses=5)
+        with patch.object(config, "browser_engine", "playwright"):
+            other = self.acquire_and_release_on_thread(pool)
+            own = pool.acquire("chrome", headless=True)
+            pool.release(own)
+            pool.close_all()
+
+        own.close_browser.assert_called_once()
+        other.close_browser.assert_not_called()
+
+
+class TestSessionReset(unittest.TestCase):
+    def test_chrome_reset_clears_every_visited_origin(self):
+        controller = make_controller("chrome")
+        driver = controller.driver
+        driver.window_handles = ["main", "popup"]
+        driver.current_url = "https://b.test/checkout"
+        driver.current_window_handle = "fresh"
+        driver.execute_cdp_cmd.side_effect = lambda command, params: (
+            {"cookies": [{"domain": ".c.test"}]} if command == "Storage.getCookies" else {}
+        )
+        controller.open_url("https://a.test:8443/login")
+
+        SessionPool(max_uses=5).release(controller)
+
+        cleared = [
+            params["origin"]
+            for command, params in (c.args for c in driver.execute_cdp_cmd.call_args_list)
+            if command == "Storage.clearDataForOrigin"
+        ]
+        self.assertEqual(
+            cleared, ["http://c.test", "https://a.test:8443", "https://b.test", "https://c.test"]
+        )
+        driver.execute_cdp_cmd.assert_any_call("Storage.clearCookies", {})
+        self.assertEqual(driver.close.call_count, 2)
+        self.assertEqual(controller.original_window, "fresh")
+
+    def test_firefox_reset_relaunches_the_browser(self):
+        controller = make_controller("firefox")
+        old_driver, new_driver = controller.driver, MagicMock(current_window_handle="fresh")
+        controller.open_url("https://a.test/")
+
+        with patch.object(BrowserController, "_initialize_driver", return_value=new_driver):
+            SessionPool(max_uses=5).release(controller)
+
+        old_driver.quit.assert_called_once()
+        self.assertIs(controller.driver, new_driver)
+        self.assertEqual(controller.original_window, "fresh")
+        self.assertEqual(controller._visited_origins, set())
+
+
+class TestParallelRunner(unittest.TestCase):
+    def test_results_are_collected_per_scenario_in_order(self):
+        def passing(session):
+            return "ok"
+
+        def failing(session):
+            raise AssertionError("boom")
+
+        with patch("pyautotk.core.parallel_runner.session_pool") as pool:
+            results = ParallelRunner("http://localhost", workers=2).run([passing, failing, passing])
+
+        self.assertEqual([result.passed for result in results], [True, False, True])
+        self.assertEqual(results[0].result, "ok")
+        self.assertIn("boom", results[1].error)
+        self.assertEqual(pool.acquire.call_count, 3)
+        self.assertEqual(pool.release.call_count, 3)
+        self.assertEqual(pool.close_thread.call_count, 2)
+
+    def test_browser_launch_failure_is_recorded_as_failed_scenario(self):
+        session = MagicMock()
+
+        with patch("pyautotk.core.parallel_runner.session_pool") as pool:
+            pool.acquire.side_effect = [WebDriverException("cannot start"), session]
+            results = ParallelRunner("http://localhost", workers=1).run(
+                [lambda s: "a", lambda s: "b"]
+            )
+
+        self.assertEqual([result.passed for result in results], [False, True])
+        self.assertIn("cannot start", results[0].error)
+        pool.release.assert_called_once_with(session)
+
+    def test_worker_processes_save_what_they_learned(self):
+        with patch("pyautotk.core.parallel_runner.multiprocessing_util.Finalize") as finalize:
+            _init_worker_process()
+
+        self.assertIn(
+            call(wait_history, wait_history.save, exitpriority=10), finalize.call_args_list
+        )
+        self.assertIn(
+            call(locator_index, locator_index.save, exitpriority=10), finalize.call_args_list
+        )
+
+
+def make_controller(browser_type: str = "chrome") -> BrowserController:
+    """Builds a BrowserController around a mocked driver, without launching a browser."""
+    controller = BrowserController.__new__(BrowserController)
+    controller._configure(
+        browser_type, maximize=False, headless=True, block_resources=[], block_urls=[]
+    )
+    controller.logger = MagicMock()
+    controller.driver = MagicMock()
+    controller.original_window = "main"
+    return controller
+
+
+class TestObserverWaits(unittest.TestCase):
+    def test_observer_wait_uses_single_async_script(self):
+        controller = make_controller()
+        element = MagicMock()
+        controller.driver.execute_async_script.return_value = element
+
+        self.assertIs(
+            controller.wait_for_element("//*[@id='a']", timeout=2, strategy="observer"), element
+        )
+        controller.driver.execute_async_script.assert_called_once_with(
+            MUTATION_WAIT_SCRIPT, "//*[@id='a']", "visible", 2000
+        )
+
+    def test_observer_wait_raises_timeout_when_unresolved(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = None
+
+        with self.assertRaises(TimeoutException):
+            controller.find_element("//*[@id='a']", timeout=1, strategy="observer")
+
+    def test_observer_wait_falls_back_to_polling(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.side_effect = WebDriverException("document unloaded")
+
+        with patch.object(controller, "_wait_with_polling", return_value="element") as polling:
+            self.assertEqual(
+                controller.wait_for_all_elements("//li", timeout=1, strategy="observer"), "element"
+            )
+        polling.assert_called_once()
+
+    def test_unknown_wait_strategy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            make_controller().wait_for_element("//li", strategy="sleep")
+
+
+class TestPageSettleWaits(unittest.TestCase):
+    def test_network_idle_wait_is_one_async_script(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = True
+
+        controller.wait_for_network_idle(idle_time=0.3, timeout=5)
+        controller.wait_for_network_idle(idle_time=0.3, timeout=5)
+
+        controller.driver.execute_cdp_cmd.assert_called_once_with(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_SCRIPT}
+        )
+        script, condition, quiet_ms, remaining_ms = (
+            controller.driver.execute_async_script.call_args[0]
+        )
+        self.assertEqual((script, condition, quiet_ms), (PAGE_SETTLE_SCRIPT, "network_idle", 300))
+        self.assertTrue(0 < remaining_ms <= 5000)
+
+    def test_unsettled_page_raises_page_load_exception(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = False
+
+        with self.assertRaises(BrowserWaitForPageLoadException) as context:
+            controller.wait_for_dom_stable(timeout=1)
+        self.assertEqual(context.exception.condition, "dom_stable")
+
+    def test_navigation_during_wait_checks_new_document(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.side_effect = [
+            JavascriptException("document unloaded"),
+            True,
+        ]
+
+        controller.wait_for_page_load(timeout=5)
+        self.assertEqual(controller.driver.execute_async_script.call_count, 2)
+
+
+class TestResourceBlocking(unittest.TestCase):
+    def test_resource_types_expand_to_url_patterns(self):
+        patterns = blocked_url_patterns(["image", "analytics"], ["*ads.example.com*"])
+
+        self.assertIn("*.png", patterns)
+        self.assertIn("*.png?*", patterns)
+        self.assertIn("*google-analytics.com*", patterns)
+        self.assertEqual(patterns[-1], "*ads.example.com*")
+        with self.assertRaises(ValueError):
+            resolve_blocking(["videos"], [])
+
+    def test_chrome_blocklist_is_applied_to_new_tabs(self):
+        controller = make_controller()
+        controller.block_resources, controller.block_urls = ["font"], ["*.mp4"]
+        controller.driver.window_handles = ["main", "popup"]
+
+        controller.switch_to_new_tab()
+
+        controller.driver.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs", {"urls": blocked_url_patterns(["font"], ["*.mp4"])}
+        )
+
+    def test_firefox_never_sends_cdp_commands(self):
+        controller = make_controller("firefox")
+        controller.block_urls = ["*.mp4"]
+        controller.driver.execute_cdp_cmd.side_effect = RuntimeError(
+            "CDP support for Firefox has been removed."
+        )
+
+        controller._apply_resource_blocking()
+        controller._install_network_tracker()
+
+        controller.driver.execute_cdp_cmd.assert_not_called()
+
+    def test_firefox_preferences_and_request_filter(self):
+        preferences = firefox_preferences(["image", "analytics"], [])
+
+        self.assertEqual(preferences["permissions.default.image"], 2)
+        self.assertTrue(
+            preferences["network.proxy.autoconfig_url"].startswith("data:text/javascript,")
+        )
+        self.assertTrue(
+            is_blocked("https://www.google-analytics.com/collect", "script", ["analytics"], [])
+        )
+        self.assertTrue(is_blocked("https://site.test/logo", "image", ["image"], []))
+        self.assertFalse(is_blocked("https://site.test/app.js", "script", ["image"], ["*.mp4"]))
+
+
+class TestLaunchProfiles(unittest.TestCase):
+    def test_fast_ci_profile_tunes_chrome_and_reuses_disk_cache(self):
+        profile = get_launch_profile("fast-ci")
+        arguments = profile.chrome_launch_arguments("/cache/chrome/slot-0")
+
+        self.assertEqual(profile.page_load_strategy, "eager")
+        self.assertTrue(profile.reuse_disk_cache)
+        self.assertIn("--disable-gpu", arguments)
+        self.assertIn("--disk-cache-dir=/cache/chrome/slot-0", arguments)
+
+    def test_concurrent_browsers_get_their_own_cache_directory(self):
+        with (
+            tempfile.TemporaryDirectory() as cache_dir,
+            patch.object(config, "browser_cache_dir", cache_dir),
+        ):
+            first = claim_cache_directory("chrome")
+            second = claim_cache_directory("chrome")
+            release_cache_directory(first)
+            reused = claim_cache_directory("chrome")
+            release_cache_directory(second)
+            release_cache_directory(reused)
+
+        self.assertEqual(os.path.basename(first), "slot-0")
+        self.assertEqual(os.path.basename(second), "slot-1")
+        self.assertEqual(reused, first)
+
+    @unittest.skipIf(os.name == "nt", "flock is not available on Windows")
+    def test_cache_directory_locked_by_another_process_is_skipped(self):
+        import fcntl
+
+        with (
+            tempfile.TemporaryDirectory() as cache_dir,
+            patch.object(config, "browser_cache_dir", cache_dir),
+        ):
+            os.makedirs(os.path.join(cache_dir, "firefox"))
+            with open(
+                os.path.join(cache_dir, "firefox", "slot-0.lock"), "a+"
+            ) as other_process_lock:
+                fcntl.flock(other_process_lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                claimed = claim_cache_directory("firefox")
+            release_cache_directory(claimed)
+
+        self.assertEqual(os.path.basename(claimed), "slot-1")
+
+    def test_page_load_strategy_override_and_unknown_profile(self):
+        with patch.object(config, "page_load_strategy", "none"):
+            self.assertEqual(get_launch_profile("low-memory").page_load_strategy, "none")
+        with self.assertRaises(ValueError):
+            get_launch_profile("turbo")
+
+    def test_firefox_driver_receives_profile_preferences(self):
+        from selenium import webdriver
+
+        controller = make_controller("firefox")
+        controller.os_type = "Linux"
+        controller.launch_profile = get_launch_profile("low-memory")
+        paths = DriverPaths("", "/opt/geckodriver")
+        with (
+            patch("pyautotk.core.browser_controller.resolve_driver_paths", return_value=paths),
+            patch.object(webdriver, "Firefox") as firefox,
+            patch.object(webdriver, "FirefoxService"),
+        ):
+            controller._initialize_driver()
+
+        capabilities = firefox.call_args.kwargs["options"].to_capabilities()
+        self.assertEqual(capabilities["pageLoadStrategy"], "eager")
+        self.assertEqual(capabilities["moz:firefoxOptions"]["prefs"]["dom.ipc.processCount"], 1)
+
+
+class TestDriverServices(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.driver_path = os.path.join(self.directory.name, "chromedriver")
+        open(self.driver_path, "w").close()
+        patcher = patch.object(
+            config, "driver_cache_path", os.path.join(self.directory.name, "drivers.json")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_paths_are_resolved_once_and_cached_on_disk(self):
+        output = {"driver_path": self.driver_path, "browser_path": ""}
+        with patch("selenium.webdriver.common.selenium_manager.SeleniumManager") as manager:
+            manager.return_value.binary_paths.return_value = output
+            first = resolve_driver_paths("chrome")
+            second = resolve_driver_paths("chrome")
+
+        manager.return_value.binary_paths.assert_called_once()
+        self.assertEqual((first.driver_path, first.cached), (self.driver_path, False))
+        self.assertEqual((second.driver_path, second.cached), (self.driver_path, True))
+
+    def test_stale_cache_entry_is_resolved_again(self):
+        with open(config.driver_cache_path, "w") as cache_file:
+            json.dump(
+                {
+                    f"chrome|{platform.system()}": {
+                        "driver_path": "/missing/chromedriver",
+                        "browser_path": "",
+                    }
+                },
+                cache_file,
+            )
+
+        with patch("selenium.webdriver.common.selenium_manager.SeleniumManager") as manager:
+            manager.return_value.binary_paths.return_value = {
+                "driver_path": self.driver_path,
+                "browser_path": "",
+            }
+            self.assertEqual(resolve_driver_paths("chrome").driver_path, self.driver_path)
+
+    def test_shared_service_starts_once_and_survives_quit(self):
+        service = MagicMock(process=None)
+
+        def start():
+            service.process = MagicMock(**{"poll.return_value": None})
+
+        service.start.side_effect = start
+        shared = SharedDriverService(service)
+        shared.start()
+        shared.stop()
+        shared.start()
+
+        service.start.assert_called_once()
+        service.stop.assert_not_called()
+        shared.shutdown()
+        service.stop.assert_called_once()
+
+    def test_shared_service_is_opt_in(self):
+        with patch.dict(os.environ):
+            os.environ.pop("PYAUTOTK_SHARED_DRIVER_SERVICE", None)
+            self.assertFalse(type(config)().shared_driver_service)
+
+        paths = DriverPaths(browser_path="", driver_path=self.driver_path, cached=True)
+        with (
+            patch("pyautotk.core.driver_services.resolve_driver_paths", return_value=paths),
+            patch("pyautotk.core.driver_services.shared_driver_service") as shared,
+        ):
+            with patch.object(config, "shared_driver_service", False):
+                prewarm_driver_services("chrome")
+            shared.assert_not_called()
+
+            with patch.object(config, "shared_driver_service", True):
+                prewarm_driver_services("chrome")
+            shared.return_value.start.assert_called_once()
+
+
+class _SessionDriver(RemoteWebDriver):
+    """RemoteWebDriver attached to a fake session, recording the commands it sends."""
+
+    browser = None
+    browsing_context = None
+
+    def __init__(self, responses=None):
+        self.session_id = "session"
+        self.commands = []
+        self.responses = {Command.W3C_GET_CURRENT_WINDOW_HANDLE: "main", **(responses or {})}
+        self.command_executor = MagicMock(**{"execute.side_effect": self._respond})
+        self.error_handler = MagicMock()
+        self._switch_to = SwitchTo(self)
+        self.browser = MagicMock(**{"create_user_context.side_effect": ["ctx-1", "ctx-2"]})
+        self.browsing_context = MagicMock(**{"create.side_effect": ["tab-1", "tab-2"]})
+
+    def _respond(self, driver_command, params):
+        params = {name: value for name, value in params.items() if name != "sessionId"}
+        if driver_command != Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+            self.commands.append((driver_command, params or None))
+        value = self.responses.get(driver_command, ["main", "tab-1", "tab-2"])
+        return {"value": value() if callable(value) else value}
+
+
+class TestBrowserContexts(unittest.TestCase):
+    def make_host(self):
+        host = BrowserHost.__new__(BrowserHost)
+        host.logger = MagicMock()
+        host.driver = _SessionDriver()
+        host.focus = WindowFocus("main")
+        host.contexts = []
+        host.pending = 0
+        return host
+
+    def test_context_commands_select_the_context_window_first(self):
+        host = self.make_host()
+        _, first = host.open_context()
+        _, second = host.open_context()
+
+        first.execute(Command.GET_TITLE)
+        first.execute(Command.GET_TITLE)
+        second.execute(Command.GET_TITLE)
+
+        self.assertEqual(
+            host.driver.commands,
+            [
+                (Command.SWITCH_TO_WINDOW, {"handle": "tab-1"}),
+                (Command.GET_TITLE, None),
+                (Command.GET_TITLE, None),
+                (Command.SWITCH_TO_WINDOW, {"handle": "tab-2"}),
+                (Command.GET_TITLE, None),
+            ],
+        )
+        self.assertIsNot(first._switch_to, host.driver._switch_to)
+
+    def test_window_handles_and_quit_are_limited_to_the_context(self):
+        host = self.make_host()
+        host.context_windows = MagicMock(return_value=["tab-1"])
+        user_context, driver = host.open_context()
+        host.open_context()
+
+        self.assertEqual(driver.execute(Command.W3C_GET_WINDOW_HANDLES)["value"], ["tab-1"])
+        driver.quit()
+        host.driver.browser.remove_user_context.assert_called_once_with(user_context)
+        self.assertEqual(host.contexts, ["ctx-2"])
+
+    def test_new_browser_is_launched_when_hosts_are_full(self):
+        hosts = []
+
+        def launch(*args, **kwargs):
+            host = MagicMock(contexts=[], pending=0)
+            host.new_context.side_effect = (
+                lambda **kwargs: host.contexts.append("ctx") or MagicMock()
+            )
+            hosts.append(host)
+            return host
+
+        with (
+            patch("pyautotk.core.browser_contexts.BrowserHost", side_effect=launch),
+            patch("pyautotk.core.browser_contexts._hosts", {}),
+            patch.object(config, "contexts_per_browser", 2),
+        ):
+            for _ in range(3):
+                acquire_context("chrome", headless=True)
+
+        self.assertEqual(len(hosts), 2)
+        self.assertEqual([len(host.contexts) for host in hosts], [2, 1])
+        self.assertEqual([host.pending for host in hosts], [0, 0])
+        for host in hosts:
+            host.is_alive.assert_not_called()
+
+    def test_browser_is_launched_outside_the_lock_and_shared_by_waiting_callers(self):
+        started = threading.Event()
+        release = threading.Event()
+        launched = []
+
+        def launch(*args, **kwargs):
+            self.assertFalse(browser_contexts._lock.locked())
+            host = MagicMock(contexts=[], pending=0)
+            launched.append(host)
+            started.set()
+            release.wait(5)
+            return host
+
+        with (
+            patch("pyautotk.core.browser_contexts.BrowserHost", side_effect=launch),
+            patch("pyautotk.core.browser_contexts._hosts", {}) as registry,
+            patch.object(config, "contexts_per_browser", 2),
+        ):
+            threads = [
+                threading.Thread(target=acquire_context, args=("chrome", True)) for _ in range(2)
+            ]
+            threads[0].start()
+            self.assertTrue(started.wait(5))
+            threads[1].start()
+            # The registry stays usable while the browser starts.
+            with browser_contexts._lock:
+                self.assertEqual(registry, {("chrome", True, False): []})
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(len(launched), 1)
+        self.assertEqual(launched[0].new_context.call_count, 2)
+        self.assertEqual(launched[0].pending, 0)
+        self.assertEqual(browser_contexts._launches[("chrome", True, False)], [])
+
+    def test_failed_launch_clears_its_placeholder(self):
+        with (
+            patch(
+                "pyautotk.core.browser_contexts.BrowserHost",
+                side_effect=WebDriverException("no browser"),
+            ),
+            patch("pyautotk.core.browser_contexts._hosts", {}),
+        ):
+            with self.assertRaises(WebDriverException):
+                acquire_context("chrome", headless=True)
+
+        self.assertEqual(browser_contexts._launches[("chrome", True, False)], [])
+
+    def test_dead_browser_is_replaced_when_a_context_cannot_be_created(self):
+        dead = MagicMock(contexts=[], pending=0, **{"is_alive.return_value": False})
+        dead.new_context.side_effect = WebDriverException("session deleted")
+        alive = MagicMock(contexts=[], pending=0)
+        registry = {}
+
+        with (
+            patch("pyautotk.core.browser_contexts.BrowserHost", side_effect=[dead, alive]),
+            patch("pyautotk.core.browser_contexts._hosts", registry),
+        ):
+            self.assertIs(acquire_context("chrome", headless=True), alive.new_context.return_value)
+
+        self.assertEqual(list(registry.values()), [[alive]])
+
+
+class TestBrowserTabs(unittest.TestCase):
+    def make_session(self):
+        controller = make_controller()
+        handles = iter(["tab-1", "tab-2"])
+        controller.driver = _SessionDriver({Command.NEW_WINDOW: lambda: {"handle": next(handles)}})
+        return controller
+
+    def test_tabs_load_in_parallel_with_one_switch_each(self):
+        controller = self.make_session()
+        tabs = controller.open_tabs(["http://localhost/a", "http://localhost/b"])
+
+        commands = [
+            (command, (params or {}).get("handle"))
+            for command, params in controller.driver.commands
+        ]
+        self.assertEqual(
+            commands,
+            [
+                (Command.NEW_WINDOW, None),
+                (Command.NEW_WINDOW, None),
+                (Command.SWITCH_TO_WINDOW, "tab-1"),
+                (Command.W3C_EXECUTE_SCRIPT, None),
+                (Command.SWITCH_TO_WINDOW, "tab-2"),
+                (Command.W3C_EXECUTE_SCRIPT, None),
+            ],
+        )
+        self.assertEqual([tab.original_window for tab in tabs], ["tab-1", "tab-2"])
+
+    def test_commands_switch_only_when_another_window_has_focus(self):
+        controller = self.make_session()
+        tab = controller.open_tab()
+        tab.execute_script("return 1;")
+        tab.execute_script("return 2;")
+        controller.execute_script("return 3;")
+
+        switches = [
+            params["handle"]
+            for command, params in controller.driver.commands
+            if command == Command.SWITCH_TO_WINDOW
+        ]
+        self.assertEqual(switches, ["tab-1", "main"])
+
+    def test_closing_a_tab_keeps_the_controller_window(self):
+        controller = self.make_session()
+        tab = controller.open_tab()
+        tab.close_browser()
+        controller.execute_script("return true;")
+
+        self.assertEqual(
+            [command for command, _ in controller.driver.commands],
+            [
+                Command.NEW_WINDOW,
+                Command.SWITCH_TO_WINDOW,
+                Command.CLOSE,
+                Command.SWITCH_TO_WINDOW,
+                Command.W3C_EXECUTE_SCRIPT,
+            ],
+        )
+
+    def test_in_page_waits_of_a_tab_are_split_into_short_scripts(self):
+        controller = self.make_session()
+        tab = controller.open_tab()
+        element = MagicMock()
+
+        with (
+            patch.object(
+                tab.driver, "execute_async_script", side_effect=[None, None, element]
+            ) as script,
+            patch.object(tab.driver, "set_script_timeout"),
+        ):
+            self.assertIs(
+                tab.wait_for_element("//*[@id='a']", timeout=30, strategy="observer"), element
+            )
+        self.assertEqual([call.args[3] for call in script.call_args_list], [1000, 1000, 1000])
+
+        with patch.object(tab.driver, "execute_async_script", side_effect=[False, True]) as script:
+            tab.wait_for_dom_stable(stable_time=0.5, timeout=30)
+        self.assertEqual([call.args[3] for call in script.call_args_list], [1500, 1500])
+
+    def test_page_wait_after_start_loading_waits_for_the_navigation_to_commit(self):
+        controller = self.make_session()
+        tab = controller.open_tab()
+        scripts = iter([None, False, True])
+        controller.driver.responses[Command.W3C_EXECUTE_SCRIPT] = lambda: next(scripts)
+        controller.driver.responses[Command.W3C_EXECUTE_SCRIPT_ASYNC] = True
+
+        tab.start_loading("http://localhost/a")
+        tab.wait_for_page_load()
+        tab.wait_for_page_load()
+
+        scripts_sent = [
+            params["script"]
+            for command, params in controller.driver.commands
+            if command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC)
+        ]
+        self.assertEqual(
+            scripts_sent,
+            [
+                START_NAVIGATION_SCRIPT,
+                NAVIGATION_COMMITTED_SCRIPT,
+                NAVIGATION_COMMITTED_SCRIPT,
+                PAGE_SETTLE_SCRIPT,
+                PAGE_SETTLE_SCRIPT,
+            ],
+        )
+
+    def test_tab_is_initialized_like_a_controller_on_its_own_window(self):
+        controller = self.make_session()
+        controller.cache_elements = True
+        tab = controller.open_tab()
+
+        self.assertLessEqual(set(vars(controller)) - {"controller"}, set(vars(tab)))
+        self.assertTrue(tab.cache_elements)
+        self.assertEqual(tab.original_window, "tab-1")
+        self.assertIs(tab._window_focus, controller._window_focus)
+
+
+class TestSessionState(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "state", "login.json")
+        self.state = SessionState(
+            "https://app.test/home",
+            "https://app.test",
+            [
+                {
+                    "name": "sid",
+                    "value": "42",
+                    "domain": "app.test",
+                    "path": "/",
+                    "expiry": 2000000000,
+                }
+            ],
+            {"token": "abc"},
+            {"tab": "1"},
+        )
+
+    def test_saved_state_is_reloaded_until_it_expires(self):
+        self.state.save(self.path)
+
+        self.assertEqual(load_session_state(self.path, ttl=60), self.state)
+        self.state.created_at -= 120
+        self.state.save(self.path)
+        self.assertIsNone(load_session_state(self.path, ttl=60))
+        self.assertIsNone(load_session_state(os.path.join(self.directory.name, "missing.json")))
+
+    def test_chrome_restore_seeds_storage_into_the_first_page_only(self):
+        controller = make_controller()
+        controller.driver.execute_cdp_cmd.return_value = {"identifier": "7"}
+
+        controller.restore_session_state(self.state)
+        controller.open_url("https://app.test/home")
+        controller.open_url("https://app.test/other")
+
+        calls = controller.driver.execute_cdp_cmd.call_args_list
+        self.assertEqual(calls[0].args[1]["cookies"][0]["expires"], 2000000000)
+        self.assertIn('{"token": "abc"}', calls[1].args[1]["source"])
+        self.assertEqual(
+            calls[2].args, ("Page.removeScriptToEvaluateOnNewDocument", {"identifier": "7"})
+        )
+        self.assertEqual(len(calls), 3)
+
+    def test_browser_session_runs_setup_once_and_restores_afterwards(self):
+        setup = MagicMock()
+        sessions = []
+
+        def new_session(**kwargs):
+            session = MagicMock()
+            session.save_session_state.side_effect = lambda path: self.state.save(path)
+            sessions.append(session)
+            return session
+
+        with patch(
+            "pyautotk.elements.helpers.session_helpers.create_controller", side_effect=new_session
+        ):
+            scenario = browser_session(
+                "https://app.test/home", restore_from=self.path, setup=setup
+            )(lambda session: None)
+            scenario()
+            scenario()
+
+        setup.assert_called_once_with(sessions[0])
+        sessions[1].restore_session_state.assert_called_once_with(self.state)
+        self.assertEqual(sessions[1].method_calls[0][0], "restore_session_state")
+
+
+class TestElementCache(unittest.TestCase):
+    def setUp(self):
+        self.controller = make_controller()
+        self.controller.cache_elements = True
+        self.xpath = "//*[@id='submit-btn']"
+
+    def test_repeated_interactions_reuse_located_element(self):
+        with patch.object(self.controller, "_wait_for_condition", return_value=MagicMock()) as wait:
+            self.controller.click_element(self.xpath)
+            self.controller.scroll_to_element(self.xpath)
+            self.controller.get_element_attribute(self.xpath, "value")
+            self.controller.get_element_attribute(self.xpath, "name")
+
+        self.assertEqual([args.args[1] for args in wait.call_args_list], ["clickable", "visible"])
+        self.assertEqual(self.controller.driver.execute_script.call_count, 2)
+
+    def test_stale_cached_element_is_located_again(self):
+        stale, fresh = MagicMock(), MagicMock()
+        stale.get_attribute.side_effect = StaleElementReferenceException("stale")
+        fresh.get_attribute.return_value = "ok"
+        self.controller._element_cache[(self.xpath, "visible")] = stale
+
+        with patch.object(self.controller, "_wait_for_condition", return_value=fresh):
+            self.assertEqual(self.controller.get_element_attribute(self.xpath, "value"), "ok")
+        self.assertIs(self.controller._element_cache[(self.xpath, "visible")], fresh)
+
+    def test_element_cached_for_one_condition_is_not_reused_for_another(self):
+        present, clickable = MagicMock(), MagicMock()
+        with patch.object(
+            self.controller, "_wait_for_condition", side_effect=[present, clickable]
+        ) as wait:
+            self.assertIs(self.controller._locate(self.xpath, "present", 10), present)
+            self.assertIs(self.controller._locate(self.xpath, "clickable", 10), clickable)
+            self.assertIs(self.controller._locate(self.xpath, "present", 10), present)
+
+        self.assertEqual([args.args[1] for args in wait.call_args_list], ["present", "clickable"])
+        self.controller.invalidate_element_cache(self.xpath)
+        self.assertEqual(self.controller._element_cache, {})
+
+    def test_navigation_and_tab_switches_invalidate_cache(self):
+        self.controller._element_cache[(self.xpath, "present")] = MagicMock()
+        self.controller.open_url("http://localhost")
+        self.assertEqual(self.controller._element_cache, {})
+
+        self.controller._element_cache[(self.xpath, "present")] = MagicMock()
+        self.controller.switch_to_original_tab()
+        self.assertEqual(self.controller._element_cache, {})
+
+
+class TestLocatorHealing(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "locator_index.json")
+        self.index = LocatorIndex(self.path)
+        self.controller = make_controller()
+        self.controller.driver.current_url = "https://app.test/form?step=2"
+        self.xpath = "//form/div[3]/button"
+        self.fingerprint = {
+            "tag": "button",
+            "id": "",
+            "css": "#form > button:nth-of-type(1)",
+            "text": 'Don\'t "save"',
+            "aria_label": "Save",
+        }
+        for patcher in (
+            patch.object(config, "locator_healing", True),
+            patch("pyautotk.core.browser_controller.locator_index", self.index),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_alternatives_are_built_from_the_fingerprint(self):
+        self.assertEqual(
+            alternative_locators(self.fingerprint),
+            [
+                ("aria-label", "//*[@aria-label='Save']"),
+                ("text", "//button[normalize-space(.)=concat('Don', \"'\", 't \"save\"')]"),
+                ("css", "css=#form > button:nth-of-type(1)"),
+            ],
+        )
+
+    def test_first_lookup_records_alternatives_that_are_persisted(self):
+        element = MagicMock()
+        self.controller.driver.execute_script.return_value = self.fingerprint
+
+        with patch.object(self.controller, "_wait_for_condition", return_value=element):
+            self.assertIs(self.controller.wait_for_element(self.xpath), element)
+        self.controller.driver.execute_script.assert_called_once_with(FINGERPRINT_SCRIPT, element)
+        self.index.save()
+
+        alternatives = LocatorIndex(self.path).alternatives("https://app.test/form", self.xpath)
+        self.assertEqual(
+            [alternative.kind for alternative in alternatives], ["aria-label", "text", "css"]
+        )
+
+    def test_broken_locator_heals_with_best_alternative_before_full_timeout(self):
+        self.index.record("https://app.test/form", self.xpath, self.fingerprint)
+        self.index.report(
+            "https://app.test/form",
+            self.xpath,
+            self.index.alternatives("https://app.test/form", self.xpath)[2],
+            hit=True,
+        )
+        element = MagicMock()
+
+        def wait(locator, condition, timeout, strategy=None):
+            if locator != "css=#form > button:nth-of-type(1)":
+                raise TimeoutException("missing")
+            return element
+
+        with patch.object(self.controller, "_wait_for_condition", side_effect=wait) as waits:
+            self.assertIs(self.controller.wait_for_element(self.xpath, timeout=10), element)
+
+        self.assertEqual(
+            [call.args[0] for call in waits.call_args_list],
+            [self.xpath, "css=#form > button:nth-of-type(1)"],
+        )
+        self.assertTrue(
+            all(call.args[2] <= config.locator_probe_timeout for call in waits.call_args_list)
+        )
+        self.assertEqual(self.index.alternatives("https://app.test/form", self.xpath)[0].hits, 2)
+        self.controller.logger.warning.assert_called_once()
+
+    def test_reports_of_concurrent_processes_are_merged(self):
+        self.index.record("https://app.test/form", self.xpath, self.fingerprint)
+        self.index.save()
+        first, second = LocatorIndex(self.path), LocatorIndex(self.path)
+        for index, hit in ((first, True), (second, False)):
+            css = [
+                alternative
+                for alternative in index.alternatives("https://app.test/form", self.xpath)
+                if alternative.kind == "css"
+            ][0]
+            index.report("https://app.test/form", self.xpath, css, hit)
+        first.save()
+        second.save()
+
+        css = [
+            alternative
+            for alternative in LocatorIndex(self.path).alternatives(
+                "https://app.test/form", self.xpath
+            )
+            if alternative.kind == "css"
+        ][0]
+        self.assertEqual((css.hits, css.tries), (1, 2))
+
+    def test_report_in_a_fresh_process_loads_the_index(self):
+        self.index.record("https://app.test/form", self.xpath, self.fingerprint)
+        alternative = self.index.alternatives("https://app.test/form", self.xpath)[0]
+        self.index.save()
+
+        fresh = LocatorIndex(self.path)
+        fresh.report("https://app.test/form", self.xpath, alternative, hit=True)
+        fresh.save()
+
+        self.assertEqual(
+            LocatorIndex(self.path).alternatives("https://app.test/form", self.xpath)[0].hits, 1
+        )
+
+
+class TestAdaptiveTimeouts(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "wait_history.json")
+        self.history = WaitHistory(self.path)
+        self.controller = make_controller()
+        self.controller.driver.current_url = "https://app.test/list?page=3"
+        self.xpath = "//*[@id='results']"
+        for patcher in (
+            patch.object(config, "adaptive_timeouts", True),
+            patch("pyautotk.core.browser_controller.wait_history", self.history),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_timeout_follows_percentile_of_persisted_history(self):
+        self.assertEqual(self.history.timeout_for("https://app.test/list", self.xpath, 10), 10)
+        for duration in (0.2, 0.3, 0.25, 0.4, 2.0):
+            self.history.record("https://app.test/list", self.xpath, duration)
+        self.history.save()
+
+        reloaded = WaitHistory(self.path)
+        self.assertAlmostEqual(
+            reloaded.timeout_for("https://app.test/list#top", self.xpath, 10),
+            2.0 + config.adaptive_timeout_margin,
+        )
+        with patch.object(config, "adaptive_timeout_percentile", 50):
+            self.assertAlmostEqual(
+                reloaded.timeout_for("https://app.test/list", self.xpath, 10),
+                0.3 + config.adaptive_timeout_margin,
+            )
+
+    def test_concurrent_saves_merge_their_samples(self):
+        first, second = WaitHistory(self.path), WaitHistory(self.path)
+        first.timeout_for("https://app.test/list", self.xpath, 10)
+        second.timeout_for("https://app.test/list", self.xpath, 10)
+        for history, duration in ((first, 0.5), (second, 0.7)):
+            history.record("https://app.test/list", self.xpath, duration)
+        first.save()
+        second.save()
+
+        with open(self.path, encoding="utf-8") as history_file:
+            self.assertEqual(
+                json.load(history_file), {"https://app.test/list": {self.xpath: [0.5, 0.7]}}
+            )
+        self.assertFalse(os.path.exists(self.path + ".lock"))
+
+    def test_malformed_history_file_starts_an_empty_history(self):
+        for content in ("[1, 2]", '{"https://app.test/list": {"//a": "slow"}}'):
+            with open(self.path, "w", encoding="utf-8") as history_file:
+                history_file.write(content)
+            history = WaitHistory(self.path)
+
+            self.assertEqual(history.timeout_for("https://app.test/list", "//a", 10), 10)
+            history.record("https://app.test/list", "//a", 0.5)
+
+    def test_missing_element_fails_fast_and_backs_off(self):
+        for _ in range(MIN_SAMPLES):
+            self.history.record("https://app.test/list", self.xpath, 0.5)
+        fast = 0.5 + config.adaptive_timeout_margin
+
+        with patch.object(
+            self.controller, "_wait_for_condition", side_effect=TimeoutException("missing")
+        ) as wait:
+            with self.assertRaises(TimeoutException):
+                self.controller.wait_for_element(self.xpath)
+
+        self.assertAlmostEqual(wait.call_args.args[2], fast)
+        self.assertAlmostEqual(
+            self.history.timeout_for("https://app.test/list", self.xpath, 10),
+            fast * TIMEOUT_BACKOFF + config.adaptive_timeout_margin,
+        )
+
+    def test_explicit_timeout_is_never_shortened(self):
+        for _ in range(MIN_SAMPLES):
+            self.history.record("https://app.test/list", self.xpath, 0.5)
+
+        with patch.object(self.controller, "_wait_for_condition", return_value=MagicMock()) as wait:
+            self.controller.wait_for_element(self.xpath, timeout=30)
+            self.controller.wait_for_element(self.xpath, timeout=1)
+
+        self.assertEqual(wait.call_args_list[0].args[2], 30)
+        self.assertAlmostEqual(wait.call_args_list[1].args[2], 0.5 + config.adaptive_timeout_margin)
+
+    def test_slow_elements_get_more_than_the_default_up_to_the_cap(self):
+        for _ in range(MIN_SAMPLES):
+            self.history.record("https://app.test/list", self.xpath, 14.0)
+
+        with patch.object(self.controller, "_wait_for_condition", return_value=MagicMock()) as wait:
+            self.controller.wait_for_element(self.xpath, timeout=10)
+            with patch.object(config, "adaptive_timeout_max", 12):
+                self.controller.wait_for_element(self.xpath, timeout=10)
+
+        self.assertEqual(
+            [call.args[2] for call in wait.call_args_list],
+            [14.0 + config.adaptive_timeout_margin, 12],
+        )
+
+
+class TestExtractTable(unittest.TestCase):
+    def setUp(self):
+        self.controller = make_controller()
+        self.xpath = "//tr"
+
+    def test_extract_table_uses_single_script_call(self):
+        columns = {"text": ["a", "b"], "data-id": ["1", "2"]}
+        self.controller.driver.execute_script.return_value = columns
+        with patch.object(self.controller, "_wait_for_condition") as wait:
+            result = self.controller.extract_table(self.xpath, ["data-id"], rect=True)
+
+        self.assertEqual(result, columns)
+        wait.assert_called_once_with(self.xpath, "present", 10)
+        self.controller.driver.execute_script.assert_called_once_with(
+            EXTRACT_TABLE_SCRIPT,
+            self.xpath,
+            ["data-id"],
+            {"text": True, "rect": True, "displayed": False},
+        )
+
+    def test_extract_table_rejects_reserved_attribute_names(self):
+        with self.assertRaises(ValueError):
+            self.controller.extract_table(self.xpath, ["width"])
+
+    def test_extract_all_elements_with_attribute_maps_values_to_elements(self):
+        first, second = MagicMock(), MagicMock()
+        self.controller.driver.execute_script.return_value = {"data-id": ["1", "2"]}
+        with patch.object(self.controller, "wait_for_all_elements", return_value=[first, second]):
+            result = Widget.extract_all_elements_with_attribute(self.controller, "data-id")
+
+        self.assertEqual(result, {"1": first, "2": second})
+        first.get_attribute.assert_not_called()
+
+
+class TestPointerActions(unittest.TestCase):
+    @staticmethod
+    def sent_actions(driver):
+        command, payload = driver.execute.call_args[0]
+        return command, {
+            source["type"]: [action["type"] for action in source["actions"]]
+            for source in payload["actions"]
+        }
+
+    def test_gesture_is_sent_as_one_request_with_aligned_ticks(self):
+        driver = MagicMock()
+        element = WebElement(driver, "element-id")
+
+        MouseController(driver).press(element).move_by(40, 0).release().scroll(0, 200).perform()
+
+        driver.execute.assert_called_once()
+        command, actions = self.sent_actions(driver)
+        self.assertEqual(command, "actions")
+        self.assertEqual(
+            actions["pointer"], ["pointerMove", "pointerDown", "pointerMove", "pointerUp", "pause"]
+        )
+        self.assertEqual(actions["wheel"], ["pause"] * 4 + ["scroll"])
+        moves = [
+            action
+            for action in driver.execute.call_args[0][1]["actions"][0]["actions"]
+            if action["type"] == "pointerMove"
+        ]
+        self.assertTrue(all(move["duration"] == 0 for move in moves))
+
+    def test_double_click_element_sends_native_double_click(self):
+        controller = make_controller()
+        with patch.object(
+            controller,
+            "_wait_for_condition",
+            return_value=WebElement(controller.driver, "element-id"),
+        ):
+            controller.double_click_element("//*[@id='row']")
+
+        controller.driver.execute.assert_called_once()
+        _, actions = self.sent_actions(controller.driver)
+        self.assertEqual(actions["pointer"], ["pointerMove"] + ["pointerDown", "pointerUp"] * 2)
+
+    def test_widget_double_click_delegates_without_sleeping(self):
+        controller = MagicMock()
+        with patch("time.sleep") as sleep, self.assertWarns(DeprecationWarning):
+            Widget(controller, id="row").double_click(delay=1)
+
+        controller.double_click_element.assert_called_once_with("//*[@id='row']", 10)
+        sleep.assert_not_called()
+
+    def test_widget_double_click_without_delay_does_not_warn(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            Widget(MagicMock(), id="row").double_click()
+
+
+class TestKeyboardSequences(unittest.TestCase):
+    @staticmethod
+    def sent_keys(driver):
+        (source,) = driver.execute.call_args[0][1]["actions"]
+        return [(action["type"], action.get("value")) for action in source["actions"]]
+
+    def test_script_is_sent_as_one_request(self):
+        driver = MagicMock()
+        KeyboardController(driver).sequence("ctrl+shift+k down*50 'ok'").perform()
+
+        driver.execute.assert_called_once()
+        keys = self.sent_keys(driver)
+        self.assertEqual(
+            keys[:6],
+            [
+                ("keyDown", "\ue009"),
+                ("keyDown", "\ue008"),
+                ("keyDown", "k"),
+                ("keyUp", "k"),
+                ("keyUp", "\ue008"),
+                ("keyUp", "\ue009"),
+            ],
+        )
+        self.assertEqual(keys[6:106], [("keyDown", "\ue015"), ("keyUp", "\ue015")] * 50)
+        self.assertEqual(
+            keys[106:], [("keyDown", "o"), ("keyUp", "o"), ("keyDown", "k"), ("keyUp", "k")]
+        )
+
+    def test_held_modifier_stays_down_until_released(self):
+        driver = MagicMock()
+        keyboard = KeyboardController(driver)
+        keyboard.press_shift()
+        self.assertEqual(self.sent_keys(driver), [("keyDown", "\ue008")])
+
+        keyboard.send_keys("a")
+        keyboard.release_all()
+        self.assertEqual(self.sent_keys(driver), [("keyUp", "\ue008")])
+        self.assertEqual(driver.execute.call_count, 3)
+
+    def test_unknown_key_name_is_rejected(self):
+        with self.assertRaises(ValueError):
+            KeyboardController(MagicMock()).sequence("ctrl+banana")
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.controller = make_controller()
+        self.xpath = "//*[@id='submit-btn']"
+        profiler.attach(self.controller.driver)
+        profiler.reset()
+        patcher = patch.object(profiler, "enabled", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(profiler.reset)
+
+    def locate(self, xpath, condition, timeout):
+        self.controller.driver.execute("findElement", {"value": xpath})
+        return MagicMock()
+
+    def test_operations_are_aggregated_per_operation_and_xpath(self):
+        with patch.object(self.controller, "_wait_with_polling", side_effect=self.locate):
+            self.controller.click_element(self.xpath)
+            self.controller.click_element(self.xpath)
+
+        stats = profiler.by_operation["BrowserController.click_element"]
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.round_trips, 2)
+        self.assertGreater(stats.wait_time, 0)
+        self.assertIn("BrowserController.run_on_element", profiler.by_operation)
+        self.assertEqual(profiler.by_xpath[self.xpath].count, 4)
+
+    def test_hooks_receive_records_including_errors(self):
+        records = []
+        profiler.add_hook(records.append)
+        self.addCleanup(profiler.remove_hook, records.append)
+        with patch.object(
+            self.controller, "_wait_with_polling", side_effect=TimeoutException("timeout")
+        ):
+            with self.assertRaises(TimeoutException):
+                Widget(self.controller, id="submit-btn").click(timeout=1)
+
+        self.assertEqual([record.operation for record in records][-1], "Widget.click")
+        self.assertTrue(all(record.error for record in records))
+        self.assertEqual(profiler.to_dict()["operations"]["Widget.click"]["errors"], 1)
+
+
+class TestLoggingPipeline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "log.jsonl")
+
+    def read_lines(self):
+        with open(self.path, encoding="utf-8") as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_json_lines_handler_writes_in_batches(self):
+        handler = JsonLinesHandler(self.path, batch_size=2, flush_interval=60)
+        self.addCleanup(handler.close)
+        logger = logging.getLogger("TestJsonLinesBatches")
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        logger.warning("first %s", 1)
+        self.assertEqual(self.read_lines(), [])
+        logger.warning("second %s", 2)
+        self.assertEqual([entry["message"] for entry in self.read_lines()], ["first 1", "second 2"])
+        logger.error("failure")
+        self.assertEqual(self.read_lines()[-1]["level"], "ERROR")
+
+    def test_queue_mode_writes_from_listener(self):
+        logging.getLogger("TestQueueMode").propagate = False
+        with (
+            patch.multiple(config, log_queue=True, log_json_path=self.path),
+            patch("pyautotk.core.logger_utils._json_handler", None),
+        ):
+            logger = initialize_logger("TestQueueMode")
+        self.addCleanup(logger.handlers.clear)
+        self.assertIsInstance(logger.handlers[0], QueueHandler)
+
+        logger.info("queued %s", "record")
+        shutdown_logging()
+        self.assertEqual(self.read_lines()[-1]["message"], "queued record")
+
+    def test_queue_mode_snapshots_mutable_arguments(self):
+        logging.getLogger("TestQueueSnapshot").propagate = False
+        with (
+            patch.multiple(config, log_queue=True, log_json_path=self.path),
+            patch("pyautotk.core.logger_utils._json_handler", None),
+        ):
+            logger = initialize_logger("TestQueueSnapshot")
+        self.addCleanup(logger.handlers.clear)
+
+        items = ["a"]
+        logger.info("items %s", items)
+        items.append("b")
+        shutdown_logging()
+        self.assertEqual(self.read_lines()[-1]["message"], "items ['a']")
+
+    def test_json_lines_handler_flushes_a_quiet_logger(self):
+        handler = JsonLinesHandler(self.path, batch_size=100, flush_interval=0.05)
+        self.addCleanup(handler.close)
+        logger = logging.getLogger("TestJsonLinesQuiet")
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        logger.warning("last words")
+        deadline = time.monotonic() + 2
+        while not self.read_lines() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([entry["message"] for entry in self.read_lines()], ["last words"])
+
+
+class TestActionBatch(unittest.TestCase):
+    def setUp(self):
+        self.controller = make_controller()
+
+    def test_dom_operations_are_flushed_in_one_script_call(self):
+        self.controller.driver.execute_script.return_value = [{"status": "ok", "error": None}] * 3
+        with self.controller.batch() as batch:
+            Widget(self.controller, id="text-input").enter_text("Texto de teste")
+            Widget(self.controller, id="color-input").set_value("#EEFF00")
+            Widget(self.controller, id="dropdown").select_by_index(2)
+            self.controller.driver.execute_script.assert_not_called()
+
+        self.controller.driver.execute_script.assert_called_once()
+        script, operations, _ = self.controller.driver.execute_script.call_args[0]
+        self.assertEqual(script, BATCH_SCRIPT)
+        self.assertEqual(
+            [operation["action"] for operation in operations], ["enter_text", "set_value", "select"]
+        )
+        self.assertTrue(all(result.ok for result in batch.results))
+
+    def test_non_batched_operation_flushes_queue_first(self):
+        self.controller.driver.execute_script.return_value = [{"status": "ok", "error": None}]
+        with patch.object(self.controller, "_wait_with_polling", return_value=MagicMock()):
+            with self.controller.batch() as batch:
+                Widget(self.controller, id="submit-btn").click()
+                Widget(self.controller, id="form-data").get_attribute("value")
+                self.assertEqual(len(batch.results), 1)
+
+    def test_failed_operations_are_reported(self):
+        self.controller.driver.execute_script.return_value = [
+            {"status": "error", "error": "No element matches XPath"},
+            {"status": "skipped", "error": None},
+        ]
+        with self.assertRaises(BatchActionException) as context:
+            with self.controller.batch():
+                self.controller.click_element("//*[@id='missing']")
+                self.controller.click_element("//*[@id='next']")
+
+        self.assertEqual(len(context.exception.failures), 1)
+
+
+class TestAsyncWidget(unittest.TestCase):
+    def setUp(self):
+        self.controller = MagicMock()
+        self.element = MagicMock()
+        self.controller.driver.find_elements.return_value = [self.element]
+
+    def test_click_waits_then_delegates_to_controller(self):
+        async def scenario():
+            session = AsyncBrowserController(self.controller)
+            await AsyncWidget(session, id="submit-btn").click()
+
+        asyncio.run(scenario())
+        self.controller.click_element.assert_called_once_with("//*[@id='submit-btn']", 10)
+
+    def test_wait_raises_timeout_when_element_missing(self):
+        self.controller.driver.find_elements.return_value = []
+
+        async def scenario():
+            session = AsyncBrowserController(self.controller, poll_frequency=0.01)
+            await session.find_element("//*[@id='missing']", timeout=0.05)
+
+        with self.assertRaises(TimeoutException):
+            asyncio.run(scenario())
+
+    def test_sessions_run_concurrently_on_one_loop(self):
+        controllers = [MagicMock() for _ in range(3)]
+        for controller in controllers:
+            controller.driver.find_elements.return_value = [MagicMock()]
+            controller.get_element_attribute.return_value = "value"
+
+        async def scenario():
+            sessions = [AsyncBrowserController(controller) for controller in controllers]
+            return await asyncio.gather(
+                *(AsyncWidget(session, id="a").get_attribute("value") for session in sessions)
+            )
+
+        self.assertEqual(asyncio.run(scenario()), ["value"] * 3)
+
+    def test_action_reuses_element_found_by_async_wait(self):
+        controller = make_controller()
+        element = MagicMock()
+        element.get_attribute.return_value = "value"
+        controller.driver.find_elements.return_value = [element]
+
+        async def scenario():
+            session = AsyncBrowserController(controller)
+            return await session.get_element_attribute("//*[@id='a']", "value")
+
+        with patch.object(controller, "_wait_for_condition") as wait:
+            self.assertEqual(asyncio.run(scenario()), "value")
+        wait.assert_not_called()
+        controller.driver.find_elements.assert_called_once()
+        self.assertEqual(controller._prelocated, {})
+
+    def test_session_created_outside_a_loop_runs_on_later_loops(self):
+        session = AsyncBrowserController(self.controller)
+        self.controller.get_title.return_value = "title"
+
+        for _ in range(2):
+            self.assertEqual(asyncio.run(session.run(self.controller.get_title)), "title")
+
+    def test_extract_table_waits_for_the_elements_once(self):
+        self.controller.extract_table.return_value = {"text": ["a"]}
+
+        async def scenario():
+            session = AsyncBrowserController(self.controller)
+            return await session.extract_table("//*[@class='row']", timeout=5)
+
+        self.assertEqual(asyncio.run(scenario()), {"text": ["a"]})
+        self.controller.extract_table.assert_called_once_with(
+            "//*[@class='row']", None, True, False, False, 0
+        )
+
+    def test_elements_with_attribute_are_awaited_on_the_event_loop(self):
+        self.controller.extract_table.return_value = {"data-id": ["1"]}
+
+        async def scenario():
+            session = AsyncBrowserController(self.controller)
+            return await AsyncWidget.extract_all_elements_with_attribute(session, "data-id")
+
+        self.assertEqual(asyncio.run(scenario()), {"1": self.element})
+        self.controller.wait_for_all_elements.assert_not_called()
+        self.controller.extract_table.assert_called_once_with(
+            "//*[@data-id]", ["data-id"], False, False, False, 0
+        )
+
+
+class TestControllerFactory(unittest.TestCase):
+    def test_selenium_engine_builds_browser_controller(self):
+        with patch("pyautotk.core.browser_controller.BrowserController") as controller_cls:
+            create_controller("chrome", headless=True, engine="selenium")
+        controller_cls.assert_called_once_with(
+            browser_type="chrome",
+            maximize=False,
+            headless=True,
+            kill_browser=True,
+            block_resources=None,
+            block_urls=None,
+        )
+
+    def test_playwright_engine_builds_playwright_controller(self):
+        with patch(
+            "pyautotk.core.playwright_controller.PlaywrightBrowserController"
+        ) as controller_cls:
+            create_controller("firefox", engine="playwright")
+        controller_cls.assert_called_once_with(
+            browser_type="firefox",
+            maximize=False,
+            headless=False,
+            kill_browser=True,
+            block_resources=None,
+            block_urls=None,
+        )
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ValueError):
+            create_controller("chrome", engine="puppeteer")
+
+
+class TestPlaywrightEngine(unittest.TestCase):
+    def make_controller(self):
+        from pyautotk.core.playwright_controller import PlaywrightBrowserController
+
+        controller = PlaywrightBrowserController.__new__(PlaywrightBrowserController)
+        controller.logger = MagicMock()
+        controller.page = MagicMock()
+        controller.page.evaluate.return_value = [0, 100]
+        return controller
+
+    def make_locator(self, text):
+        locator = MagicMock()
+        locator.evaluate.side_effect = lambda script, *args: (
+            {"id": "total"}.get(args[0]) if args else "span"
+        )
+        locator.inner_text.return_value = f" {text} "
+        locator.is_visible.return_value = True
+        locator.is_enabled.return_value = True
+        locator.bounding_box.return_value = {"x": 10.4, "y": 20.6, "width": 50, "height": 18}
+        return locator
+
+    def test_properties_are_read_from_the_playwright_locator(self):
+        controller = self.make_controller()
+        widget = Widget(controller, id="total")
+
+        with patch.object(controller, "_locate", return_value=self.make_locator("42")) as locate:
+            properties = widget.properties()
+
+        locate.assert_called_once_with(widget.locator, "visible", 10)
+        self.assertEqual(
+            properties,
+            {
+                "text": "42",
+                "tag_name": "span",
+                "attributes": {"id": "total"},
+                "location": {"x": 10, "y": 121},
+                "size": {"height": 18, "width": 50},
+                "displayed": True,
+                "enabled": True,
+            },
+        )
+
+    def test_all_properties_are_read_from_every_playwright_locator(self):
+        controller = self.make_controller()
+        controller._locator = MagicMock()
+        controller._locator.return_value.all.return_value = [
+            self.make_locator("a"),
+            self.make_locator("b"),
+        ]
+
+        with patch.object(controller, "_locate"):
+            properties = Widget(controller, class_name="row").all_properties()
+
+        self.assertEqual([element["text"] for element in properties], ["a", "b"])
+
+    def test_scripts_are_evaluated_without_new_function(self):
+        controller = self.make_controller()
+        controller.execute_script("return arguments[0];", 1)
+
+        expression, args = controller.page.evaluate.call_args.args
+        self.assertNotIn("new Function", expression)
+        self.assertIn("return arguments[0];", expression)
+        self.assertEqual(args, [1])
+
+    def test_interrupted_page_wait_backs_off_until_the_deadline(self):
+        from playwright.sync_api import Error as PlaywrightError
+
+        controller = self.make_controller()
+        controller._active_batch = None
+        controller.page.evaluate.side_effect = PlaywrightError("Execution context was destroyed")
+
+        with (
+            patch("pyautotk.core.playwright_controller.time.sleep") as sleep,
+            patch(
+                "pyautotk.core.playwright_controller.time.monotonic",
+                side_effect=[0, 0, 0.1, 0.2, 0.3, 0.4, 1.5],
+            ),
+        ):
+            with self.assertRaises(BrowserWaitForPageLoadException):
+                controller.wait_for_page_load(timeout=1)
+
+        self.assertNotIn("new Function", controller.page.evaluate.call_args.args[0])
+        self.assertEqual([delay.args[0] for delay in sleep.call_args_list], [0.05, 0.1])
+
+    def test_keyboard_and_mouse_reject_playwright_sessions(self):
+        controller = self.make_controller()
+
+        with self.assertRaises(UnsupportedEngineException):
+            Keyboard(controller)
+        with self.assertRaises(UnsupportedEngineException):
+            Mouse(controller)
+
+
+class TestMockWebDriverBenchmark(unittest.TestCase):
+    def test_scenarios_run_against_mock_server(self):
+        results = run_benchmarks(["forms", "forms_batched"], iterations=1)
+
+        self.assertEqual([result.scenario for result in results], ["forms", "forms_batched"])
+        self.assertLess(results[1].round_trips, results[0].round_trips)
+        self.assertTrue(all(result.wall_time > 0 for result in results))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_widget_and_session_imports_do_not_load_selenium(self):
+        for module in (
+            "pyautotk",
+            "pyautotk.elements.widget",
+            "pyautotk.elements.helpers.session_helpers",
+        ):
+            self.assertFalse(measure_import_time(module, runs=1).loads_selenium, module)